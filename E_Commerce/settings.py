@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "drf_yasg",
     "rest_framework_simplejwt",
@@ -50,6 +51,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -100,6 +102,109 @@ DATABASES = {
 }
 
 
+# Cache
+# The "catalog" cache holds pre-rendered catalog responses (category tree,
+# dropdown, ...). Local memory by default; point CATALOG_CACHE_BACKEND at a
+# shared backend (Redis, Memcached) in production, so every worker sees the
+# same entries and the same version keys: with local memory an edit only
+# purges the worker that handled it.
+# Every cached response adds an entry, and a full LocMemCache culls entries
+# at random, version keys included (each culled version purges everything
+# stored under it). Its default cap of 300 is far too low for the response
+# cache, hence CATALOG_CACHE_MAX_ENTRIES.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "catalog": {
+        "BACKEND": os.environ.get(
+            "CATALOG_CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.environ.get("CATALOG_CACHE_LOCATION", "catalog"),
+        "TIMEOUT": 60 * 60 * 24,
+    },
+}
+# Redis and Memcached hand OPTIONS to their client, which rejects MAX_ENTRIES.
+if CACHES["catalog"]["BACKEND"].endswith(".LocMemCache"):
+    CACHES["catalog"]["OPTIONS"] = {
+        "MAX_ENTRIES": int(os.environ.get("CATALOG_CACHE_MAX_ENTRIES", 100_000)),
+    }
+
+CATALOG_CACHE_ALIAS = "catalog"
+
+# Anonymous GETs of the catalog endpoints are served from the catalog cache
+# (Product.response_cache) for up to this many seconds; edits purge them
+# earlier. 0 turns the response cache off.
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get("RESPONSE_CACHE_TIMEOUT", 60 * 5))
+
+# Category breadcrumb paths kept per worker process (Product.breadcrumbs),
+# dropped whenever a category changes.
+BREADCRUMB_CACHE_SIZE = int(os.environ.get("BREADCRUMB_CACHE_SIZE", 4096))
+
+
+# Request metrics
+# RequestMetricsMiddleware logs one JSON line per request to the
+# "core.instrumentation" logger: INFO for every request, WARNING when a URL
+# name runs more queries than its budget below ("default" applies to the
+# others). SERVER_TIMING adds the numbers as a Server-Timing header, off by
+# default and then only for staff users and METRICS_ALLOWED_IPS.
+# The same numbers feed the Prometheus metrics at /metrics (core.metrics);
+# with several worker processes set PROMETHEUS_MULTIPROC_DIR.
+# /metrics answers clients in METRICS_ALLOWED_IPS (comma separated) or
+# sending "Authorization: Bearer <METRICS_TOKEN>", others get a 403. With
+# neither set it is a 404.
+
+# Budgets are for an uncached, authenticated request: the user lookup and
+# the conditional GET aggregate (core.conditional) are included.
+QUERY_BUDGETS = {
+    "attribute-list": 3,
+    "attribute-detail": 3,
+    "attribute-with-values": 4,
+    "attribute-value-list": 3,
+    "attribute-value-detail": 3,
+    "category-tree": 2,
+    "category-dropdown": 2,
+    "category-detail": 3,
+    "category-breadcrumbs": 2,
+    "category-products": 5,
+    "product-list": 5,
+    "product-detail": 5,
+    "product-facets": 8,
+    "product-search": 5,
+    "product-type-list": 3,
+    "product-type-detail": 3,
+    "products-by-tag": 6,
+    "tag-list": 3,
+    "tag-detail": 3,
+}
+
+SERVER_TIMING = os.environ.get("DJANGO_SERVER_TIMING", "False") == "True"
+
+METRICS_ALLOWED_IPS = [
+    ip.strip()
+    for ip in os.environ.get("METRICS_ALLOWED_IPS", "").split(",")
+    if ip.strip()
+]
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "core.instrumentation": {
+            "handlers": ["console"],
+            "level": os.environ.get("REQUEST_METRICS_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -149,16 +254,19 @@ MEDIA_ROOT = BASE_DIR / "media"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
+# ORJSONRenderer (core.renderers) renders the same JSON as DRF's
+# JSONRenderer, faster; put "rest_framework.renderers.JSONRenderer" here to
+# go back. The browsable API is only offered while debugging.
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
-    ],
+        "core.renderers.ORJSONRenderer",
+    ]
+    + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.InstrumentedJWTAuthentication",
     ),
 }
 
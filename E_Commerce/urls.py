@@ -4,6 +4,7 @@ from django.urls import path, include, re_path
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from core.metrics import metrics_view
 
 
 schema_view = get_schema_view(
@@ -24,6 +25,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("users/", include("Users.urls")),
     path("products/", include("Product.urls")),
+    path("metrics", metrics_view, name="metrics"),
 
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Subquery
+
+from Product.cache import CATEGORY_VERSION, get_catalog_version
+from Product.models import Category
+
+
+def ancestors_query(slug):
+    """
+    The category ``slug`` and its ancestors, root first, as one query:
+    the ancestors are the rows of the same tree whose ``lft``/``rght``
+    interval contains the category's (each bound a subquery on the slug).
+    """
+    category = Category.objects.filter(slug=slug)
+    return Category.objects.filter(
+        tree_id=Subquery(category.values("tree_id")),
+        lft__lte=Subquery(category.values("lft")),
+        rght__gte=Subquery(category.values("rght")),
+    ).order_by("lft")
+
+
+def build_breadcrumbs(slug):
+    """
+    Returns ``[{"id", "name", "slug"}, ...]`` from the root down to the
+    category, or ``None`` if there is no such category.
+    """
+    path = list(ancestors_query(slug).values("id", "name", "slug"))
+    return path or None
+
+
+class BreadcrumbCache:
+    """
+    Process-wide LRU of slug -> breadcrumb path. All entries belong to one
+    version of the category namespace and are dropped when it moves on.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.version = None
+        self.lock = threading.Lock()
+
+    def get(self, version, slug):
+        with self.lock:
+            if self.version != version or slug not in self.entries:
+                return None
+            self.entries.move_to_end(slug)
+            return self.entries[slug]
+
+    def set(self, version, slug, path):
+        with self.lock:
+            if self.version != version:
+                self.entries.clear()
+                self.version = version
+            self.entries[slug] = path
+            self.entries.move_to_end(slug)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.version = None
+
+
+_cache = BreadcrumbCache(getattr(settings, "BREADCRUMB_CACHE_SIZE", 4096))
+
+
+def get_breadcrumbs(slug):
+    """
+    Returns the breadcrumb path of the category ``slug`` (``None`` if it
+    does not exist). A cached path costs one cache read, a miss one query.
+    """
+    version = get_catalog_version(CATEGORY_VERSION)
+    path = _cache.get(version, slug)
+    if path is None:
+        path = build_breadcrumbs(slug)
+        if path is not None:
+            _cache.set(version, slug, path)
+    return path
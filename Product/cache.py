@@ -0,0 +1,111 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.views.decorators.http import condition
+
+from core.conditional import make_etag
+from core.metrics import observe_cache
+from core.renderers import get_json_renderer
+
+# Version namespaces. Each one is bumped independently, so a product edit
+# does not throw away the rendered category tree.
+CATEGORY_VERSION = "categories"
+# The denormalized product counts, shown by the tree and category detail
+# only; activations and links move them, the dropdown and breadcrumbs stay.
+CATEGORY_COUNT_VERSION = "category-counts"
+SUGGEST_VERSION = "suggest"
+RESPONSE_VERSION = "responses"
+
+
+def get_catalog_cache():
+    """
+    Returns the cache backend configured for catalog data.
+    """
+    return caches[getattr(settings, "CATALOG_CACHE_ALIAS", "default")]
+
+
+def _version_key(namespace):
+    return f"catalog:version:{namespace}"
+
+
+def _initial_version():
+    # A time based seed means a version key that was evicted never comes back
+    # with a number that older cached entries were stored under.
+    return time.time_ns() // 1000
+
+
+def get_catalog_version(namespace):
+    """
+    Returns the current version number of the given catalog namespace.
+    """
+    cache = get_catalog_cache()
+    key = _version_key(namespace)
+
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_catalog_versions(namespaces):
+    """
+    Returns ``{namespace: version}`` for several namespaces, reading the
+    ones already set with a single cache round trip.
+    """
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = get_catalog_cache().get_many(keys)
+    return {
+        namespace: found[key] if key in found else get_catalog_version(namespace)
+        for key, namespace in keys.items()
+    }
+
+
+def bump_catalog_version(namespace):
+    """
+    Invalidates everything cached under the given namespace.
+    """
+    cache = get_catalog_cache()
+    key = _version_key(namespace)
+
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+        return cache.get(key)
+
+
+def cached_json_response(namespace, name, build, depends_on=()):
+    """
+    Serves ``build()`` rendered as JSON (by the configured JSON renderer),
+    caching the rendered bytes under the current version of ``namespace``
+    and of the namespaces it ``depends_on``. ``build`` is only called on a
+    miss.
+    """
+    cache = get_catalog_cache()
+    versions = get_catalog_versions([namespace, *depends_on])
+    key = ":".join(["catalog", namespace, *map(str, versions.values()), name])
+
+    content = cache.get(key)
+    observe_cache(namespace, hit=content is not None)
+    if content is None:
+        content = get_json_renderer().render(build())
+        cache.set(key, content)
+
+    return HttpResponse(content, content_type="application/json")
+
+
+def catalog_version_condition(*namespaces):
+    """
+    View decorator for conditional GETs of a view whose response only
+    changes with the versions of ``namespaces``: the ETag costs one cache
+    lookup and a matching request gets a 304 without touching the database.
+    """
+
+    def etag(request, *args, **kwargs):
+        versions = get_catalog_versions(namespaces)
+        return make_etag(request, *namespaces, *versions.values())
+
+    return condition(etag_func=etag)
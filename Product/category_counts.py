@@ -0,0 +1,99 @@
+from django.db import transaction
+from django.db.models import Exists, F, Func, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from Product.cache import CATEGORY_COUNT_VERSION, bump_catalog_version
+from Product.models import Category, Product
+from Product.response_cache import purge, surrogate_key
+
+
+def count_rows(queryset):
+    # COUNT(*) as a scalar subquery; no GROUP BY, unlike an aggregate
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .annotate(count=Func(F("pk"), function="COUNT"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def with_product_counts(queryset):
+    """
+    Annotates the active products linked to each category
+    (``new_product_count``) and to it or any of its descendants, each
+    product once (``new_descendant_product_count``).
+    """
+    through = Product.categories.through
+    return queryset.annotate(
+        new_product_count=count_rows(
+            through.objects.filter(category_id=OuterRef("pk"), product__is_active=True)
+        ),
+        new_descendant_product_count=count_rows(
+            Product.objects.filter(is_active=True).filter(
+                Exists(
+                    through.objects.filter(
+                        product_id=OuterRef("pk"),
+                        category__tree_id=OuterRef(OuterRef("tree_id")),
+                        category__lft__gte=OuterRef(OuterRef("lft")),
+                        category__rght__lte=OuterRef(OuterRef("rght")),
+                    )
+                )
+            )
+        ),
+    )
+
+
+def update_product_counts(queryset, batch_size=1000):
+    """
+    Recomputes the counts of the categories in ``queryset`` and saves the
+    ones that changed. Returns the number of categories updated.
+    """
+    changed = []
+    rows = with_product_counts(queryset.order_by()).only(
+        "pk", "product_count", "descendant_product_count"
+    )
+    for category in rows.iterator(chunk_size=batch_size):
+        if (category.product_count, category.descendant_product_count) != (
+            category.new_product_count,
+            category.new_descendant_product_count,
+        ):
+            category.product_count = category.new_product_count
+            category.descendant_product_count = category.new_descendant_product_count
+            changed.append(category)
+
+    if changed:
+        Category.objects.bulk_update(
+            changed,
+            ["product_count", "descendant_product_count"],
+            batch_size=batch_size,
+        )
+        # the tree and category pages show the counts; the dropdown and
+        # breadcrumbs (CATEGORY_VERSION) do not
+        bump_catalog_version(CATEGORY_COUNT_VERSION)
+        purge(*(surrogate_key(category) for category in changed))
+    return len(changed)
+
+
+def refresh_category_counts(category_ids):
+    """
+    Recomputes the counts of the given categories and of their ancestors.
+    Everything else is left as is.
+    """
+    if not category_ids:
+        return 0
+    categories = Category.objects.filter(pk__in=category_ids).get_ancestors(
+        include_self=True
+    )
+    with transaction.atomic():
+        return update_product_counts(categories)
+
+
+def rebuild_category_counts(batch_size=1000):
+    """
+    Recomputes the counts of every category. Returns the number of
+    categories whose counts changed.
+    """
+    with transaction.atomic():
+        return update_product_counts(Category.objects.all(), batch_size=batch_size)
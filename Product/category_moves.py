@@ -0,0 +1,186 @@
+"""
+Batch moves of categories to new parents.
+
+Saving each moved category would run ``full_clean``, the descendant check
+of ``Category.clean`` and an MPTT renumbering per node. Instead the whole
+forest is loaded once, the moves are applied and checked for cycles in
+memory, ``tree_id``/``lft``/``rght``/``mptt_level`` are recomputed in one
+pre-order pass, and only the rows that changed are written with
+``bulk_update``, all in one transaction.
+"""
+
+import csv
+
+from django.db import transaction
+from django.utils import timezone
+from Product.cache import CATEGORY_VERSION, bump_catalog_version
+from Product.category_counts import refresh_category_counts
+from Product.facet_counts import get_product_value_ids, refresh_facet_counts
+from Product.models import Category, Product
+from Product.response_cache import purge_all
+
+TREE_FIELDS = ["parent", "tree_id", "lft", "rght", "mptt_level", "updated_at"]
+
+
+class CategoryMoveError(Exception):
+    """
+    Raised for moves that cannot be applied; the message names the lines.
+    """
+
+
+def read_moves(path):
+    """
+    Yields ``(category, parent)`` slugs from a CSV file with ``category`` and
+    ``parent`` columns; an empty parent makes the category a root.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        for record in csv.DictReader(file):
+            yield (
+                (record.get("category") or "").strip(),
+                (record.get("parent") or "").strip() or None,
+            )
+
+
+def insert_by_name(siblings, category):
+    # where MPTT's order_insertion_by would put it: before the first
+    # sibling with a greater name
+    position = next(
+        (i for i, sibling in enumerate(siblings) if sibling.name > category.name),
+        len(siblings),
+    )
+    siblings.insert(position, category)
+
+
+def layout_forest(categories, parents, moved):
+    """
+    Returns ``{pk: (tree_id, lft, rght, mptt_level)}`` for the forest given
+    by ``parents``. Categories keep their current order among siblings and
+    ``moved`` ones are inserted by name. Categories on a cycle are missing.
+    """
+    children = {pk: [] for pk in categories}
+    roots = []
+    ordered = sorted(categories.values(), key=lambda c: (c.tree_id, c.lft))
+    for category in ordered:
+        if category.pk not in moved:
+            siblings = children.get(parents[category.pk], roots)
+            siblings.append(category)
+    for pk in moved:
+        insert_by_name(children.get(parents[pk], roots), categories[pk])
+
+    layout = {}
+    for tree_id, root in enumerate(roots, start=1):
+        counter = 1
+        stack = [(root, 0, False)]
+        while stack:
+            category, level, done = stack.pop()
+            if done:
+                lft = layout[category.pk][1]
+                layout[category.pk] = (tree_id, lft, counter, level)
+                counter += 1
+                continue
+            layout[category.pk] = (tree_id, counter, None, level)
+            counter += 1
+            stack.append((category, level, True))
+            for child in reversed(children[category.pk]):
+                stack.append((child, level + 1, False))
+    return layout
+
+
+def move_categories(moves, batch_size=1000):
+    """
+    Moves categories to new parents in one transaction. ``moves`` are
+    ``(category, parent)`` slugs, a ``None`` parent meaning a root.
+    Raises ``CategoryMoveError`` listing every invalid move, in which case
+    nothing is changed. Returns ``{"moved": ..., "updated": ...}``.
+    """
+    moves = list(moves)
+    with transaction.atomic():
+        categories = {
+            category.pk: category
+            for category in Category.objects.select_for_update().only(
+                "pk", "name", "slug", *TREE_FIELDS
+            )
+        }
+        by_slug = {category.slug: category for category in categories.values()}
+        parents = {pk: category.parent_id for pk, category in categories.items()}
+
+        errors = []
+        moved = {}
+        lines = {}
+        for line_number, (slug, parent_slug) in enumerate(moves, start=1):
+            category = by_slug.get(slug)
+            parent = by_slug.get(parent_slug) if parent_slug else None
+            if category is None:
+                errors.append(f"Line {line_number}: unknown category '{slug}'.")
+            elif parent_slug and parent is None:
+                errors.append(f"Line {line_number}: unknown parent '{parent_slug}'.")
+            elif category.pk in moved:
+                errors.append(f"Line {line_number}: '{slug}' is moved twice.")
+            elif parent is not None and parent.pk == category.pk:
+                errors.append(f"Line {line_number}: '{slug}' cannot be its own parent.")
+            else:
+                moved[category.pk] = parent.pk if parent else None
+                lines[category.pk] = line_number
+        if errors:
+            raise CategoryMoveError("\n".join(errors))
+
+        # the current ancestors lose the moved subtrees' products
+        touched = set(moved)
+        for pk in moved:
+            parent_id = parents[pk]
+            while parent_id is not None and parent_id not in touched:
+                touched.add(parent_id)
+                parent_id = parents[parent_id]
+        parents.update(moved)
+        layout = layout_forest(categories, parents, moved)
+
+        # categories that no longer lead up to a root sit on a cycle
+        cycles = sorted(lines[pk] for pk in moved if pk not in layout)
+        if cycles:
+            raise CategoryMoveError(
+                "\n".join(
+                    f"Line {line_number}: '{moves[line_number - 1][0]}' cannot be "
+                    f"moved under its own descendant '{moves[line_number - 1][1]}'."
+                    for line_number in cycles
+                )
+            )
+
+        now = timezone.now()
+        changed = []
+        for pk, category in categories.items():
+            position = layout[pk]
+            current = (
+                category.tree_id,
+                category.lft,
+                category.rght,
+                category.mptt_level,
+            )
+            if pk not in moved and current == position:
+                continue
+            if pk in moved:
+                category.parent_id = moved[pk]
+                category.updated_at = now
+            category.tree_id, category.lft, category.rght, category.mptt_level = (
+                position
+            )
+            changed.append(category)
+        Category.objects.bulk_update(changed, TREE_FIELDS, batch_size=batch_size)
+
+        # No signals were sent: refresh what depends on the tree.
+        subtrees = set()
+        for pk in sorted(layout, key=layout.get):
+            if pk in moved or parents[pk] in subtrees:
+                subtrees.add(pk)
+        refresh_category_counts(touched)
+        refresh_facet_counts(
+            get_product_value_ids(
+                Product.categories.through.objects.filter(
+                    category_id__in=subtrees
+                ).values("product_id")
+            ),
+            touched,
+        )
+        bump_catalog_version(CATEGORY_VERSION)
+        purge_all()
+
+    return {"moved": len(moved), "updated": len(changed)}
@@ -0,0 +1,125 @@
+from itertools import chain
+
+from django.db import transaction
+from django.db.models import Count, Q
+from Product.filters import in_category_subtree
+from Product.models import (
+    AttributeValue,
+    Category,
+    FacetCount,
+    Product,
+    ProductVariantAttributeValue,
+)
+
+
+def count_facets(category=None, value_ids=None):
+    """
+    Yields unsaved ``FacetCount`` rows for one category subtree
+    (``None`` for the whole catalog), optionally limited to ``value_ids``.
+    """
+    rows = ProductVariantAttributeValue.objects.filter(
+        variant__is_active=True, variant__product__is_active=True
+    )
+    if value_ids is not None:
+        rows = rows.filter(attribute_value_id__in=value_ids)
+    if category is not None:
+        rows = rows.filter(
+            in_category_subtree(category, product_ref="variant__product_id")
+        )
+
+    rows = (
+        rows.values("attribute_value_id", "variant__product__product_type_id")
+        .annotate(product_count=Count("variant__product_id", distinct=True))
+        .order_by()
+    )
+    for row in rows:
+        yield FacetCount(
+            attribute_value_id=row["attribute_value_id"],
+            category=category,
+            product_type_id=row["variant__product__product_type_id"],
+            product_count=row["product_count"],
+        )
+
+
+def lock_values(value_ids=None):
+    """
+    Locks the attribute values whose counts are about to be rewritten, in
+    pk order, so refreshes of overlapping cells run one after the other
+    instead of both inserting the rows the other one deleted.
+    """
+    values = AttributeValue.objects.select_for_update().order_by("pk")
+    if value_ids is not None:
+        values = values.filter(pk__in=value_ids)
+    list(values.values_list("pk", flat=True))
+
+
+def refresh_facet_counts(value_ids, category_ids):
+    """
+    Recomputes the counts of ``value_ids`` for the given categories, their
+    ancestors and the catalog-wide scope. Everything else is left as is.
+    """
+    value_ids = set(value_ids)
+    if not value_ids:
+        return
+
+    categories = []
+    if category_ids:
+        categories = list(
+            Category.objects.filter(pk__in=category_ids).get_ancestors(
+                include_self=True
+            )
+        )
+
+    with transaction.atomic():
+        lock_values(value_ids)
+        FacetCount.objects.filter(
+            Q(category__isnull=True) | Q(category__in=categories),
+            attribute_value_id__in=value_ids,
+        ).delete()
+        FacetCount.objects.bulk_create(
+            chain.from_iterable(
+                count_facets(category, value_ids) for category in [None, *categories]
+            )
+        )
+
+
+def rebuild_facet_counts(batch_size=1000):
+    """
+    Drops and recomputes every facet count. Returns the number of rows.
+    """
+    created = 0
+    with transaction.atomic():
+        lock_values()
+        FacetCount.objects.all().delete()
+        categories = Category.objects.order_by("tree_id", "lft").iterator()
+        for category in chain([None], categories):
+            rows = FacetCount.objects.bulk_create(
+                count_facets(category), batch_size=batch_size
+            )
+            created += len(rows)
+    return created
+
+
+def get_product_value_ids(product_ids):
+    return set(
+        ProductVariantAttributeValue.objects.filter(
+            variant__product_id__in=product_ids
+        ).values_list("attribute_value_id", flat=True)
+    )
+
+
+def get_product_category_ids(product_ids):
+    return set(
+        Product.categories.through.objects.filter(
+            product_id__in=product_ids
+        ).values_list("category_id", flat=True)
+    )
+
+
+def refresh_product_facet_counts(product_ids):
+    """
+    Recomputes every count the given products contribute to.
+    """
+    refresh_facet_counts(
+        get_product_value_ids(product_ids), get_product_category_ids(product_ids)
+    )
@@ -0,0 +1,209 @@
+from collections import defaultdict
+
+from django.db.models import Count, Exists, OuterRef, Q, Sum
+from rest_framework import serializers
+from Product.filters import ProductFilterSerializer
+from Product.models import (
+    AttributeValue,
+    FacetCount,
+    ProductVariant,
+    ProductVariantAttributeValue,
+)
+
+# Filters that the precomputed FacetCount table can answer on its own.
+PRECOMPUTED_SCOPE = {"category", "product_type"}
+
+
+class FacetFilterSerializer(ProductFilterSerializer):
+    """
+    Product list parameters plus the selected attribute value slugs.
+    """
+
+    value = serializers.ListField(child=serializers.SlugField(), required=False)
+
+
+def get_selection(value_slugs):
+    """
+    Resolves selected value slugs to ``{attribute_id: {value_id, ...}}``.
+    Unknown or inactive slugs are ignored.
+    """
+    selection = defaultdict(set)
+    if not value_slugs:
+        return selection
+
+    values = AttributeValue.objects.filter(
+        slug__in=value_slugs, is_active=True, attribute__is_filterable=True
+    ).values_list("attribute_id", "pk")
+    for attribute_id, value_id in values:
+        selection[attribute_id].add(value_id)
+    return selection
+
+
+def matching_variants(products, selection, exclude_attribute=None):
+    """
+    Active variants of ``products`` that carry one of the selected values
+    for every selected attribute (values of one attribute are OR-ed, the
+    attributes are AND-ed). ``exclude_attribute`` leaves one attribute's
+    selection out, which is what its own facet counts are computed against.
+    """
+    variants = ProductVariant.objects.filter(
+        is_active=True, product_id__in=products.order_by().values("pk")
+    )
+    for attribute_id, value_ids in selection.items():
+        if attribute_id == exclude_attribute:
+            continue
+        variants = variants.filter(
+            Exists(
+                ProductVariantAttributeValue.objects.filter(
+                    variant_id=OuterRef("pk"), attribute_value_id__in=value_ids
+                )
+            )
+        )
+    return variants
+
+
+def filter_by_selection(products, selection):
+    """
+    Narrows ``products`` to those with at least one matching variant.
+    """
+    if not selection:
+        return products
+    variants = matching_variants(products, selection)
+    return products.filter(Exists(variants.filter(product_id=OuterRef("pk"))))
+
+
+def _count_rows(variants, *conditions, **filters):
+    rows = (
+        ProductVariantAttributeValue.objects.filter(
+            *conditions,
+            variant__in=variants,
+            attribute__is_filterable=True,
+            attribute_value__is_active=True,
+            **filters,
+        )
+        .values(
+            "attribute_id",
+            "attribute__name",
+            "attribute__slug",
+            "attribute_value_id",
+            "attribute_value__value",
+            "attribute_value__slug",
+        )
+        .annotate(count=Count("variant__product_id", distinct=True))
+    )
+    for row in rows:
+        yield {
+            "attribute_id": row["attribute_id"],
+            "attribute_name": row["attribute__name"],
+            "attribute_slug": row["attribute__slug"],
+            "value_id": row["attribute_value_id"],
+            "value": row["attribute_value__value"],
+            "value_slug": row["attribute_value__slug"],
+            "count": row["count"],
+        }
+
+
+def _group_facets(rows, selection):
+    facets = {}
+    for row in rows:
+        facet = facets.setdefault(
+            row["attribute_id"],
+            {
+                "attribute": {
+                    "name": row["attribute_name"],
+                    "slug": row["attribute_slug"],
+                },
+                "values": [],
+            },
+        )
+        facet["values"].append(
+            {
+                "value": row["value"],
+                "slug": row["value_slug"],
+                "count": row["count"],
+                "selected": row["value_id"] in selection.get(row["attribute_id"], ()),
+            }
+        )
+
+    for facet in facets.values():
+        facet["values"].sort(key=lambda value: value["value"])
+    return sorted(facets.values(), key=lambda facet: facet["attribute"]["name"])
+
+
+def get_facet_counts(products, selection):
+    """
+    Counts matching products per value of every filterable attribute.
+
+    Attributes without a selection share one GROUP BY query against the
+    full selection; each selected attribute gets its own query against the
+    selection minus itself, so picking "red" does not hide "blue".
+    """
+    rows = list(
+        _count_rows(
+            matching_variants(products, selection),
+            ~Q(attribute_id__in=list(selection)),
+        )
+    )
+    for attribute_id in selection:
+        rows.extend(
+            _count_rows(
+                matching_variants(products, selection, exclude_attribute=attribute_id),
+                attribute_id=attribute_id,
+            )
+        )
+    return _group_facets(rows, selection)
+
+
+def can_use_precomputed(params, selection):
+    """
+    True when the request only narrows by category and product type,
+    which is exactly what ``FacetCount`` is keyed by.
+    """
+    if selection:
+        return False
+    return all(
+        field in PRECOMPUTED_SCOPE or field == "ordering" or not value
+        for field, value in params.items()
+    )
+
+
+def get_precomputed_facet_counts(category_slug=None, product_type_slug=None):
+    """
+    Same output as ``get_facet_counts`` without a selection, read from the
+    precomputed ``FacetCount`` table with a single indexed query.
+    """
+    counts = FacetCount.objects.filter(
+        attribute_value__attribute__is_filterable=True,
+        attribute_value__is_active=True,
+    )
+    if category_slug:
+        counts = counts.filter(category__slug=category_slug, category__is_active=True)
+    else:
+        counts = counts.filter(category__isnull=True)
+    if product_type_slug:
+        counts = counts.filter(product_type__slug=product_type_slug)
+
+    rows = counts.values(
+        "attribute_value__attribute_id",
+        "attribute_value__attribute__name",
+        "attribute_value__attribute__slug",
+        "attribute_value_id",
+        "attribute_value__value",
+        "attribute_value__slug",
+    ).annotate(count=Sum("product_count"))
+
+    return _group_facets(
+        (
+            {
+                "attribute_id": row["attribute_value__attribute_id"],
+                "attribute_name": row["attribute_value__attribute__name"],
+                "attribute_slug": row["attribute_value__attribute__slug"],
+                "value_id": row["attribute_value_id"],
+                "value": row["attribute_value__value"],
+                "value_slug": row["attribute_value__slug"],
+                "count": row["count"],
+            }
+            for row in rows
+        ),
+        {},
+    )
@@ -0,0 +1,115 @@
+from django.db.models import Exists, Min, OuterRef, Subquery
+from rest_framework import serializers
+from Product.models import Category, Product, ProductVariant
+
+PRODUCT_ORDERINGS = ["name", "-name", "created_at", "-created_at"]
+
+
+class ProductFilterSerializer(serializers.Serializer):
+    """
+    Validates the query parameters accepted by the product list.
+    """
+
+    category = serializers.SlugField(required=False)
+    product_type = serializers.SlugField(required=False)
+    tag = serializers.SlugField(required=False)
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    max_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    in_stock = serializers.BooleanField(required=False, default=False)
+    ordering = serializers.ChoiceField(choices=PRODUCT_ORDERINGS, default="name")
+
+    def validate(self, attrs):
+        min_price = attrs.get("min_price")
+        max_price = attrs.get("max_price")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise serializers.ValidationError(
+                {"min_price": "min_price cannot be greater than max_price."}
+            )
+        return attrs
+
+
+def in_category_subtree(category, product_ref="pk"):
+    """
+    Returns an ``Exists`` condition matching products linked to ``category``
+    or to any of its descendants. ``product_ref`` points at the product id
+    of the outer query.
+
+    Uses the MPTT interval of the category against the M2M table, so no
+    descendant list is built in Python and a product linked to several nodes
+    of the subtree is still returned once.
+    """
+    through = Product.categories.through
+    return Exists(
+        through.objects.filter(
+            product_id=OuterRef(product_ref),
+            category__tree_id=category.tree_id,
+            category__lft__gte=category.lft,
+            category__rght__lte=category.rght,
+        )
+    )
+
+
+def active_variants():
+    return ProductVariant.objects.filter(product_id=OuterRef("pk"), is_active=True)
+
+
+def filter_products(queryset, params):
+    """
+    Applies the validated ``ProductFilterSerializer`` data to ``queryset``.
+    """
+    if params.get("category"):
+        category = Category.objects.filter(
+            slug=params["category"], is_active=True
+        ).first()
+        if category is None:
+            return queryset.none()
+        queryset = queryset.filter(in_category_subtree(category))
+
+    if params.get("product_type"):
+        queryset = queryset.filter(product_type__slug=params["product_type"])
+
+    if params.get("tag"):
+        queryset = queryset.filter(
+            Exists(
+                Product.tags.through.objects.filter(
+                    product_id=OuterRef("pk"), tag__slug=params["tag"]
+                )
+            )
+        )
+
+    # Price and stock conditions must hold for the same variant.
+    variant_conditions = {}
+    if params.get("min_price") is not None:
+        variant_conditions["price__gte"] = params["min_price"]
+    if params.get("max_price") is not None:
+        variant_conditions["price__lte"] = params["max_price"]
+    if params.get("in_stock"):
+        variant_conditions["stock__gt"] = 0
+    if variant_conditions:
+        queryset = queryset.filter(
+            Exists(active_variants().filter(**variant_conditions))
+        )
+
+    return queryset
+
+
+def with_min_price(queryset):
+    """
+    Annotates the lowest active variant price.
+
+    A correlated subquery is only evaluated for the rows of the page, unlike
+    a JOIN + GROUP BY over every variant of every matching product.
+    """
+    return queryset.annotate(
+        min_price=Subquery(
+            active_variants()
+            .order_by()
+            .values("product_id")
+            .annotate(value=Min("price"))
+            .values("value")[:1]
+        )
+    )
@@ -0,0 +1,352 @@
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from pathlib import Path
+
+from django.db import transaction
+from django.utils.text import slugify
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    Category,
+    Product,
+    ProductType,
+    ProductVariant,
+    ProductVariantAttributeValue,
+    Tag,
+)
+from core.bulk import BatchValidationError
+
+# CSV only: several slugs in one cell, and one column per attribute.
+LIST_SEPARATOR = "|"
+ATTRIBUTE_PREFIX = "attribute:"
+
+FORMATS = ["csv", "jsonl"]
+
+
+class CatalogImportError(Exception):
+    """
+    Raised for rows that cannot be imported; the message names the lines.
+    """
+
+
+###################################
+# reading
+###################################
+
+
+def _split(value):
+    return [
+        item.strip() for item in (value or "").split(LIST_SEPARATOR) if item.strip()
+    ]
+
+
+def read_csv(path):
+    """
+    Yields ``(line_number, row)`` from a CSV file with one variant per line.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        for line_number, record in enumerate(csv.DictReader(file), start=2):
+            row = {
+                key: value
+                for key, value in record.items()
+                if key and not key.startswith(ATTRIBUTE_PREFIX)
+            }
+            row["categories"] = _split(record.get("categories"))
+            row["tags"] = _split(record.get("tags"))
+            row["attributes"] = {
+                key[len(ATTRIBUTE_PREFIX) :]: value
+                for key, value in record.items()
+                if key and key.startswith(ATTRIBUTE_PREFIX) and value
+            }
+            yield line_number, row
+
+
+def read_jsonl(path):
+    """
+    Yields ``(line_number, row)`` from a file with one JSON object per line.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as error:
+                raise CatalogImportError(f"Line {line_number}: {error}") from error
+
+
+def read_rows(path, file_format=None):
+    file_format = file_format or Path(path).suffix.lstrip(".").lower()
+    if file_format not in FORMATS:
+        raise CatalogImportError(
+            f"Unknown format '{file_format}', expected one of: {', '.join(FORMATS)}."
+        )
+    return read_csv(path) if file_format == "csv" else read_jsonl(path)
+
+
+def batched(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+###################################
+# writing
+###################################
+
+
+class CatalogImporter:
+    """
+    Imports products, variants and their attribute values from rows like::
+
+        {"product": "blue-shirt", "name": "Blue Shirt", "description": "...",
+         "product_type": "shirt", "categories": ["men"], "tags": ["summer"],
+         "sku": "BS-M", "price": "19.90", "stock": 5,
+         "attributes": {"color": "Blue", "size": "M"}}
+
+    Products and variants are matched by slug and SKU and updated in place,
+    category and tag links are added. Categories, product types, tags and
+    attributes must exist and are resolved by slug from maps loaded once;
+    missing attribute values are created.
+
+    Each batch is validated with ``core.bulk.validate_batch`` and written with
+    bulk queries in its own transaction, so ``save()`` and the model signals
+    do not run: ``import_catalog`` refreshes the derived data afterwards.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.categories = dict(Category.objects.values_list("slug", "pk"))
+        self.tags = dict(Tag.objects.values_list("slug", "pk"))
+        self.product_types = {
+            product_type.slug: product_type
+            for product_type in ProductType.objects.all()
+        }
+        self.attributes = {
+            attribute.slug: attribute
+            for attribute in Attribute.objects.prefetch_related("product_types")
+        }
+        self.values = {
+            (value.attribute_id, value.value.lower()): value
+            for value in AttributeValue.objects.select_related("attribute")
+        }
+        self.value_slugs = {value.slug for value in self.values.values()}
+
+        self.product_ids = set()
+        self.stats = dict.fromkeys(
+            ["rows", "products", "variants", "attribute_values"], 0
+        )
+
+    def run(self, rows):
+        for batch in batched(rows, self.batch_size):
+            with transaction.atomic():
+                products = self.import_batch(batch)
+            # committed: the caller refreshes what the bulk writes skipped
+            self.product_ids.update(product.pk for product in products.values())
+            self.stats["rows"] += len(batch)
+        return self.stats
+
+    def import_batch(self, batch):
+        rows = [
+            (line_number, self.resolve(line_number, row)) for line_number, row in batch
+        ]
+        products = self.save_products(rows)
+        variants = self.save_variants(rows, products)
+        self.save_attribute_values(rows, variants)
+        return products
+
+    def resolve(self, line_number, row):
+        """
+        Replaces slugs by the objects/ids they name and checks the row shape.
+        """
+        try:
+            resolved = {
+                "product": row["product"],
+                "name": row.get("name") or None,
+                "description": row.get("description") or None,
+                "product_type": self._lookup(
+                    self.product_types, row.get("product_type"), "product type"
+                ),
+                "categories": [
+                    self._lookup(self.categories, slug, "category")
+                    for slug in row.get("categories") or []
+                ],
+                "tags": [
+                    self._lookup(self.tags, slug, "tag")
+                    for slug in row.get("tags") or []
+                ],
+                "sku": row["sku"],
+                "price": Decimal(str(row["price"])),
+                "stock": int(row.get("stock") or 0),
+                "attributes": [
+                    (self._lookup(self.attributes, slug, "attribute"), str(value))
+                    for slug, value in (row.get("attributes") or {}).items()
+                ],
+            }
+        except KeyError as error:
+            raise CatalogImportError(f"Line {line_number}: missing {error}.") from error
+        except (InvalidOperation, ValueError) as error:
+            raise CatalogImportError(f"Line {line_number}: {error}") from error
+        return resolved
+
+    @staticmethod
+    def _lookup(objects, slug, label):
+        if not slug:
+            return None
+        try:
+            return objects[slug]
+        except KeyError:
+            raise ValueError(f"unknown {label} '{slug}'.") from None
+
+    def _bulk_save(self, model, instances, line_numbers):
+        try:
+            return model.bulk_save(instances, batch_size=self.batch_size)
+        except BatchValidationError as error:
+            lines = [
+                f"Line {line_numbers[index]}: {model.__name__} {messages.messages}"
+                for index, messages in error.errors.items()
+            ]
+            raise CatalogImportError("\n".join(lines)) from error
+
+    @staticmethod
+    def _has_changed(instance, fields):
+        # Foreign keys are compared by id: reading the related object of an
+        # instance from in_bulk() would run a query per row.
+        for name, value in fields.items():
+            field = instance._meta.get_field(name)
+            if field.is_relation:
+                if getattr(instance, field.attname) != value.pk:
+                    return True
+            elif getattr(instance, name) != value:
+                return True
+        return False
+
+    def save_products(self, rows):
+        # A product spans several rows; its fields come from the first one.
+        first_rows = {}
+        for line_number, row in rows:
+            first_rows.setdefault(row["product"], (line_number, row))
+
+        products = Product.objects.in_bulk(list(first_rows), field_name="slug")
+        changed, line_numbers = [], []
+        for slug, (line_number, row) in first_rows.items():
+            product = products.get(slug) or Product(slug=slug)
+            fields = {
+                "name": row["name"] or product.name,
+                "description": row["description"] or product.description,
+            }
+            if row["product_type"] is not None:
+                fields["product_type"] = row["product_type"]
+            if product._state.adding or self._has_changed(product, fields):
+                for field, value in fields.items():
+                    setattr(product, field, value)
+                changed.append(product)
+                line_numbers.append(line_number)
+            products[slug] = product
+
+        created, _ = self._bulk_save(Product, changed, line_numbers)
+        self.stats["products"] += len(created)
+
+        self._link(
+            Product.categories.through, "category_id", rows, products, "categories"
+        )
+        self._link(Product.tags.through, "tag_id", rows, products, "tags")
+        return products
+
+    def _link(self, through, related_field, rows, products, key):
+        links = {
+            (products[row["product"]].pk, related_id)
+            for _, row in rows
+            for related_id in row[key]
+        }
+        through.objects.bulk_create(
+            [
+                through(product_id=product_id, **{related_field: related_id})
+                for product_id, related_id in links
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+    def save_variants(self, rows, products):
+        variants = ProductVariant.objects.in_bulk(
+            [row["sku"] for _, row in rows], field_name="sku"
+        )
+        changed, line_numbers = [], []
+        for line_number, row in rows:
+            product = products[row["product"]]
+            variant = variants.get(row["sku"]) or ProductVariant(sku=row["sku"])
+            fields = {"product": product, "price": row["price"], "stock": row["stock"]}
+            if variant._state.adding or self._has_changed(variant, fields):
+                for field, value in fields.items():
+                    setattr(variant, field, value)
+                changed.append(variant)
+                line_numbers.append(line_number)
+            variants[row["sku"]] = variant
+
+        created, _ = self._bulk_save(ProductVariant, changed, line_numbers)
+        self.stats["variants"] += len(created)
+        return variants
+
+    def get_value(self, attribute, text):
+        """
+        Returns the attribute value named ``text``, as an unsaved instance
+        when it does not exist yet.
+        """
+        key = (attribute.pk, text.lower())
+        if key not in self.values:
+            slug = slugify(f"{attribute.slug}-{text}")
+            if slug in self.value_slugs:
+                slug = slugify(f"{attribute.slug}-{text}-{len(self.values)}")
+            self.values[key] = AttributeValue(
+                attribute=attribute, value=text, slug=slug
+            )
+            self.value_slugs.add(slug)
+        return self.values[key]
+
+    def save_attribute_values(self, rows, variants):
+        new_values, value_lines = {}, []
+        for line_number, row in rows:
+            for attribute, text in row["attributes"]:
+                value = self.get_value(attribute, text)
+                if value._state.adding and id(value) not in new_values:
+                    new_values[id(value)] = value
+                    value_lines.append(line_number)
+        new_values = list(new_values.values())
+        self._bulk_save(AttributeValue, new_values, value_lines)
+        self.stats["attribute_values"] += len(new_values)
+
+        variant_ids = [variants[row["sku"]].pk for _, row in rows]
+        existing = {
+            (assigned.variant_id, assigned.attribute_id): assigned
+            for assigned in ProductVariantAttributeValue.objects.filter(
+                variant_id__in=variant_ids
+            )
+        }
+
+        changed, line_numbers, seen = [], [], set()
+        for line_number, row in rows:
+            variant = variants[row["sku"]]
+            for attribute, text in row["attributes"]:
+                value = self.get_value(attribute, text)
+                key = (variant.pk, attribute.pk)
+                assigned = existing.get(key)
+                if assigned is None:
+                    assigned = ProductVariantAttributeValue()
+                    existing[key] = assigned
+                elif assigned.attribute_value_id == value.pk:
+                    continue
+                if key in seen:
+                    # Repeated in the batch: the last row wins.
+                    assigned.attribute_value = value
+                    continue
+                seen.add(key)
+                assigned.variant = variant
+                assigned.attribute = attribute
+                assigned.attribute_value = value
+                changed.append(assigned)
+                line_numbers.append(line_number)
+
+        self._bulk_save(ProductVariantAttributeValue, changed, line_numbers)
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from Product.cache import (
+    CATEGORY_VERSION,
+    SUGGEST_VERSION,
+    bump_catalog_version,
+)
+from Product.category_counts import rebuild_category_counts
+from Product.facet_counts import rebuild_facet_counts
+from Product.models import Product
+from Product.response_cache import purge_all
+from Product.search import update_search_vectors
+from core.copy_loader import FixtureLoadError, copy_load, is_supported
+
+
+class Command(BaseCommand):
+    help = (
+        "Load fixture files (or directories of them, e.g. seeders/Fake_data) "
+        "with PostgreSQL COPY instead of saving every object."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Fixture files or directories.")
+        parser.add_argument(
+            "--truncate",
+            action="store_true",
+            help="Empty the loaded tables (and the tables referencing them) first.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_supported():
+            raise CommandError("COPY loading requires PostgreSQL; use loaddata.")
+
+        try:
+            loaded = copy_load(options["paths"], truncate=options["truncate"])
+        except (FixtureLoadError, OSError, ValueError) as error:
+            raise CommandError(error)
+
+        for table, rows in loaded.items():
+            self.stdout.write(f"{table}: {rows} rows")
+
+        # COPY skips the signals that keep these up to date.
+        update_search_vectors(Product.objects.all())
+        rebuild_facet_counts()
+        rebuild_category_counts()
+        bump_catalog_version(CATEGORY_VERSION)
+        bump_catalog_version(SUGGEST_VERSION)
+        purge_all()
+
+        total = sum(loaded.values())
+        self.stdout.write(
+            self.style.SUCCESS(f"Loaded {total} rows into {len(loaded)} tables.")
+        )
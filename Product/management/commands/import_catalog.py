@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+from Product.cache import SUGGEST_VERSION, bump_catalog_version
+from Product.category_counts import rebuild_category_counts
+from Product.facet_counts import rebuild_facet_counts
+from Product.importer import FORMATS, CatalogImporter, CatalogImportError, read_rows
+from Product.models import Product
+from Product.response_cache import purge_all
+from Product.search import update_search_vectors
+
+
+class Command(BaseCommand):
+    help = (
+        "Import products, variants and attribute values from a CSV or JSONL "
+        "file with one variant per row."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="File format; taken from the file extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows written per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        importer = CatalogImporter(batch_size=options["batch_size"])
+        try:
+            stats = importer.run(read_rows(options["path"], options["format"]))
+        except (CatalogImportError, OSError) as error:
+            raise CommandError(
+                f"Import stopped after {importer.stats['rows']} rows.\n{error}"
+            )
+        finally:
+            # also after a failure: the batches before it are committed
+            self.refresh(importer.product_ids, options["batch_size"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {stats['rows']} rows: {stats['products']} new products, "
+                f"{stats['variants']} new variants, "
+                f"{stats['attribute_values']} new attribute values."
+            )
+        )
+
+    def refresh(self, product_ids, batch_size):
+        """
+        Bulk writes skip the signals that keep these up to date.
+        """
+        if not product_ids:
+            return
+        product_ids = sorted(product_ids)
+        for start in range(0, len(product_ids), batch_size):
+            batch = product_ids[start : start + batch_size]
+            update_search_vectors(Product.objects.filter(pk__in=batch))
+        rebuild_facet_counts()
+        rebuild_category_counts()
+        bump_catalog_version(SUGGEST_VERSION)
+        purge_all()
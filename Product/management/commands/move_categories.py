@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from Product.category_moves import CategoryMoveError, move_categories, read_moves
+
+
+class Command(BaseCommand):
+    help = (
+        "Move categories to new parents in one transaction, from a CSV file "
+        "with 'category' and 'parent' slug columns (empty parent: root)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file with the moves.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of categories per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            stats = move_categories(
+                read_moves(options["path"]), batch_size=options["batch_size"]
+            )
+        except (CategoryMoveError, OSError) as error:
+            raise CommandError(f"Nothing was moved.\n{error}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {stats['moved']} categories, "
+                f"{stats['updated']} rows renumbered."
+            )
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from Product.category_counts import rebuild_category_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the product counts of every category from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of categories per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        updated = rebuild_category_counts(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated the counts of {updated} categories.")
+        )
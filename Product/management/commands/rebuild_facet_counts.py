@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from Product.facet_counts import rebuild_facet_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the precomputed facet counts from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows per INSERT.",
+        )
+
+    def handle(self, *args, **options):
+        created = rebuild_facet_counts(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {created} facet counts."))
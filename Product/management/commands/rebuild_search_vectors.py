@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from Product.models import Product
+from Product.search import is_supported, update_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Recompute the full-text search vector of every product."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of products per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_supported():
+            raise CommandError("Full-text search requires PostgreSQL.")
+
+        batch_size = options["batch_size"]
+        product_ids = Product.objects.order_by("pk").values_list("pk", flat=True)
+
+        updated = 0
+        batch = []
+        for product_id in product_ids.iterator(chunk_size=batch_size):
+            batch.append(product_id)
+            if len(batch) == batch_size:
+                updated += update_search_vectors(Product.objects.filter(pk__in=batch))
+                batch = []
+        if batch:
+            updated += update_search_vectors(Product.objects.filter(pk__in=batch))
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} search vectors."))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Product", "0004_product_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="productvariantattributevalue",
+            index=models.Index(
+                fields=["attribute_value", "variant"], name="pvav_value_variant_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,129 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:53
+
+from itertools import chain
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef
+
+BATCH_SIZE = 1000
+
+
+def fill_facet_counts(apps, schema_editor):
+    # a frozen copy of Product.facet_counts.rebuild_facet_counts()
+    Category = apps.get_model("Product", "Category")
+    FacetCount = apps.get_model("Product", "FacetCount")
+    Product = apps.get_model("Product", "Product")
+    PVAV = apps.get_model("Product", "ProductVariantAttributeValue")
+
+    def count_facets(category):
+        rows = PVAV.objects.filter(
+            variant__is_active=True, variant__product__is_active=True
+        )
+        if category is not None:
+            rows = rows.filter(
+                Exists(
+                    Product.categories.through.objects.filter(
+                        product_id=OuterRef("variant__product_id"),
+                        category__tree_id=category.tree_id,
+                        category__lft__gte=category.lft,
+                        category__rght__lte=category.rght,
+                    )
+                )
+            )
+        rows = (
+            rows.values("attribute_value_id", "variant__product__product_type_id")
+            .annotate(product_count=Count("variant__product_id", distinct=True))
+            .order_by()
+        )
+        return [
+            FacetCount(
+                attribute_value_id=row["attribute_value_id"],
+                category=category,
+                product_type_id=row["variant__product__product_type_id"],
+                product_count=row["product_count"],
+            )
+            for row in rows
+        ]
+
+    categories = Category.objects.order_by("tree_id", "lft").iterator()
+    for category in chain([None], categories):
+        FacetCount.objects.bulk_create(count_facets(category), batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Product", "0005_pvav_value_variant_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FacetCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "product_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Product Count"
+                    ),
+                ),
+                (
+                    "attribute_value",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facet_counts",
+                        to="Product.attributevalue",
+                        verbose_name="Attribute Value",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facet_counts",
+                        to="Product.category",
+                        verbose_name="Category",
+                    ),
+                ),
+                (
+                    "product_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facet_counts",
+                        to="Product.producttype",
+                        verbose_name="Product Type",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Facet Count",
+                "verbose_name_plural": "Facet Counts",
+                "indexes": [
+                    models.Index(
+                        fields=["category", "product_type"], name="facetcount_scope_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("attribute_value", "category", "product_type"),
+                        name="facetcount_cell_unique",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_facet_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:54
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def related_names(through, related_field):
+    return Subquery(
+        through.objects.filter(product_id=OuterRef("pk"))
+        .values("product_id")
+        .annotate(names=StringAgg(f"{related_field}__name", delimiter=" "))
+        .values("names")[:1]
+    )
+
+
+def fill_search_vectors(apps, schema_editor):
+    # a frozen copy of Product.search.search_vector(); PostgreSQL only
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Product = apps.get_model("Product", "Product")
+    vector = (
+        SearchVector("name", weight="A", config="english")
+        + SearchVector(
+            related_names(Product.tags.through, "tag"), weight="B", config="english"
+        )
+        + SearchVector(
+            related_names(Product.categories.through, "category"),
+            weight="B",
+            config="english",
+        )
+        + SearchVector("description", weight="C", config="english")
+    )
+    pks = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(pks), BATCH_SIZE):
+        Product.objects.filter(pk__in=pks[start : start + BATCH_SIZE]).update(
+            search_vector=vector
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Product", "0006_facetcount"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        # before the index, so it is built once over the filled column
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="product_search_vector_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:35
+
+from django.db import migrations, models
+from django.db.models import Exists, F, Func, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 1000
+
+
+def count_rows(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .annotate(count=Func(F("pk"), function="COUNT"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def fill_product_counts(apps, schema_editor):
+    # a frozen copy of Product.category_counts.with_product_counts()
+    Category = apps.get_model("Product", "Category")
+    Product = apps.get_model("Product", "Product")
+    through = Product.categories.through
+    categories = Category.objects.order_by().annotate(
+        new_product_count=count_rows(
+            through.objects.filter(category_id=OuterRef("pk"), product__is_active=True)
+        ),
+        new_descendant_product_count=count_rows(
+            Product.objects.filter(is_active=True).filter(
+                Exists(
+                    through.objects.filter(
+                        product_id=OuterRef("pk"),
+                        category__tree_id=OuterRef(OuterRef("tree_id")),
+                        category__lft__gte=OuterRef(OuterRef("lft")),
+                        category__rght__lte=OuterRef(OuterRef("rght")),
+                    )
+                )
+            )
+        ),
+    )
+    changed = []
+    for category in categories.only("pk").iterator(chunk_size=BATCH_SIZE):
+        if category.new_descendant_product_count:
+            category.product_count = category.new_product_count
+            category.descendant_product_count = category.new_descendant_product_count
+            changed.append(category)
+    Category.objects.bulk_update(
+        changed, ["product_count", "descendant_product_count"], batch_size=BATCH_SIZE
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("Product", "0007_product_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="descendant_product_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="product_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_product_counts, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.forms import ValidationError
 from mptt.models import MPTTModel, TreeForeignKey, TreeManyToManyField
 from Product import validators
@@ -6,6 +8,8 @@ from core.mixins import (
     CleanvalidateMixin,
     PreventDeactivationIfUsedMixin,
     CaseInsensitiveUniqueMixin,
+    UniqueSlugRetryMixin,
+    TrackOriginalFieldsMixin,
 )
 from django.apps import apps
 
@@ -14,6 +18,8 @@ class Category(
     PreventDeactivationIfUsedMixin,
     CleanvalidateMixin,
     CaseInsensitiveUniqueMixin,
+    TrackOriginalFieldsMixin,
+    UniqueSlugRetryMixin,
     MPTTModel,
 ):
     """
@@ -29,6 +35,9 @@ class Category(
     # CaseInsensitiveUniqueMixin
     case_insensitive_unique_fileds = ["name"]
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["name", "slug", "is_active", "parent"]
+
     name = models.CharField(
         max_length=100,
         null=False,
@@ -52,6 +61,10 @@ class Category(
         related_name="children",
         verbose_name="Parent Category",
     )
+    # active products linked to the category, and to it or any descendant;
+    # maintained by Product/category_counts.py
+    product_count = models.PositiveIntegerField(default=0, editable=False)
+    descendant_product_count = models.PositiveIntegerField(default=0, editable=False)
 
     created_at = models.DateTimeField(
         auto_now_add=True, editable=False, verbose_name="Created At"
@@ -76,17 +89,18 @@ class Category(
         if self.parent and self.parent == self:
             raise ValidationError("Category cannot be its own parent.")
 
-        if self.parent and self.pk:
-            if self.parent in self.get_descendants():
-                raise ValidationError(
-                    "Category cannot be a child of its own descendant."
-                )
+        # Compares the MPTT intervals of the two loaded rows instead of
+        # fetching the whole subtree.
+        if self.parent and self.pk and self.parent.is_descendant_of(self):
+            raise ValidationError("Category cannot be a child of its own descendant.")
 
 
 class ProductType(
     CaseInsensitiveUniqueMixin,
     PreventDeactivationIfUsedMixin,
     CleanvalidateMixin,
+    TrackOriginalFieldsMixin,
+    UniqueSlugRetryMixin,
     models.Model,
 ):
     """
@@ -102,6 +116,9 @@ class ProductType(
     # CaseInsensitiveUniqueMixin
     case_insensitive_unique_fileds = ["name"]
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["name"]
+
     name = models.CharField(
         max_length=100,
         unique=True,
@@ -130,7 +147,13 @@ class ProductType(
         return self.name
 
 
-class Tag(CaseInsensitiveUniqueMixin, CleanvalidateMixin, models.Model):
+class Tag(
+    CaseInsensitiveUniqueMixin,
+    CleanvalidateMixin,
+    TrackOriginalFieldsMixin,
+    UniqueSlugRetryMixin,
+    models.Model,
+):
     """
     Tag table
     """
@@ -138,6 +161,9 @@ class Tag(CaseInsensitiveUniqueMixin, CleanvalidateMixin, models.Model):
     # CaseInsensitiveUniqueMixin
     case_insensitive_unique_fileds = ["name"]
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["name", "slug", "is_active"]
+
     name = models.CharField(
         max_length=50,
         unique=True,
@@ -168,6 +194,8 @@ class Product(
     CaseInsensitiveUniqueMixin,
     PreventDeactivationIfUsedMixin,
     CleanvalidateMixin,
+    TrackOriginalFieldsMixin,
+    UniqueSlugRetryMixin,
     models.Model,
 ):
     """
@@ -183,6 +211,9 @@ class Product(
     # CaseInsensitiveUniqueMixin
     case_insensitive_unique_fileds = ["name"]
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["name", "slug", "is_active", "product_type"]
+
     name = models.CharField(
         max_length=100,
         unique=False,
@@ -224,17 +255,31 @@ class Product(
         auto_now_add=True, editable=False, verbose_name="Created At"
     )
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
+    # name, description, tag and category names; maintained by Product/search.py
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ["name"]
+        indexes = [
+            # keyset pagination of the product list
+            models.Index(fields=["name", "id"], name="product_name_id_idx"),
+            models.Index(fields=["created_at", "id"], name="product_created_id_idx"),
+            GinIndex(fields=["search_vector"], name="product_search_vector_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
 
-class Attribute(CaseInsensitiveUniqueMixin, CleanvalidateMixin, models.Model):
+class Attribute(
+    CaseInsensitiveUniqueMixin,
+    CleanvalidateMixin,
+    TrackOriginalFieldsMixin,
+    UniqueSlugRetryMixin,
+    models.Model,
+):
     """
     Attribute table
     """
@@ -242,6 +287,9 @@ class Attribute(CaseInsensitiveUniqueMixin, CleanvalidateMixin, models.Model):
     # CaseInsensitiveUniqueMixin
     case_insensitive_unique_fileds = ["name"]
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["name"]
+
     product_types = models.ManyToManyField(
         "ProductType",
         related_name="attributes",
@@ -279,11 +327,19 @@ class Attribute(CaseInsensitiveUniqueMixin, CleanvalidateMixin, models.Model):
         ordering = ["name"]
 
 
-class AttributeValue(CleanvalidateMixin, models.Model):
+class AttributeValue(
+    CleanvalidateMixin,
+    TrackOriginalFieldsMixin,
+    UniqueSlugRetryMixin,
+    models.Model,
+):
     """
     AttributeValue
     """
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["value"]
+
     attribute = models.ForeignKey(
         Attribute,
         on_delete=models.CASCADE,
@@ -322,11 +378,14 @@ class AttributeValue(CleanvalidateMixin, models.Model):
         return f"{self.attribute.name}: {self.value}"
 
 
-class ProductVariant(CleanvalidateMixin, models.Model):
+class ProductVariant(CleanvalidateMixin, TrackOriginalFieldsMixin, models.Model):
     """
     ProductVariant table
     """
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["product", "is_active"]
+
     product = models.ForeignKey(
         Product,
         on_delete=models.CASCADE,
@@ -368,11 +427,16 @@ class ProductVariant(CleanvalidateMixin, models.Model):
         return f"{self.product.name if self.product else 'Unknown'} - {self.sku}"
 
 
-class ProductVariantAttributeValue(CleanvalidateMixin, models.Model):
+class ProductVariantAttributeValue(
+    CleanvalidateMixin, TrackOriginalFieldsMixin, models.Model
+):
     """
     ProductVariantAttributeValue table
     """
 
+    # TrackOriginalFieldsMixin
+    tracked_fields = ["attribute_value"]
+
     variant = models.ForeignKey(
         ProductVariant,
         on_delete=models.CASCADE,
@@ -404,6 +468,12 @@ class ProductVariantAttributeValue(CleanvalidateMixin, models.Model):
                 fields=["variant", "attribute"], name="unique_variant_attribute"
             )
         ]
+        indexes = [
+            # facet lookups go from a selected value to its variants
+            models.Index(
+                fields=["attribute_value", "variant"], name="pvav_value_variant_idx"
+            ),
+        ]
 
     def __str__(self):
         return (
@@ -442,3 +512,58 @@ class ProductVariantAttributeValue(CleanvalidateMixin, models.Model):
 
         if errors:
             raise ValidationError(errors)
+
+
+class FacetCount(models.Model):
+    """
+    Precomputed number of active products per attribute value,
+    category subtree and product type.
+
+    ``category`` NULL holds the counts for the whole catalog.
+    Kept current by signals (see Product/facet_counts.py),
+    rebuilt by ``manage.py rebuild_facet_counts``.
+    """
+
+    attribute_value = models.ForeignKey(
+        AttributeValue,
+        on_delete=models.CASCADE,
+        related_name="facet_counts",
+        verbose_name="Attribute Value",
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name="facet_counts",
+        null=True,
+        blank=True,
+        verbose_name="Category",
+    )
+    product_type = models.ForeignKey(
+        ProductType,
+        on_delete=models.CASCADE,
+        related_name="facet_counts",
+        null=True,
+        blank=True,
+        verbose_name="Product Type",
+    )
+    product_count = models.PositiveIntegerField(default=0, verbose_name="Product Count")
+
+    class Meta:
+        verbose_name = "Facet Count"
+        verbose_name_plural = "Facet Counts"
+        constraints = [
+            # one row per cell; NULL category / product type included
+            models.UniqueConstraint(
+                fields=["attribute_value", "category", "product_type"],
+                nulls_distinct=False,
+                name="facetcount_cell_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["category", "product_type"], name="facetcount_scope_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.attribute_value_id} / {self.category_id}: {self.product_count}"
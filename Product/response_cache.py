@@ -0,0 +1,181 @@
+"""
+Full-response cache for anonymous catalog GETs.
+
+Every cached response carries surrogate keys: ``<model>:<pk>`` for each
+object its serializers rendered (see ``SurrogateKeyMixin``), the model
+names of the collections it lists, and ``RESPONSE_VERSION``. Each key is a
+catalog version (see Product.cache), remembered with the entry; purging a
+key bumps its version, and an entry whose versions moved is a miss. Saves
+and deletes purge ``<model>:<pk>`` and ``<model>`` (Product.signals), so an
+edit refreshes the lists and the pages showing that object, nothing else.
+A response rendered while any purge ran is served but not stored.
+"""
+
+import hashlib
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import parse_http_date_safe
+
+from Product.cache import (
+    RESPONSE_VERSION,
+    bump_catalog_version,
+    get_catalog_cache,
+    get_catalog_versions,
+)
+from core.metrics import observe_cache
+
+_collected_keys = ContextVar("surrogate_keys", default=None)
+
+# Moves on every purge. Not stored with the entries, so it expires nothing.
+PURGES = "responses:purges"
+
+# Response headers stored with the content.
+CACHED_HEADERS = ["ETag", "Last-Modified"]
+
+
+def surrogate_key(instance):
+    return f"{instance._meta.model_name}:{instance.pk}"
+
+
+def collection_key(model):
+    return model._meta.model_name
+
+
+def purge(*keys):
+    # PURGES first: a render that reads it unchanged afterwards did not
+    # overlap this purge (see cache_response)
+    bump_catalog_version(PURGES)
+    for key in keys:
+        bump_catalog_version(key)
+
+
+def purge_instance(instance):
+    """
+    Drops the cached responses showing ``instance`` or listing its model.
+    """
+    purge(surrogate_key(instance), collection_key(type(instance)))
+
+
+def purge_all():
+    """
+    Drops every cached response, e.g. after a bulk load that sent no signals.
+    """
+    purge(RESPONSE_VERSION)
+
+
+class SurrogateKeyMixin:
+    """
+    Mixin for serializers to tag the response being cached with the
+    objects they render.
+    """
+
+    def to_representation(self, instance):
+        keys = _collected_keys.get()
+        if keys is not None and getattr(instance, "pk", None) is not None:
+            keys.add(surrogate_key(instance))
+        return super().to_representation(instance)
+
+
+def get_timeout():
+    return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+
+
+def is_cacheable(request):
+    # catalog responses are the same for everybody, but only anonymous
+    # traffic is served from the cache
+    return (
+        request.method == "GET"
+        and "HTTP_AUTHORIZATION" not in request.META
+        and get_timeout() > 0
+    )
+
+
+def response_key(request):
+    raw = f"{request.get_full_path()}|{request.META.get('HTTP_ACCEPT', '')}"
+    digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+    return f"catalog:response:{digest}"
+
+
+def build_response(request, entry):
+    response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    for header, value in entry["headers"].items():
+        response[header] = value
+    patch_vary_headers(response, ["Accept", "Authorization"])
+    return get_conditional_response(
+        request,
+        etag=entry["headers"].get("ETag"),
+        last_modified=parse_http_date_safe(entry["headers"].get("Last-Modified")),
+        response=response,
+    )
+
+
+def cache_response(*collections):
+    """
+    View decorator (for ``dispatch``) serving anonymous GETs from the
+    response cache. ``collections`` are the models whose rows the view
+    lists, so creating or deleting one of them purges the response.
+    """
+    collection_keys = [collection_key(model) for model in collections]
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if not is_cacheable(request):
+                return view(request, *args, **kwargs)
+
+            cache = get_catalog_cache()
+            key = response_key(request)
+            entry = cache.get(key)
+            hit = entry is not None and entry["versions"] == get_catalog_versions(
+                entry["versions"]
+            )
+            observe_cache(RESPONSE_VERSION, hit)
+            if hit:
+                return build_response(request, entry)
+
+            # read before rendering, so an edit made meanwhile is a miss later
+            versions = get_catalog_versions(
+                [PURGES, RESPONSE_VERSION, *collection_keys]
+            )
+            token = _collected_keys.set(set())
+            try:
+                response = view(request, *args, **kwargs)
+                if hasattr(response, "render"):
+                    response.render()
+                keys = _collected_keys.get()
+            finally:
+                _collected_keys.reset(token)
+
+            patch_vary_headers(response, ["Accept", "Authorization"])
+            if response.status_code == 200 and response.get(
+                "Content-Type", ""
+            ).startswith("application/json"):
+                # The surrogate keys are only known now. If anything was
+                # purged while rendering, the body may predate the versions
+                # read here, so it is not stored.
+                current = get_catalog_versions([PURGES, *keys])
+                if current.pop(PURGES) == versions.pop(PURGES):
+                    versions.update(current)
+                    cache.set(
+                        key,
+                        {
+                            "content": response.content,
+                            "content_type": response["Content-Type"],
+                            "headers": {
+                                header: response[header]
+                                for header in CACHED_HEADERS
+                                if response.has_header(header)
+                            },
+                            "versions": versions,
+                        },
+                        get_timeout(),
+                    )
+            return response
+
+        return wrapped
+
+    return decorator
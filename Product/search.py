@@ -0,0 +1,107 @@
+import re
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, OuterRef, Subquery
+from rest_framework import serializers
+from Product.filters import ProductFilterSerializer
+from Product.models import Product
+
+SEARCH_CONFIG = "english"
+
+# Letters and digits of any script; everything else separates terms.
+TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class ProductSearchSerializer(ProductFilterSerializer):
+    """
+    Search text plus the product list filters. Results are ranked,
+    so the list ``ordering`` does not apply.
+    """
+
+    q = serializers.CharField(max_length=200)
+    page_size = serializers.IntegerField(min_value=1, max_value=50, default=20)
+    ordering = None
+
+
+def is_supported():
+    """
+    Full-text search needs PostgreSQL; other backends fall back to ILIKE.
+    """
+    return connection.vendor == "postgresql"
+
+
+def _related_names(through, related_field):
+    return Subquery(
+        through.objects.filter(product_id=OuterRef("pk"))
+        .values("product_id")
+        .annotate(names=StringAgg(f"{related_field}__name", delimiter=" "))
+        .values("names")[:1]
+    )
+
+
+def search_vector():
+    """
+    The document indexed for a product: name (A), tag and category
+    names (B) and description (C).
+    """
+    return (
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(
+            _related_names(Product.tags.through, "tag"),
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector(
+            _related_names(Product.categories.through, "category"),
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vectors(products):
+    """
+    Recomputes the stored ``search_vector`` of ``products`` (a queryset)
+    with a single UPDATE.
+    """
+    if not is_supported():
+        return 0
+    return products.update(search_vector=search_vector())
+
+
+def parse_query(text):
+    """
+    Turns user input into a raw prefix ``tsquery``: every term must match
+    and the terms match word beginnings, so "blu shi" finds "Blue Shirt".
+    Returns ``None`` when there is nothing to search for.
+    """
+    terms = TERM_PATTERN.findall(text.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_products(queryset, text):
+    """
+    Narrows ``queryset`` to products matching ``text``, best matches first.
+    """
+    if not is_supported():
+        terms = TERM_PATTERN.findall(text)
+        for term in terms:
+            queryset = queryset.filter(name__icontains=term)
+        return queryset.order_by("name", "pk") if terms else queryset.none()
+
+    raw_query = parse_query(text)
+    if raw_query is None:
+        return queryset.none()
+
+    query = SearchQuery(raw_query, search_type="raw", config=SEARCH_CONFIG)
+
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "pk")
+    )
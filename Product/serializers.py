@@ -11,14 +11,19 @@ from .models import (
 import re
 from Product import validators
 
+from Product.response_cache import SurrogateKeyMixin
 from core.constraints import SLUG_PATTERN
+from core.instrumentation import TimedSerializerMixin
+from core.mixins import EagerLoadingMixin
 
 ###################################
 # category Serializers
 ###################################
 
 
-class BaseCategorySerializer(serializers.ModelSerializer):
+class BaseCategorySerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """
     Base serializer for Category model.
     Provides basic fields and validation.
@@ -62,11 +67,11 @@ class BaseCategorySerializer(serializers.ModelSerializer):
         if instance and parent and parent == instance:
             raise serializers.ValidationError("Category cannot be its own parent.")
 
-        if instance and parent:
-            if parent in instance.get_descendants():
-                raise serializers.ValidationError(
-                    "Category cannot be a child of its own descendant."
-                )
+        # MPTT interval check, the subtree is not fetched
+        if instance and parent and parent.is_descendant_of(instance):
+            raise serializers.ValidationError(
+                "Category cannot be a child of its own descendant."
+            )
 
         slug = attrs.get("slug")
         if (
@@ -82,6 +87,10 @@ class BaseCategorySerializer(serializers.ModelSerializer):
         return attrs
 
 
+# Denormalized product counts (Product/category_counts.py), for menus.
+CATEGORY_COUNT_FIELDS = ["product_count", "descendant_product_count"]
+
+
 class CategorySerializer(BaseCategorySerializer):
     """
     Serializer for Category Tree.
@@ -91,15 +100,20 @@ class CategorySerializer(BaseCategorySerializer):
 
     class Meta:
         model = BaseCategorySerializer.Meta.model
-        fields = BaseCategorySerializer.Meta.fields + ["children"]
+        fields = (
+            BaseCategorySerializer.Meta.fields + CATEGORY_COUNT_FIELDS + ["children"]
+        )
+        read_only_fields = (
+            BaseCategorySerializer.Meta.read_only_fields + CATEGORY_COUNT_FIELDS
+        )
 
     def get_children(self, obj):
         """
         full nested view of children categories.
+        The whole subtree is fetched with a single query.
         """
-        children = obj.get_children.all()
-        serializer = CategorySerializer(children, many=True)
-        return serializer.data
+        descendants = obj.get_descendants().filter(is_active=True)
+        return build_category_tree(descendants, root_level=obj.mptt_level + 1)
 
 
 class CategoryBasicSerializer(BaseCategorySerializer):
@@ -113,12 +127,56 @@ class CategoryBasicSerializer(BaseCategorySerializer):
         fields = BaseCategorySerializer.Meta.fields
 
 
+class CategoryNodeSerializer(BaseCategorySerializer):
+    """
+    A node of the category tree: the basic fields and the product counts.
+    """
+
+    class Meta:
+        model = BaseCategorySerializer.Meta.model
+        fields = BaseCategorySerializer.Meta.fields + CATEGORY_COUNT_FIELDS
+        read_only_fields = CategorySerializer.Meta.read_only_fields
+
+
+def build_category_tree(categories, root_level=0):
+    """
+    Builds nested category dicts from a flat queryset in one linear pass.
+
+    ``categories`` must be ordered by ``tree_id, lft`` (MPTT pre-order), so
+    every node comes right after its ancestors and ``mptt_level`` tells how
+    deep it sits. Nodes whose parent is missing from the input (e.g. an
+    inactive ancestor) are skipped together with their whole subtree.
+    """
+    categories = list(categories)
+    serialized = CategoryNodeSerializer(categories, many=True).data
+
+    forest = []
+    stack = []
+    for category, data in zip(categories, serialized):
+        depth = category.mptt_level - root_level
+        del stack[depth:]
+        data["children"] = []
+
+        if depth == 0:
+            forest.append(data)
+        elif len(stack) == depth and stack[-1]["id"] == category.parent_id:
+            stack[-1]["children"].append(data)
+        else:
+            continue
+
+        stack.append(data)
+
+    return forest
+
+
 ###################################
 # ProductType Serializers
 ###################################
 
 
-class ProductTypeSerializer(serializers.ModelSerializer):
+class ProductTypeSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """
     Serializer for ProductType model.
     """
@@ -154,7 +212,9 @@ class ProductTypeSerializer(serializers.ModelSerializer):
 ###############################
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """
     Serializer for Tag model.
     """
@@ -190,7 +250,9 @@ class TagSerializer(serializers.ModelSerializer):
 #################################
 
 
-class BasicProductSerializer(serializers.Serializer):
+class BasicProductSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.Serializer
+):
     """
     Basic serializer for Product model.
     """
@@ -205,12 +267,40 @@ class BasicProductSerializer(serializers.Serializer):
     updated_at = serializers.DateTimeField(read_only=True)
 
 
-class ProductReadSerializer(BasicProductSerializer):
+class ProductListSerializer(EagerLoadingMixin, BasicProductSerializer):
+    """
+    List serializer for Product model.
+    Expects ``min_price`` annotated on the queryset.
+    """
+
+    # EagerLoadingMixin
+    select_related_fields = ["product_type"]
+    prefetch_related_fields = ["categories", "tags"]
+
+    product_type = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    categories = serializers.SlugRelatedField(
+        slug_field="slug", many=True, read_only=True
+    )
+    tags = serializers.SlugRelatedField(slug_field="slug", many=True, read_only=True)
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, read_only=True
+    )
+
+
+# The related rows a ProductReadSerializer shows, for conditional GETs.
+PRODUCT_READ_RELATED = ["categories", "tags", "product_type"]
+
+
+class ProductReadSerializer(EagerLoadingMixin, BasicProductSerializer):
     """
     Read serializer for Product model.
     Provides detailed information about the product.
     """
 
+    # EagerLoadingMixin
+    select_related_fields = ["product_type"]
+    prefetch_related_fields = ["categories", "tags"]
+
     categories = CategoryBasicSerializer(many=True, read_only=True)
     product_type = ProductTypeSerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
@@ -268,7 +358,9 @@ class ProductWriteSerializer(BasicProductSerializer):
 ################################
 
 
-class AttributeSerializer(serializers.ModelSerializer):
+class AttributeSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """
     Serializer for Attribute model.
     """
@@ -278,7 +370,15 @@ class AttributeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Attribute
-        fields = ["id", "name", "slug", "is_active", "created_at", "updated_at"]
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "description",
+            "is_filterable",
+            "created_at",
+            "updated_at",
+        ]
         read_only_fields = ["id", "slug", "created_at", "updated_at"]
 
 
@@ -287,7 +387,9 @@ class AttributeSerializer(serializers.ModelSerializer):
 ################################
 
 
-class AttributeValueSerializer(serializers.ModelSerializer):
+class AttributeValueSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """
     Serializer for AttributeValue model.
     """
@@ -311,7 +413,9 @@ class AttributeValueSerializer(serializers.ModelSerializer):
 #################################
 
 
-class ProductVariantSerializer(serializers.Serializer):
+class ProductVariantSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.Serializer
+):
     """
     Serializer for ProductVariant model.
     """
@@ -339,7 +443,9 @@ class ProductVariantSerializer(serializers.Serializer):
         ]
 
 
-class ProductVariantAttributeValueSerializer(serializers.ModelSerializer):
+class ProductVariantAttributeValueSerializer(
+    SurrogateKeyMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """
     ProductVariantAttributeValue serializer
     """
@@ -1,7 +1,31 @@
-from django.db.models.signals import pre_save
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    pre_delete,
+    post_delete,
+    m2m_changed,
+)
 from django.dispatch import receiver
 from django.apps import apps
+from django.utils import timezone
 from core.utils import generate_unique_slug
+from Product.cache import CATEGORY_VERSION, SUGGEST_VERSION, bump_catalog_version
+from Product.response_cache import collection_key, purge, purge_instance
+from Product.search import update_search_vectors
+from Product.category_counts import refresh_category_counts
+from Product.facet_counts import (
+    get_product_category_ids,
+    get_product_value_ids,
+    refresh_facet_counts,
+    refresh_product_facet_counts,
+)
+
+Category = apps.get_model("Product", "Category")
+Tag = apps.get_model("Product", "Tag")
+Product = apps.get_model("Product", "Product")
+ProductVariant = apps.get_model("Product", "ProductVariant")
+ProductVariantAttributeValue = apps.get_model("Product", "ProductVariantAttributeValue")
+
 
 MODEL_CONFIGS = [
     {"app": "Product", "model": "Product", "field": "name"},
@@ -14,14 +38,19 @@ MODEL_CONFIGS = [
 
 
 def register_slug_signal(model_class, field_name):
-    @receiver(pre_save, sender=model_class)
-    def set_slug(sender, instance, **kwargs):
-        if not instance.slug or (
-            instance.pk
-            and sender.objects.filter(pk=instance.pk).exists()
-            and getattr(sender.objects.get(pk=instance.pk), field_name)
-            != getattr(instance, field_name)
-        ):
+    # The receiver is a closure, so it has to be held strongly; a weak
+    # reference would be collected as soon as this function returns.
+    @receiver(
+        pre_save,
+        sender=model_class,
+        weak=False,
+        dispatch_uid=f"set_slug_{model_class._meta.label_lower}",
+    )
+    def set_slug(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        # TrackOriginalFieldsMixin knows the loaded name, no query needed.
+        if not instance.slug or instance.has_field_changed(field_name):
             generate_unique_slug(
                 instance, sender, field_name=field_name, slug_field="slug"
             )
@@ -31,3 +60,338 @@ for config in MODEL_CONFIGS:
     model_class = apps.get_model(config["app"], config["model"])
     field_name = config.get("field", "name")
     register_slug_signal(model_class, field_name)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    bump_catalog_version(CATEGORY_VERSION)
+
+
+# What the suggest index holds of each active product, category and tag.
+SUGGEST_FIELDS = ["name", "slug", "is_active"]
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+def invalidate_suggest_index(sender, instance, created=False, raw=False, **kwargs):
+    if (
+        created
+        or raw
+        or any(instance.has_field_changed(field) for field in SUGGEST_FIELDS)
+    ):
+        bump_catalog_version(SUGGEST_VERSION)
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Tag)
+def drop_suggest_index(sender, **kwargs):
+    bump_catalog_version(SUGGEST_VERSION)
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+@receiver(m2m_changed, sender=Product.categories.through)
+def remember_cleared_pks(sender, instance, action, reverse, model, **kwargs):
+    """
+    ``clear()`` sends no pk_set, and after it the relation is empty,
+    so record which objects are about to be unlinked.
+    """
+    if action != "pre_clear":
+        return
+    if reverse:
+        rows = sender.objects.filter(
+            **{f"{instance._meta.model_name}_id": instance.pk}
+        ).values_list("product_id", flat=True)
+    else:
+        rows = sender.objects.filter(product_id=instance.pk).values_list(
+            f"{model._meta.model_name}_id", flat=True
+        )
+    instance._cleared_pks = set(rows)
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+@receiver(m2m_changed, sender=Product.categories.through)
+def touch_linked_products(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Linking or unlinking a category or tag changes what a product shows,
+    so it moves the product's ``updated_at`` (read by conditional GETs)
+    and purges its cached responses.
+    """
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    product_ids = pk_set if reverse else [instance.pk]
+    if product_ids:
+        Product.objects.filter(pk__in=product_ids).update(updated_at=timezone.now())
+        products = collection_key(Product)
+        purge(products, *(f"{products}:{pk}" for pk in product_ids))
+
+
+###################################
+# response cache
+###################################
+
+RESPONSE_CACHE_MODELS = [
+    "Product",
+    "ProductVariant",
+    "ProductVariantAttributeValue",
+    "ProductType",
+    "Category",
+    "Tag",
+    "Attribute",
+    "AttributeValue",
+]
+
+
+def purge_cached_responses(sender, instance, **kwargs):
+    purge_instance(instance)
+
+
+for model_name in RESPONSE_CACHE_MODELS:
+    model_class = apps.get_model("Product", model_name)
+    for signal in (post_save, post_delete):
+        signal.connect(
+            purge_cached_responses,
+            sender=model_class,
+            dispatch_uid="purge_cached_responses",
+        )
+
+
+###################################
+# facet counts
+###################################
+
+
+@receiver(pre_save, sender=ProductVariantAttributeValue)
+def remember_previous_value(sender, instance, raw=False, **kwargs):
+    instance._previous_value_id = None
+    if not raw and instance.has_field_changed("attribute_value"):
+        instance._previous_value_id = instance.get_original_value("attribute_value")
+
+
+@receiver(post_save, sender=ProductVariantAttributeValue)
+@receiver(post_delete, sender=ProductVariantAttributeValue)
+def refresh_value_facet_counts(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    value_ids = {instance.attribute_value_id}
+    previous_value_id = getattr(instance, "_previous_value_id", None)
+    if previous_value_id:
+        value_ids.add(previous_value_id)
+
+    product_ids = ProductVariant.objects.filter(pk=instance.variant_id).values(
+        "product_id"
+    )
+    refresh_facet_counts(value_ids, get_product_category_ids(product_ids))
+
+
+@receiver(pre_save, sender=ProductVariant)
+def remember_variant_facet_products(sender, instance, raw=False, **kwargs):
+    # Only the product and the activation decide what a variant counts for;
+    # a new variant has no attribute values yet.
+    instance._facet_product_ids = None
+    if raw:
+        return
+    if instance.has_field_changed("product") or instance.has_field_changed("is_active"):
+        instance._facet_product_ids = {
+            instance.product_id,
+            instance.get_original_value("product"),
+        }
+
+
+@receiver(post_save, sender=ProductVariant)
+def refresh_variant_facet_counts(sender, instance, raw=False, **kwargs):
+    product_ids = getattr(instance, "_facet_product_ids", None)
+    if raw or not product_ids:
+        return
+    value_ids = instance.attribute_values.values_list("attribute_value_id", flat=True)
+    refresh_facet_counts(value_ids, get_product_category_ids(product_ids))
+
+
+@receiver(pre_save, sender=Product)
+def remember_product_facet_change(sender, instance, raw=False, **kwargs):
+    # categories are handled by m2m_changed, a new product has no variants
+    instance._facets_changed = not raw and (
+        instance.has_field_changed("is_active")
+        or instance.has_field_changed("product_type")
+    )
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_facets(sender, instance, raw=False, **kwargs):
+    if getattr(instance, "_facets_changed", False):
+        refresh_product_facet_counts([instance.pk])
+
+
+@receiver(pre_delete, sender=Product)
+def remember_product_facets(sender, instance, **kwargs):
+    # The M2M rows are gone by post_delete, so collect the cells now.
+    instance._facet_cells = (
+        get_product_value_ids([instance.pk]),
+        get_product_category_ids([instance.pk]),
+    )
+
+
+@receiver(post_delete, sender=Product)
+def refresh_deleted_product_facets(sender, instance, **kwargs):
+    value_ids, category_ids = getattr(instance, "_facet_cells", ((), ()))
+    refresh_facet_counts(value_ids, category_ids)
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+def refresh_category_facets(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    if reverse:
+        refresh_facet_counts(get_product_value_ids(pk_set), [instance.pk])
+    else:
+        refresh_facet_counts(get_product_value_ids([instance.pk]), pk_set)
+
+
+def get_subtree_value_ids(category):
+    products = Product.categories.through.objects.filter(
+        category__tree_id=category.tree_id,
+        category__lft__gte=category.lft,
+        category__rght__lte=category.rght,
+    ).values("product_id")
+    return get_product_value_ids(products)
+
+
+@receiver(pre_save, sender=Category)
+def remember_previous_parent(sender, instance, raw=False, **kwargs):
+    instance._moved_from = None
+    if not raw and instance.has_field_changed("parent"):
+        instance._moved_from = {instance.get_original_value("parent")} - {None}
+
+
+@receiver(post_save, sender=Category)
+def refresh_moved_category_facets(sender, instance, raw=False, **kwargs):
+    moved_from = getattr(instance, "_moved_from", None)
+    if raw or moved_from is None:
+        return
+    # Counts of the old and the new ancestors both change.
+    refresh_facet_counts(get_subtree_value_ids(instance), moved_from | {instance.pk})
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_facets(sender, instance, **kwargs):
+    instance._facet_cells = (
+        get_subtree_value_ids(instance),
+        set(instance.get_ancestors().values_list("pk", flat=True)),
+    )
+
+
+@receiver(post_delete, sender=Category)
+def refresh_deleted_category_facets(sender, instance, **kwargs):
+    value_ids, category_ids = getattr(instance, "_facet_cells", ((), ()))
+    refresh_facet_counts(value_ids, category_ids)
+
+
+###################################
+# search vectors
+###################################
+
+
+@receiver(post_save, sender=Product)
+def refresh_search_vector(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_search_vectors(sender.objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+@receiver(m2m_changed, sender=Product.categories.through)
+def refresh_related_search_vectors(sender, instance, action, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        if action == "post_clear":
+            product_ids = getattr(instance, "_cleared_pks", set())
+        else:
+            product_ids = kwargs["pk_set"]
+        update_search_vectors(Product.objects.filter(pk__in=product_ids))
+    else:
+        update_search_vectors(Product.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Tag)
+def refresh_tag_search_vectors(sender, instance, created=False, raw=False, **kwargs):
+    # only the name is indexed; the originals are still the loaded values here
+    if not created and not raw and instance.has_field_changed("name"):
+        update_search_vectors(Product.objects.filter(tags=instance))
+
+
+@receiver(post_save, sender=Category)
+def refresh_category_search_vectors(
+    sender, instance, created=False, raw=False, **kwargs
+):
+    if not created and not raw and instance.has_field_changed("name"):
+        update_search_vectors(Product.objects.filter(categories=instance))
+
+
+###################################
+# category product counts
+###################################
+
+
+@receiver(pre_save, sender=Product)
+def remember_activation_change(sender, instance, raw=False, **kwargs):
+    instance._activation_changed = not raw and instance.has_field_changed("is_active")
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_category_counts(sender, instance, raw=False, **kwargs):
+    # a new product has no categories yet, linking it sends m2m_changed
+    if getattr(instance, "_activation_changed", False):
+        refresh_category_counts(get_product_category_ids([instance.pk]))
+
+
+@receiver(pre_delete, sender=Product)
+def remember_product_categories(sender, instance, **kwargs):
+    instance._counted_category_ids = get_product_category_ids([instance.pk])
+
+
+@receiver(post_delete, sender=Product)
+def refresh_deleted_product_category_counts(sender, instance, **kwargs):
+    refresh_category_counts(getattr(instance, "_counted_category_ids", ()))
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+def refresh_linked_category_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_pks", set())
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    if reverse:
+        if pk_set:
+            refresh_category_counts([instance.pk])
+    else:
+        refresh_category_counts(pk_set)
+
+
+@receiver(post_save, sender=Category)
+def refresh_moved_category_counts(sender, instance, raw=False, **kwargs):
+    moved_from = getattr(instance, "_moved_from", None)
+    if raw or moved_from is None:
+        return
+    # the old and the new ancestors both change
+    refresh_category_counts(moved_from | {instance.pk})
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_ancestors(sender, instance, **kwargs):
+    instance._counted_category_ids = set(
+        instance.get_ancestors().values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Category)
+def refresh_deleted_category_counts(sender, instance, **kwargs):
+    refresh_category_counts(getattr(instance, "_counted_category_ids", ()))
@@ -0,0 +1,108 @@
+import threading
+from bisect import bisect_left
+
+from rest_framework import serializers
+from Product.cache import SUGGEST_VERSION, get_catalog_version
+from Product.models import Category, Product, Tag
+
+
+class SuggestQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the typeahead endpoint.
+    """
+
+    q = serializers.CharField(max_length=100, trim_whitespace=True)
+    limit = serializers.IntegerField(min_value=1, max_value=25, default=10)
+
+
+class SuggestIndex:
+    """
+    In-memory prefix index over catalog names.
+
+    Every word of a name is a key pointing at its offset in the normalized
+    name ("blue" at 0 and "shirt" at 5 for "Blue Shirt"), kept in sorted
+    parallel lists, so memory grows with the number of words. A lookup is
+    a binary search for the first term of the prefix plus a scan over the
+    matching run, comparing the rest of the prefix against the name from
+    that offset. Shorter remainders come first, so whole-name matches
+    lead.
+    """
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.names = []
+        rows = []
+        for position, (name, kind, slug) in enumerate(self.entries):
+            words = name.casefold().split()
+            normalized = " ".join(words)
+            self.names.append(normalized)
+            offset = 0
+            for word in words:
+                rows.append((word, len(normalized) - offset, position, offset))
+                offset += len(word) + 1
+        rows.sort()
+
+        self.words = [word for word, _, _, _ in rows]
+        self.positions = [position for _, _, position, _ in rows]
+        self.offsets = [offset for _, _, _, offset in rows]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, prefix, limit=10):
+        terms = prefix.casefold().split()
+        if not terms:
+            return []
+        prefix = " ".join(terms)
+
+        results = []
+        seen = set()
+        for row in range(bisect_left(self.words, terms[0]), len(self.words)):
+            if not self.words[row].startswith(terms[0]):
+                break
+            position = self.positions[row]
+            if position in seen or not self.names[position].startswith(
+                prefix, self.offsets[row]
+            ):
+                continue
+            seen.add(position)
+            name, kind, slug = self.entries[position]
+            results.append({"name": name, "type": kind, "slug": slug})
+            if len(results) == limit:
+                break
+        return results
+
+
+def build_index():
+    entries = []
+    for kind, model in (("category", Category), ("tag", Tag), ("product", Product)):
+        names = model.objects.filter(is_active=True).values_list("name", "slug")
+        entries.extend((name, kind, slug) for name, slug in names.iterator())
+    return SuggestIndex(entries)
+
+
+_lock = threading.Lock()
+_index = None
+_index_version = None
+
+
+def get_index():
+    """
+    Returns the process-wide index, rebuilding it when the catalog
+    version has moved on. A current index costs one cache read.
+    """
+    global _index, _index_version
+
+    version = get_catalog_version(SUGGEST_VERSION)
+    if _index is not None and _index_version == version:
+        return _index
+
+    with _lock:
+        if _index is None or _index_version != version:
+            _index = build_index()
+            _index_version = version
+    return _index
+
+
+def suggest(prefix, limit=10):
+    return get_index().lookup(prefix, limit=limit)
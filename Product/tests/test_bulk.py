@@ -0,0 +1,74 @@
+from decimal import Decimal
+from django.test import TestCase
+from Product.models import Product, ProductType, ProductVariant, Tag
+from core.bulk import BatchValidationError, bulk_save, validate_batch
+
+
+class BulkSaveTests(TestCase):
+    def setUp(self):
+        self.shirt = ProductType.objects.create(name="Shirt", slug="shirt")
+        self.existing = Product.objects.create(name="Blue Shirt", slug="blue-shirt")
+
+    def products(self, count):
+        return [
+            Product(name=f"Product {i}", slug=f"product-{i}", product_type=self.shirt)
+            for i in range(count)
+        ]
+
+    def test_validation_queries_do_not_grow_with_the_batch(self):
+        # product type, slug uniqueness, case-insensitive name
+        with self.assertNumQueries(3):
+            validate_batch(Product, self.products(5))
+        with self.assertNumQueries(3):
+            validate_batch(Product, self.products(50))
+
+    def test_clashes_with_the_table_and_within_the_batch(self):
+        products = self.products(3)
+        products[0].name = "BLUE SHIRT "
+        products[2].slug = products[1].slug
+
+        with self.assertRaises(BatchValidationError) as context:
+            validate_batch(Product, products)
+
+        errors = context.exception.errors
+        self.assertEqual(sorted(errors), [0, 2])
+        self.assertIn("name", errors[0].message_dict)
+        self.assertIn("slug", errors[2].message_dict)
+        self.assertEqual(products[0].name, "BLUE SHIRT")
+
+    def test_missing_foreign_key(self):
+        variant = ProductVariant(
+            product_id=self.existing.pk + 100, sku="X-1", price=Decimal("1.00")
+        )
+        with self.assertRaises(BatchValidationError) as context:
+            validate_batch(ProductVariant, [variant])
+        self.assertIn("product", context.exception.errors[0].message_dict)
+
+    def test_deactivation_of_used_objects(self):
+        ProductVariant.objects.create(
+            product=self.existing, sku="BS-1", price=Decimal("1.00"), stock=1
+        )
+        self.existing.is_active = False
+
+        with self.assertRaises(BatchValidationError) as context:
+            validate_batch(Product, [self.existing])
+        self.assertEqual(list(context.exception.errors), [0])
+
+    def test_creates_and_updates(self):
+        tags = [Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(3)]
+        renamed = Tag.objects.create(name="Summer", slug="summer")
+        renamed.name = "Winter"
+
+        created, updated = Tag.bulk_save(tags + [renamed])
+
+        self.assertEqual(len(created), 3)
+        self.assertEqual(updated, [renamed])
+        self.assertEqual(Tag.objects.get(slug="summer").name, "Winter")
+        self.assertEqual(Tag.objects.filter(slug__startswith="tag-").count(), 3)
+
+    def test_nothing_is_written_when_one_instance_is_invalid(self):
+        tags = [Tag(name="Autumn", slug="autumn"), Tag(name="Spring", slug="bad slug")]
+
+        with self.assertRaises(BatchValidationError):
+            bulk_save(Tag, tags)
+        self.assertFalse(Tag.objects.filter(name="Autumn").exists())
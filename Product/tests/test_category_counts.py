@@ -0,0 +1,151 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from Product.cache import get_catalog_cache
+from Product.category_counts import rebuild_category_counts
+from Product.models import Category, Product
+
+
+class CategoryCountMaintenanceTests(TestCase):
+    """
+    Every change is checked against a full rebuild: the incremental
+    updates must leave the counts exactly as a rebuild would.
+    """
+
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.clothes = Category.objects.create(name="Clothes", slug="clothes")
+        self.men = Category.objects.create(name="Men", slug="men", parent=self.clothes)
+        self.women = Category.objects.create(
+            name="Women", slug="women", parent=self.clothes
+        )
+        self.sale = Category.objects.create(name="Sale", slug="sale")
+
+        self.alpha = self.create_product("Alpha", [self.men, self.women])
+        self.bravo = self.create_product("Bravo", [self.men])
+
+    def create_product(self, name, categories):
+        product = Product.objects.create(name=name, slug=name.lower())
+        product.categories.set(categories)
+        return product
+
+    def snapshot(self):
+        return list(
+            Category.objects.order_by("pk").values_list(
+                "pk", "product_count", "descendant_product_count"
+            )
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = self.snapshot()
+        Category.objects.update(product_count=0, descendant_product_count=0)
+        rebuild_category_counts()
+        self.assertEqual(incremental, self.snapshot())
+
+    def counts(self, category):
+        category = Category.objects.get(pk=category.pk)
+        return category.product_count, category.descendant_product_count
+
+    def test_counts_include_the_whole_subtree_once(self):
+        self.assertEqual(self.counts(self.men), (2, 2))
+        self.assertEqual(self.counts(self.women), (1, 1))
+        self.assertEqual(self.counts(self.clothes), (0, 2))
+        self.assertEqual(self.counts(self.sale), (0, 0))
+        self.assertMatchesRebuild()
+
+    def test_product_activation(self):
+        self.alpha.is_active = False
+        self.alpha.save()
+        self.assertEqual(self.counts(self.clothes), (0, 1))
+        self.assertEqual(self.counts(self.women), (0, 0))
+        self.assertMatchesRebuild()
+
+        self.alpha.is_active = True
+        self.alpha.save()
+        self.assertEqual(self.counts(self.clothes), (0, 2))
+        self.assertMatchesRebuild()
+
+    def test_category_membership_changes(self):
+        self.alpha.categories.add(self.sale)
+        self.assertEqual(self.counts(self.sale), (1, 1))
+        self.assertMatchesRebuild()
+
+        self.alpha.categories.remove(self.men)
+        self.assertEqual(self.counts(self.men), (1, 1))
+        self.assertMatchesRebuild()
+
+        self.alpha.categories.clear()
+        self.assertEqual(self.counts(self.clothes), (0, 1))
+        self.assertMatchesRebuild()
+
+        self.sale.products.add(self.bravo)
+        self.assertEqual(self.counts(self.sale), (1, 1))
+        self.assertMatchesRebuild()
+
+        self.men.products.clear()
+        self.assertEqual(self.counts(self.clothes), (0, 0))
+        self.assertMatchesRebuild()
+
+    def test_product_delete(self):
+        self.alpha.delete()
+        self.assertEqual(self.counts(self.clothes), (0, 1))
+        self.assertMatchesRebuild()
+
+    def test_category_move_and_delete(self):
+        self.men.parent = self.sale
+        self.men.save()
+        self.assertEqual(self.counts(self.sale), (0, 2))
+        self.assertEqual(self.counts(self.clothes), (0, 1))
+        self.assertMatchesRebuild()
+
+        self.sale.delete()
+        self.assertMatchesRebuild()
+
+    def test_unrelated_product_edit_keeps_the_category_cache(self):
+        client = APIClient()
+        url = reverse("category-tree")
+        response = client.get(url)
+
+        self.alpha.name = "Alpha Shirt"
+        self.alpha.save()
+        self.assertEqual(
+            client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304
+        )
+
+    def test_counts_are_shown(self):
+        client = APIClient()
+        tree = client.get(reverse("category-tree")).json()
+        clothes = next(node for node in tree if node["slug"] == "clothes")
+        self.assertEqual(clothes["descendant_product_count"], 2)
+        self.assertEqual(clothes["children"][0]["product_count"], 2)
+
+        self.men.products.remove(self.bravo)
+        detail = client.get(reverse("category-detail", kwargs={"slug": "clothes"}))
+        self.assertEqual(detail.json()["descendant_product_count"], 1)
+        self.assertEqual(detail.json()["children"][0]["product_count"], 1)
+
+    def test_count_changes_keep_the_dropdown_and_breadcrumbs(self):
+        client = APIClient()
+        urls = [
+            reverse("category-dropdown"),
+            reverse("category-breadcrumbs", kwargs={"slug": "men"}),
+        ]
+        etags = [client.get(url)["ETag"] for url in urls]
+        tree = client.get(reverse("category-tree"))
+
+        self.alpha.is_active = False
+        self.alpha.save()
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+        response = client.get(reverse("category-tree"), HTTP_IF_NONE_MATCH=tree["ETag"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_rebuild_command(self):
+        Category.objects.update(product_count=0, descendant_product_count=0)
+        out = StringIO()
+        call_command("rebuild_category_counts", stdout=out)
+        self.assertEqual(self.counts(self.clothes), (0, 2))
+        self.assertIn("Updated the counts of 3 categories.", out.getvalue())
@@ -0,0 +1,177 @@
+import os
+import tempfile
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from Product.cache import get_catalog_cache
+from Product.category_counts import rebuild_category_counts
+from Product.category_moves import CategoryMoveError, move_categories
+from Product.models import Category, Product
+
+
+class MoveCategoriesTests(TestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.electronics = Category.objects.create(
+            name="Electronics", slug="electronics"
+        )
+        self.phones = Category.objects.create(
+            name="Phones", slug="phones", parent=self.electronics
+        )
+        self.android = Category.objects.create(
+            name="Android", slug="android", parent=self.phones
+        )
+        Category.objects.create(name="Laptops", slug="laptops", parent=self.electronics)
+        self.books = Category.objects.create(name="Books", slug="books")
+        self.clothes = Category.objects.create(name="Clothes", slug="clothes")
+        Category.objects.create(name="Men", slug="men", parent=self.clothes)
+
+        self.pixel = Product.objects.create(name="Pixel", slug="pixel")
+        self.pixel.categories.add(self.android)
+
+    def snapshot(self):
+        return list(
+            Category.objects.order_by("pk").values_list(
+                "pk", "parent_id", "tree_id", "lft", "rght", "mptt_level"
+            )
+        )
+
+    def assertMatchesRebuild(self):
+        moved = self.snapshot()
+        Category.objects.rebuild()
+        self.assertEqual(moved, self.snapshot())
+
+    def parent_slug(self, slug):
+        return (
+            Category.objects.filter(slug=slug)
+            .values_list("parent__slug", flat=True)
+            .get()
+        )
+
+    def test_moves_subtrees(self):
+        stats = move_categories([("phones", "books"), ("laptops", None)])
+
+        self.assertEqual(stats["moved"], 2)
+        self.assertEqual(self.parent_slug("phones"), "books")
+        self.assertIsNone(self.parent_slug("laptops"))
+        books = Category.objects.get(slug="books")
+        self.assertEqual(
+            [category.slug for category in books.get_descendants()],
+            ["phones", "android"],
+        )
+        self.assertMatchesRebuild()
+
+    def test_root_moved_under_another_tree(self):
+        move_categories([("clothes", "android"), ("books", "men")])
+        self.assertEqual(
+            [
+                category.slug
+                for category in Category.objects.get(slug="android").get_descendants()
+            ],
+            ["clothes", "men", "books"],
+        )
+        self.assertMatchesRebuild()
+
+    def test_counts_follow_the_move(self):
+        move_categories([("phones", "books")])
+
+        books = Category.objects.get(slug="books")
+        electronics = Category.objects.get(slug="electronics")
+        self.assertEqual(books.descendant_product_count, 1)
+        self.assertEqual(electronics.descendant_product_count, 0)
+
+        counts = list(
+            Category.objects.order_by("pk").values_list(
+                "product_count", "descendant_product_count"
+            )
+        )
+        rebuild_category_counts()
+        self.assertEqual(
+            counts,
+            list(
+                Category.objects.order_by("pk").values_list(
+                    "product_count", "descendant_product_count"
+                )
+            ),
+        )
+
+    def test_cycles_are_rejected(self):
+        before = self.snapshot()
+        with self.assertRaisesMessage(
+            CategoryMoveError, "'electronics' cannot be moved under its own descendant"
+        ):
+            move_categories([("electronics", "android")])
+
+        # a cycle made of two moves
+        with self.assertRaises(CategoryMoveError):
+            move_categories([("books", "clothes"), ("clothes", "books")])
+        self.assertEqual(before, self.snapshot())
+
+    def test_invalid_moves_are_all_reported(self):
+        with self.assertRaises(CategoryMoveError) as error:
+            move_categories(
+                [
+                    ("nope", "books"),
+                    ("books", "nope"),
+                    ("books", "books"),
+                    ("men", None),
+                    ("men", "books"),
+                ]
+            )
+        self.assertEqual(
+            str(error.exception).splitlines(),
+            [
+                "Line 1: unknown category 'nope'.",
+                "Line 2: unknown parent 'nope'.",
+                "Line 3: 'books' cannot be its own parent.",
+                "Line 5: 'men' is moved twice.",
+            ],
+        )
+
+    def test_one_update_for_the_tree(self):
+        for i in range(20):
+            Category.objects.create(
+                name=f"Shelf {i:02}", slug=f"shelf-{i}", parent=self.books
+            )
+        moves = [(f"shelf-{i}", "clothes") for i in range(20)]
+
+        with CaptureQueriesContext(connection) as queries:
+            move_categories(moves)
+        tree_updates = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "Product_category"')
+        ]
+        # the tree fields, then the product counts
+        self.assertIn(len(tree_updates), (1, 2))
+        self.assertEqual(
+            Category.objects.get(slug="clothes").get_descendant_count(), 21
+        )
+        self.assertMatchesRebuild()
+
+    def test_command(self):
+        file = tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        )
+        file.write("category,parent\nphones,books\nmen,\n")
+        file.close()
+        self.addCleanup(os.unlink, file.name)
+
+        out = StringIO()
+        call_command("move_categories", file.name, stdout=out)
+        self.assertIn("Moved 2 categories", out.getvalue())
+        self.assertEqual(self.parent_slug("phones"), "books")
+        self.assertIsNone(self.parent_slug("men"))
+
+    def test_command_errors(self):
+        file = tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        )
+        file.write("category,parent\nelectronics,phones\n")
+        file.close()
+        self.addCleanup(os.unlink, file.name)
+
+        with self.assertRaisesMessage(CommandError, "Nothing was moved."):
+            call_command("move_categories", file.name, stdout=StringIO())
@@ -0,0 +1,64 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from Product.models import Category
+from Product.serializers import CategoryBasicSerializer
+
+
+class CategoryCycleCheckTests(TestCase):
+    def setUp(self):
+        self.electronics = Category.objects.create(
+            name="Electronics", slug="electronics"
+        )
+        self.phones = Category.objects.create(
+            name="Phones", slug="phones", parent=self.electronics
+        )
+        self.android = Category.objects.create(
+            name="Android", slug="android", parent=self.phones
+        )
+        self.books = Category.objects.create(name="Books", slug="books")
+
+    def load(self, slug):
+        return Category.objects.get(slug=slug)
+
+    def test_clean_rejects_a_descendant_as_parent(self):
+        electronics = self.load("electronics")
+        electronics.parent = self.load("android")
+        with self.assertRaisesMessage(
+            ValidationError, "Category cannot be a child of its own descendant."
+        ):
+            electronics.clean()
+
+    def test_clean_accepts_other_parents(self):
+        phones = self.load("phones")
+        phones.parent = self.load("books")
+        phones.clean()
+
+        android = self.load("android")
+        android.parent = self.load("electronics")
+        android.clean()
+
+    def test_serializer_rejects_a_descendant_as_parent(self):
+        serializer = CategoryBasicSerializer(
+            self.load("electronics"),
+            data={"parent": self.android.pk},
+            partial=True,
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("descendant", str(serializer.errors))
+
+        serializer = CategoryBasicSerializer(
+            self.load("phones"), data={"parent": self.books.pk}, partial=True
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_clean_does_not_load_the_subtree(self):
+        for i in range(20):
+            Category.objects.create(
+                name=f"Phone {i:02}", slug=f"phone-{i}", parent=self.load("phones")
+            )
+        electronics = self.load("electronics")
+        electronics.parent = self.load("books")
+
+        # the case-insensitive name check only
+        with self.assertNumQueries(1):
+            electronics.clean()
@@ -0,0 +1,231 @@
+from decimal import Decimal
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.models import Category, Product, ProductVariant
+from Product.cache import get_catalog_cache
+
+
+class CategoryTreeViewTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.url = reverse("category-tree")
+
+        self.electronics = Category.objects.create(
+            name="Electronics", slug="electronics"
+        )
+        self.phones = Category.objects.create(
+            name="Phones", slug="phones", parent=self.electronics
+        )
+        self.android = Category.objects.create(
+            name="Android", slug="android", parent=self.phones
+        )
+        self.laptops = Category.objects.create(
+            name="Laptops", slug="laptops", parent=self.electronics
+        )
+        self.books = Category.objects.create(name="Books", slug="books")
+
+    def test_tree_is_nested(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        tree = response.json()
+        names = [node["name"] for node in tree]
+        self.assertEqual(names, ["Books", "Electronics"])
+
+        electronics = tree[1]
+        self.assertEqual(
+            [child["name"] for child in electronics["children"]],
+            ["Laptops", "Phones"],
+        )
+        phones = electronics["children"][1]
+        self.assertEqual(phones["children"][0]["slug"], "android")
+        self.assertEqual(phones["children"][0]["children"], [])
+
+    def test_inactive_subtree_is_hidden(self):
+        self.phones.is_active = False
+        self.phones.save()
+
+        response = self.client.get(self.url)
+        electronics = response.json()[1]
+        self.assertEqual(
+            [child["name"] for child in electronics["children"]], ["Laptops"]
+        )
+
+    def test_tree_uses_single_query(self):
+        for i in range(5):
+            Category.objects.create(
+                name=f"Accessory {i}", slug=f"accessory-{i}", parent=self.android
+            )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_tree_is_served_from_cache(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+
+    def test_category_save_invalidates_cache(self):
+        self.client.get(self.url)
+
+        self.books.name = "Novels"
+        self.books.save()
+
+        response = self.client.get(self.url)
+        self.assertIn("Novels", [node["name"] for node in response.json()])
+
+
+class CategoryDropdownViewTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.url = reverse("category-dropdown")
+        self.root = Category.objects.create(name="Electronics", slug="electronics")
+        Category.objects.create(name="Phones", slug="phones", parent=self.root)
+
+    def test_dropdown_lists_roots(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([node["slug"] for node in response.json()], ["electronics"])
+
+    def test_category_delete_invalidates_cache(self):
+        self.client.get(self.url)
+        self.root.delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json(), [])
+
+
+class CategoryDetailViewTests(APITestCase):
+    def setUp(self):
+        self.root = Category.objects.create(name="Electronics", slug="electronics")
+        self.child = Category.objects.create(
+            name="Phones", slug="phones", parent=self.root
+        )
+        Category.objects.create(name="Android", slug="android", parent=self.child)
+
+    def test_detail_includes_children(self):
+        url = reverse("category-detail", kwargs={"slug": self.root.slug})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["children"][0]["name"], "Phones")
+        self.assertEqual(response.data["children"][0]["children"][0]["name"], "Android")
+
+
+class CategoryBreadcrumbsViewTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.electronics = Category.objects.create(
+            name="Electronics", slug="electronics"
+        )
+        self.phones = Category.objects.create(
+            name="Phones", slug="phones", parent=self.electronics
+        )
+        Category.objects.create(name="Android", slug="android", parent=self.phones)
+        Category.objects.create(name="Laptops", slug="laptops", parent=self.electronics)
+        Category.objects.create(name="Books", slug="books")
+        self.url = reverse("category-breadcrumbs", kwargs={"slug": "android"})
+
+    def test_path_from_the_root(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [crumb["slug"] for crumb in response.json()],
+            ["electronics", "phones", "android"],
+        )
+        self.assertEqual(set(response.json()[0]), {"id", "name", "slug"})
+
+    def test_root_category(self):
+        response = self.client.get(
+            reverse("category-breadcrumbs", kwargs={"slug": "books"})
+        )
+        self.assertEqual([crumb["slug"] for crumb in response.json()], ["books"])
+
+    def test_cached_path_costs_no_queries(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()), 3)
+
+    def test_rename_refreshes_the_path(self):
+        self.client.get(self.url)
+        self.phones.refresh_from_db()  # stale lft/rght would corrupt the tree
+        self.phones.name = "Mobile Phones"
+        self.phones.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()[1]["name"], "Mobile Phones")
+
+    def test_unknown_category(self):
+        response = self.client.get(
+            reverse("category-breadcrumbs", kwargs={"slug": "nope"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CategoryProductsViewTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.electronics = Category.objects.create(
+            name="Electronics", slug="electronics"
+        )
+        self.phones = Category.objects.create(
+            name="Phones", slug="phones", parent=self.electronics
+        )
+        self.android = Category.objects.create(
+            name="Android", slug="android", parent=self.phones
+        )
+        self.books = Category.objects.create(name="Books", slug="books")
+
+        self.create_product("Pixel", [self.android], price="500.00")
+        # linked twice inside the subtree, listed once
+        self.create_product("Galaxy", [self.phones, self.android], price="900.00")
+        self.create_product("Television", [self.electronics])
+        self.create_product("Novel", [self.books])
+        self.url = reverse("category-products", kwargs={"slug": "electronics"})
+
+    def create_product(self, name, categories, price="10.00"):
+        product = Product.objects.create(name=name, slug=name.lower())
+        product.categories.set(categories)
+        variant = ProductVariant(
+            product=product, sku=f"{name}-1", price=Decimal(price), stock=5
+        )
+        variant.save(skip_validation=True)
+        return product
+
+    def names(self, response):
+        return [product["name"] for product in response.data["results"]]
+
+    def test_lists_the_whole_subtree_once(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.names(response), ["Galaxy", "Pixel", "Television"])
+
+        response = self.client.get(
+            reverse("category-products", kwargs={"slug": "phones"})
+        )
+        self.assertEqual(self.names(response), ["Galaxy", "Pixel"])
+
+    def test_pagination_and_filters(self):
+        response = self.client.get(self.url, {"page_size": 2, "ordering": "-name"})
+        self.assertEqual(self.names(response), ["Television", "Pixel"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.names(response), ["Galaxy"])
+
+        response = self.client.get(self.url, {"max_price": "600"})
+        self.assertEqual(self.names(response), ["Pixel", "Television"])
+
+    def test_query_count(self):
+        # category, page, categories, tags
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+    def test_unknown_or_inactive_category(self):
+        response = self.client.get(
+            reverse("category-products", kwargs={"slug": "nope"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,128 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.cache import get_catalog_cache
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    Category,
+    Product,
+    Tag,
+)
+
+
+# without the response cache, which would answer before the views
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.summer = Tag.objects.create(name="Summer", slug="summer")
+        self.men = Category.objects.create(name="Men", slug="men")
+        self.shirt = Product.objects.create(name="Shirt", slug="shirt")
+        self.shirt.tags.add(self.summer)
+        self.shirt.categories.add(self.men)
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_unchanged_list_is_not_modified(self):
+        url = reverse("tag-list")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.has_header("Last-Modified"))
+
+        # one aggregate query, nothing loaded or serialized
+        with self.assertNumQueries(1):
+            revalidated = self.revalidate(url, response)
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(revalidated.content, b"")
+
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(since.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_added_and_deleted_rows_change_the_etag(self):
+        url = reverse("tag-list")
+        response = self.client.get(url)
+
+        winter = Tag.objects.create(name="Winter", slug="winter")
+        changed = self.revalidate(url, response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(changed.json()), 2)
+
+        winter.delete()
+        self.assertEqual(self.revalidate(url, changed).status_code, status.HTTP_200_OK)
+
+    def test_product_detail_follows_links_and_related_rows(self):
+        url = reverse("product-detail", kwargs={"slug": "shirt"})
+        response = self.client.get(url)
+        self.assertEqual(
+            self.revalidate(url, response).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.shirt.tags.remove(self.summer)
+        response_after_unlink = self.revalidate(url, response)
+        self.assertEqual(response_after_unlink.status_code, status.HTTP_200_OK)
+
+        self.men.name = "Menswear"
+        self.men.save()
+        self.assertEqual(
+            self.revalidate(url, response_after_unlink).status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_products_by_tag(self):
+        url = reverse("products-by-tag", kwargs={"slug": "summer"})
+        response = self.client.get(url)
+        self.assertEqual(
+            self.revalidate(url, response).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        other = Product.objects.create(name="Shorts", slug="shorts")
+        self.summer.products.add(other)
+        self.assertEqual(self.revalidate(url, response).status_code, status.HTTP_200_OK)
+
+    def test_attribute_with_values(self):
+        color = Attribute.objects.create(name="Color", slug="color")
+        red = AttributeValue.objects.create(attribute=color, value="Red", slug="red")
+        url = reverse("attribute-with-values", kwargs={"slug": "color"})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["attribute"]["slug"], "color")
+        self.assertEqual(
+            self.revalidate(url, response).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        red.value = "Crimson"
+        red.save()
+        changed = self.revalidate(url, response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+        # deleting a value that is not the latest one
+        AttributeValue.objects.create(attribute=color, value="Blue", slug="blue")
+        changed = self.client.get(url)
+        red.delete()
+        self.assertEqual(self.revalidate(url, changed).status_code, status.HTTP_200_OK)
+
+    def test_attribute_list(self):
+        Attribute.objects.create(name="Color", slug="color")
+        response = self.client.get(reverse("attribute-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["slug"] for item in response.json()], ["color"])
+
+    def test_category_tree_revalidates_without_queries(self):
+        url = reverse("category-tree")
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            revalidated = self.revalidate(url, response)
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Category.objects.create(name="Women", slug="women")
+        self.assertEqual(self.revalidate(url, response).status_code, status.HTTP_200_OK)
+
+    def test_missing_object_has_no_etag(self):
+        response = self.client.get(reverse("tag-detail", kwargs={"slug": "nope"}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header("ETag"))
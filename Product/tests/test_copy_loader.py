@@ -0,0 +1,95 @@
+import io
+import json
+from unittest import skipUnless
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from Product.models import Category, Product, ProductVariant
+from core.copy_loader import (
+    FixtureLoadError,
+    FixtureSpooler,
+    copy_text,
+    iter_json_array,
+)
+
+FIXTURES = "seeders/Fake_data"
+
+
+class IterJsonArrayTests(SimpleTestCase):
+    def test_elements_are_read_across_chunks(self):
+        objects = [{"pk": i, "fields": {"name": f"n{i}, [x]"}} for i in range(20)]
+        file = io.StringIO(json.dumps(objects, indent=2))
+        self.assertEqual(list(iter_json_array(file, chunk_size=7)), objects)
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array(io.StringIO(" [ ] "))), [])
+
+    def test_unclosed_array(self):
+        with self.assertRaises(FixtureLoadError):
+            list(iter_json_array(io.StringIO('[{"pk": 1}, {"pk"'), chunk_size=4))
+
+
+class CopyTextTests(SimpleTestCase):
+    def test_values(self):
+        self.assertEqual(copy_text(None), "\\N")
+        self.assertEqual(copy_text(True), "t")
+        self.assertEqual(copy_text("a\tb\nc\\"), "a\\tb\\nc\\\\")
+
+
+class FixtureSpoolerTests(SimpleTestCase):
+    def test_tables_follow_foreign_key_order(self):
+        spooler = FixtureSpooler()
+        self.addCleanup(spooler.close)
+        objects = [
+            {"model": "Product.productvariant", "pk": 1, "fields": {"product": 1}},
+            {
+                "model": "Product.product",
+                "pk": 1,
+                "fields": {"name": "Shirt", "categories": [1], "product_type": 1},
+            },
+            {"model": "Product.producttype", "pk": 1, "fields": {"name": "Type"}},
+            {"model": "Product.category", "pk": 1, "fields": {"name": "Men"}},
+        ]
+        for obj in objects:
+            spooler.add(obj)
+
+        tables = [spool.table for spool in spooler.ordered_spools()]
+        self.assertLess(
+            tables.index("Product_producttype"), tables.index("Product_product")
+        )
+        self.assertLess(
+            tables.index("Product_category"), tables.index("Product_product_categories")
+        )
+        self.assertLess(
+            tables.index("Product_product"), tables.index("Product_productvariant")
+        )
+
+    def test_natural_keys_are_rejected(self):
+        spooler = FixtureSpooler()
+        self.addCleanup(spooler.close)
+        with self.assertRaises(FixtureLoadError):
+            spooler.add(
+                {
+                    "model": "Product.productvariant",
+                    "pk": 1,
+                    "fields": {"product": ["x"]},
+                }
+            )
+
+
+class CopyLoaddataCommandTests(TestCase):
+    @skipUnless(connection.vendor != "postgresql", "checks the non-PostgreSQL error")
+    def test_requires_postgresql(self):
+        with self.assertRaises(CommandError):
+            call_command("copy_loaddata", FIXTURES, stdout=io.StringIO())
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_seed_fixtures_load(self):
+        call_command("copy_loaddata", FIXTURES, stdout=io.StringIO())
+
+        self.assertEqual(Category.objects.count(), 9)
+        self.assertEqual(Product.objects.count(), 70)
+        self.assertEqual(ProductVariant.objects.count(), 200)
+        # the id sequences continue after the loaded rows
+        category = Category.objects.create(name="Loaded Later", slug="loaded-later")
+        self.assertEqual(category.pk, 10)
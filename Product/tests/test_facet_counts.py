@@ -0,0 +1,164 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from Product.facet_counts import rebuild_facet_counts
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    Category,
+    FacetCount,
+    Product,
+    ProductType,
+    ProductVariant,
+    ProductVariantAttributeValue,
+)
+
+
+class FacetCountMaintenanceTests(TestCase):
+    """
+    Every change is checked against a full rebuild: the incremental
+    updates must leave the table exactly as a rebuild would.
+    """
+
+    def setUp(self):
+        self.shirt = ProductType.objects.create(name="Shirt", slug="shirt")
+        self.color = Attribute.objects.create(
+            name="Color", slug="color", is_filterable=True
+        )
+        self.color.product_types.add(self.shirt)
+        self.red = AttributeValue.objects.create(
+            attribute=self.color, value="Red", slug="red"
+        )
+        self.blue = AttributeValue.objects.create(
+            attribute=self.color, value="Blue", slug="blue"
+        )
+
+        self.clothes = Category.objects.create(name="Clothes", slug="clothes")
+        self.men = Category.objects.create(name="Men", slug="men", parent=self.clothes)
+        self.women = Category.objects.create(
+            name="Women", slug="women", parent=self.clothes
+        )
+        self.sale = Category.objects.create(name="Sale", slug="sale")
+
+        self.alpha = self.create_product("Alpha", [self.men, self.women], self.red)
+        self.bravo = self.create_product("Bravo", [self.men], self.blue)
+
+    def create_product(self, name, categories, value):
+        product = Product.objects.create(
+            name=name, slug=name.lower(), product_type=self.shirt
+        )
+        product.categories.set(categories)
+        variant = ProductVariant.objects.create(
+            product=product, sku=f"{name}-1", price=Decimal("10.00"), stock=1
+        )
+        ProductVariantAttributeValue.objects.create(
+            variant=variant, attribute=self.color, attribute_value=value
+        )
+        return product
+
+    def snapshot(self):
+        rows = FacetCount.objects.values_list(
+            "attribute_value_id", "category_id", "product_type_id", "product_count"
+        )
+        return sorted(rows, key=str)
+
+    def assertMatchesRebuild(self):
+        incremental = self.snapshot()
+        rebuild_facet_counts()
+        self.assertEqual(incremental, self.snapshot())
+
+    def count(self, value, category):
+        row = FacetCount.objects.filter(attribute_value=value, category=category)
+        return sum(row.values_list("product_count", flat=True))
+
+    def test_counts_include_the_whole_subtree_once(self):
+        self.assertEqual(self.count(self.red, self.clothes), 1)
+        self.assertEqual(self.count(self.red, self.men), 1)
+        self.assertEqual(self.count(self.blue, self.women), 0)
+        self.assertEqual(self.count(self.red, None), 1)
+        self.assertMatchesRebuild()
+
+    def test_variant_deactivation(self):
+        variant = self.alpha.variants.get()
+        variant.is_active = False
+        variant.save()
+        self.assertEqual(self.count(self.red, self.clothes), 0)
+        self.assertMatchesRebuild()
+
+    def test_value_change(self):
+        row = ProductVariantAttributeValue.objects.get(variant__product=self.alpha)
+        row.attribute_value = self.blue
+        row.save()
+        self.assertEqual(self.count(self.blue, self.clothes), 2)
+        self.assertEqual(self.count(self.red, None), 0)
+        self.assertMatchesRebuild()
+
+    def test_category_membership_changes(self):
+        self.alpha.categories.add(self.sale)
+        self.assertEqual(self.count(self.red, self.sale), 1)
+        self.assertMatchesRebuild()
+
+        self.alpha.categories.remove(self.men)
+        self.assertMatchesRebuild()
+
+        self.alpha.categories.clear()
+        self.assertEqual(self.count(self.red, self.clothes), 0)
+        self.assertMatchesRebuild()
+
+        self.sale.products.add(self.bravo)
+        self.assertEqual(self.count(self.blue, self.sale), 1)
+        self.assertMatchesRebuild()
+
+    def test_product_delete(self):
+        self.alpha.delete()
+        self.assertEqual(self.count(self.red, self.clothes), 0)
+        self.assertMatchesRebuild()
+
+    def test_category_move_and_delete(self):
+        self.men.parent = self.sale
+        self.men.save()
+        self.assertEqual(self.count(self.blue, self.sale), 1)
+        self.assertEqual(self.count(self.blue, self.clothes), 0)
+        self.assertMatchesRebuild()
+
+        self.sale.delete()
+        self.assertMatchesRebuild()
+
+    def test_rebuild_command(self):
+        FacetCount.objects.all().delete()
+        call_command("rebuild_facet_counts", stdout=StringIO())
+        self.assertEqual(self.count(self.red, self.clothes), 1)
+
+    def test_unrelated_saves_skip_the_refresh(self):
+        variant = self.alpha.variants.get()
+        variant.stock = 7
+        with CaptureQueriesContext(connection) as queries:
+            variant.save()
+            self.alpha.description = "Soft cotton."
+            self.alpha.save()
+        self.assertFalse(
+            [q for q in queries.captured_queries if "facetcount" in q["sql"].lower()]
+        )
+
+    def test_product_type_change(self):
+        other = ProductType.objects.create(name="Blouse", slug="blouse")
+        self.alpha.product_type = other
+        self.alpha.save()
+        self.assertEqual(
+            FacetCount.objects.get(
+                attribute_value=self.red, category=None
+            ).product_type_id,
+            other.pk,
+        )
+        self.assertMatchesRebuild()
+
+    def test_variant_moved_to_another_product(self):
+        variant = self.alpha.variants.get()
+        variant.product = self.bravo
+        variant.save()
+        self.assertEqual(self.count(self.red, self.women), 0)
+        self.assertEqual(self.count(self.red, self.men), 1)
+        self.assertMatchesRebuild()
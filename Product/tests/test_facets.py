@@ -0,0 +1,122 @@
+from decimal import Decimal
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    FacetCount,
+    Product,
+    ProductType,
+    ProductVariant,
+    ProductVariantAttributeValue,
+)
+
+
+class ProductFacetViewTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("product-facets")
+        self.shirt = ProductType.objects.create(name="Shirt", slug="shirt")
+
+        self.color = self.create_attribute("Color", is_filterable=True)
+        self.size = self.create_attribute("Size", is_filterable=True)
+        self.material = self.create_attribute("Material", is_filterable=False)
+
+        self.values = {}
+        for attribute, names in [
+            (self.color, ["Red", "Blue", "Green"]),
+            (self.size, ["M", "L"]),
+            (self.material, ["Cotton"]),
+        ]:
+            for name in names:
+                self.values[name] = AttributeValue.objects.create(
+                    attribute=attribute, value=name, slug=name.lower()
+                )
+
+        self.create_product("Alpha", [("Red", "M"), ("Blue", "L")])
+        self.create_product("Bravo", [("Red", "L")])
+        self.create_product("Charlie", [("Green", "M")])
+
+    def create_attribute(self, name, is_filterable):
+        attribute = Attribute.objects.create(
+            name=name, slug=name.lower(), is_filterable=is_filterable
+        )
+        attribute.product_types.add(self.shirt)
+        return attribute
+
+    def create_product(self, name, variants):
+        product = Product.objects.create(
+            name=name, slug=name.lower(), product_type=self.shirt
+        )
+        for i, (color, size) in enumerate(variants):
+            variant = ProductVariant.objects.create(
+                product=product, sku=f"{name}-{i}", price=Decimal("10.00"), stock=1
+            )
+            for value_name in (color, size, "Cotton"):
+                value = self.values[value_name]
+                ProductVariantAttributeValue.objects.create(
+                    variant=variant, attribute=value.attribute, attribute_value=value
+                )
+        return product
+
+    def facet_counts(self, response):
+        return {
+            facet["attribute"]["slug"]: {
+                value["slug"]: value["count"] for value in facet["values"]
+            }
+            for facet in response.data["facets"]
+        }
+
+    def names(self, response):
+        return [product["name"] for product in response.data["results"]]
+
+    def test_without_selection(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.names(response), ["Alpha", "Bravo", "Charlie"])
+        self.assertEqual(
+            self.facet_counts(response),
+            {
+                "color": {"blue": 1, "green": 1, "red": 2},
+                "size": {"l": 2, "m": 2},
+            },
+        )
+
+    def test_single_selection_keeps_sibling_values(self):
+        response = self.client.get(self.url, {"value": ["red"]})
+        self.assertEqual(self.names(response), ["Alpha", "Bravo"])
+        self.assertEqual(
+            self.facet_counts(response),
+            {
+                "color": {"blue": 1, "green": 1, "red": 2},
+                "size": {"l": 1, "m": 1},
+            },
+        )
+        color = response.data["facets"][0]
+        selected = [value["slug"] for value in color["values"] if value["selected"]]
+        self.assertEqual(selected, ["red"])
+
+    def test_selections_must_match_the_same_variant(self):
+        response = self.client.get(self.url, {"value": ["red", "l"]})
+        self.assertEqual(self.names(response), ["Bravo"])
+        self.assertEqual(
+            self.facet_counts(response),
+            {"color": {"blue": 1, "red": 1}, "size": {"l": 1, "m": 1}},
+        )
+
+    def test_values_of_one_attribute_are_combined_with_or(self):
+        response = self.client.get(self.url, {"value": ["green", "blue"]})
+        self.assertEqual(self.names(response), ["Alpha", "Charlie"])
+
+    def test_unknown_values_are_ignored(self):
+        response = self.client.get(self.url, {"value": ["purple"]})
+        self.assertEqual(self.names(response), ["Alpha", "Bravo", "Charlie"])
+
+    def test_unfiltered_counts_come_from_the_precomputed_table(self):
+        FacetCount.objects.filter(attribute_value__slug="red").delete()
+
+        response = self.client.get(self.url)
+        self.assertNotIn("red", self.facet_counts(response)["color"])
+
+        response = self.client.get(self.url, {"in_stock": "true"})
+        self.assertEqual(self.facet_counts(response)["color"]["red"], 2)
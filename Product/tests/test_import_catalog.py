@@ -0,0 +1,167 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    Category,
+    FacetCount,
+    Product,
+    ProductType,
+    ProductVariant,
+    ProductVariantAttributeValue,
+    Tag,
+)
+
+
+class ImportCatalogTests(TestCase):
+    def setUp(self):
+        self.shirt = ProductType.objects.create(name="Shirt", slug="shirt")
+        self.men = Category.objects.create(name="Men", slug="men")
+        Tag.objects.create(name="Summer", slug="summer")
+        self.color = Attribute.objects.create(
+            name="Color", slug="color", is_filterable=True
+        )
+        self.color.product_types.add(self.shirt)
+        AttributeValue.objects.create(attribute=self.color, value="Red", slug="red")
+
+    def write(self, suffix, content):
+        file = tempfile.NamedTemporaryFile(
+            "w", suffix=suffix, delete=False, encoding="utf-8"
+        )
+        file.write(content)
+        file.close()
+        self.addCleanup(os.unlink, file.name)
+        return file.name
+
+    def jsonl(self, rows):
+        return self.write(".jsonl", "\n".join(json.dumps(row) for row in rows))
+
+    def row(self, product, sku, color="Red", **extra):
+        row = {
+            "product": product,
+            "name": product.replace("-", " ").title(),
+            "product_type": "shirt",
+            "categories": ["men"],
+            "tags": ["summer"],
+            "sku": sku,
+            "price": "10.00",
+            "stock": 3,
+            "attributes": {"color": color},
+        }
+        row.update(extra)
+        return row
+
+    def run_import(self, path, *args):
+        call_command("import_catalog", path, *args, stdout=StringIO())
+
+    def test_jsonl_import(self):
+        path = self.jsonl(
+            [
+                self.row("blue-shirt", "BS-1", color="Blue"),
+                self.row("blue-shirt", "BS-2"),
+                self.row("red-shirt", "RS-1"),
+            ]
+        )
+        self.run_import(path)
+
+        product = Product.objects.get(slug="blue-shirt")
+        self.assertEqual(product.name, "Blue Shirt")
+        self.assertEqual(product.product_type, self.shirt)
+        self.assertEqual(list(product.categories.all()), [self.men])
+        self.assertEqual(product.tags.get().slug, "summer")
+        self.assertEqual(product.variants.count(), 2)
+
+        blue = AttributeValue.objects.get(attribute=self.color, value="Blue")
+        self.assertEqual(blue.slug, "color-blue")
+        self.assertEqual(
+            ProductVariantAttributeValue.objects.get(
+                variant__sku="BS-1"
+            ).attribute_value,
+            blue,
+        )
+        self.assertEqual(
+            FacetCount.objects.get(
+                attribute_value__slug="red", category=self.men
+            ).product_count,
+            2,
+        )
+
+    def test_csv_import(self):
+        path = self.write(
+            ".csv",
+            "product,name,product_type,categories,tags,sku,price,stock,attribute:color\n"
+            "blue-shirt,Blue Shirt,shirt,men,summer,BS-1,9.50,2,Red\n",
+        )
+        self.run_import(path)
+
+        variant = ProductVariant.objects.get(sku="BS-1")
+        self.assertEqual(variant.price, Decimal("9.50"))
+        self.assertEqual(variant.attribute_values.get().attribute_value.slug, "red")
+
+    def test_reimport_updates_in_place(self):
+        self.run_import(self.jsonl([self.row("blue-shirt", "BS-1")]))
+        self.run_import(
+            self.jsonl([self.row("blue-shirt", "BS-1", color="Green", price="12.00")])
+        )
+
+        variant = ProductVariant.objects.get(sku="BS-1")
+        self.assertEqual(variant.price, Decimal("12.00"))
+        self.assertEqual(variant.attribute_values.get().attribute_value.value, "Green")
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_queries_do_not_grow_with_the_rows(self):
+        def count_queries(rows):
+            path = self.jsonl(rows)
+            with CaptureQueriesContext(connection) as context:
+                self.run_import(path, "--batch-size", "500")
+            return len(context.captured_queries)
+
+        def rows(numbers, **extra):
+            return [self.row(f"shirt-{i}", f"S-{i}", **extra) for i in numbers]
+
+        small = count_queries(rows(range(5)))
+        large = count_queries(rows(range(100, 150)))
+        self.assertEqual(small, large)
+
+        # re-imports of the same SKUs update the rows in place
+        small = count_queries(rows(range(5), price="11.00"))
+        large = count_queries(rows(range(100, 150), price="11.00"))
+        self.assertEqual(small, large)
+
+    def test_unknown_slug_stops_the_import(self):
+        path = self.jsonl(
+            [self.row("blue-shirt", "BS-1"), self.row("red-shirt", "RS-1", tags=["x"])]
+        )
+        with self.assertRaisesMessage(CommandError, "Line 2: unknown tag 'x'."):
+            self.run_import(path)
+        self.assertFalse(Product.objects.exists())
+
+    def test_invalid_rows_are_reported(self):
+        path = self.jsonl([self.row("blue-shirt", "BS-1", price="-1")])
+        with self.assertRaisesMessage(CommandError, "Line 1: ProductVariant"):
+            self.run_import(path)
+
+    def test_committed_batches_are_refreshed_after_a_failure(self):
+        path = self.jsonl(
+            [self.row("blue-shirt", "BS-1"), self.row("red-shirt", "RS-1", tags=["x"])]
+        )
+        with self.assertRaises(CommandError):
+            self.run_import(path, "--batch-size", "1")
+
+        # the first batch is kept, with its search vector and counts
+        self.assertTrue(Product.objects.filter(slug="blue-shirt").exists())
+        self.assertEqual(
+            FacetCount.objects.get(
+                attribute_value__slug="red", category=self.men
+            ).product_count,
+            1,
+        )
+        self.men.refresh_from_db()
+        self.assertEqual(self.men.product_count, 1)
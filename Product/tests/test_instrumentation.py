@@ -0,0 +1,74 @@
+import json
+from unittest import mock
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from Users.models import CustomUser
+from Product.models import Tag
+
+
+@override_settings(SERVER_TIMING=True, METRICS_ALLOWED_IPS=["127.0.0.1"])
+class RequestMetricsMiddlewareTests(APITestCase):
+    def setUp(self):
+        Tag.objects.create(name="Summer", slug="summer")
+        Tag.objects.create(name="Winter", slug="winter")
+        self.url = reverse("tag-list")
+
+    def get_record(self, level="INFO"):
+        with self.assertLogs("core.instrumentation", level) as logs:
+            response = self.client.get(self.url)
+        return response, json.loads(logs.records[-1].getMessage())
+
+    def test_metrics_are_logged(self):
+        response, record = self.get_record()
+
+        self.assertEqual(record["url_name"], "tag-list")
+        self.assertEqual(record["status"], 200)
+        # the ETag state and the tags
+        self.assertEqual(record["queries"], 2)
+        self.assertGreater(record["serializer_ms"], 0)
+        self.assertEqual(record["response_bytes"], len(response.content))
+        self.assertNotIn("query_budget", record)
+
+    def test_server_timing_header(self):
+        response = self.client.get(self.url)
+        timing = response["Server-Timing"]
+        self.assertIn('desc="2 queries"', timing)
+        self.assertIn("serializer;dur=", timing)
+        self.assertIn("total;dur=", timing)
+
+    @override_settings(SERVER_TIMING=False)
+    def test_server_timing_header_can_be_disabled(self):
+        self.assertFalse(self.client.get(self.url).has_header("Server-Timing"))
+
+    @override_settings(METRICS_ALLOWED_IPS=[])
+    def test_server_timing_header_is_only_sent_to_staff(self):
+        self.assertFalse(self.client.get(self.url).has_header("Server-Timing"))
+
+        user = CustomUser.objects.create_user(
+            "admin@example.com",
+            "StrongPass1@",
+            username="admin",
+            first_name="Ad",
+            last_name="Min",
+            is_staff=True,
+        )
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertTrue(self.client.get(self.url).has_header("Server-Timing"))
+
+    def test_record_is_not_built_when_not_logged(self):
+        with mock.patch("core.instrumentation.json.dumps") as dumps:
+            with self.assertNoLogs("core.instrumentation", "WARNING"):
+                self.client.get(self.url)
+        dumps.assert_not_called()
+
+    @override_settings(QUERY_BUDGETS={"tag-list": 0})
+    def test_exceeded_budget_is_a_warning(self):
+        with self.assertLogs("core.instrumentation", "WARNING") as logs:
+            self.client.get(self.url)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(logs.records[0].levelname, "WARNING")
+        self.assertEqual(record["query_budget"], 0)
+        self.assertEqual(record["queries"], 2)
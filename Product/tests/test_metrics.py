@@ -0,0 +1,94 @@
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework.test import APITestCase
+from Product.cache import get_catalog_cache
+from Product.models import Category, Tag
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        Tag.objects.create(name="Summer", slug="summer")
+        Category.objects.create(name="Men", slug="men")
+
+    def test_requests_are_counted_by_url_name(self):
+        labels = {"method": "GET", "url_name": "tag-list"}
+        before = sample("http_requests_total", status="200", **labels)
+        queries = sample("db_queries_per_request_sum", url_name="tag-list")
+
+        self.client.get(reverse("tag-list"))
+
+        self.assertEqual(
+            sample("http_requests_total", status="200", **labels), before + 1
+        )
+        self.assertEqual(
+            sample("db_queries_per_request_sum", url_name="tag-list"), queries + 2
+        )
+        self.assertGreater(sample("http_request_duration_seconds_count", **labels), 0)
+
+    def test_cache_hits_and_misses(self):
+        hits = sample(
+            "catalog_cache_requests_total", namespace="categories", result="hit"
+        )
+        misses = sample(
+            "catalog_cache_requests_total", namespace="categories", result="miss"
+        )
+
+        self.client.get(reverse("category-tree"))
+        self.client.get(reverse("category-tree"))
+
+        self.assertEqual(
+            sample(
+                "catalog_cache_requests_total", namespace="categories", result="hit"
+            ),
+            hits + 1,
+        )
+        self.assertEqual(
+            sample(
+                "catalog_cache_requests_total", namespace="categories", result="miss"
+            ),
+            misses + 1,
+        )
+
+    def test_rejected_tokens_are_counted(self):
+        failures = sample("jwt_authentication_failures_total")
+        timed = sample("jwt_authentication_duration_seconds_count")
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        response = self.client.get(reverse("tag-list"))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(sample("jwt_authentication_failures_total"), failures + 1)
+        self.assertEqual(sample("jwt_authentication_duration_seconds_count"), timed + 1)
+
+    @override_settings(METRICS_ALLOWED_IPS=["127.0.0.1"])
+    def test_metrics_endpoint(self):
+        self.client.get(reverse("tag-list"))
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            b'http_requests_total{method="GET",status="200"', response.content
+        )
+        self.assertIn(b"jwt_authentication_duration_seconds", response.content)
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.5"], METRICS_TOKEN="s3cret")
+    def test_metrics_need_an_allowed_address_or_the_token(self):
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, 403)
+        response = self.client.get(url, HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.get(url, HTTP_AUTHORIZATION="Bearer s3cret")
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(url, REMOTE_ADDR="10.0.0.5")
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN="")
+    def test_metrics_are_hidden_unless_configured(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
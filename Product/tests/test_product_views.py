@@ -0,0 +1,117 @@
+import base64
+import json
+from decimal import Decimal
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.models import Category, Product, ProductType, ProductVariant, Tag
+
+
+class ProductListViewTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("product-list")
+
+        self.electronics = Category.objects.create(
+            name="Electronics", slug="electronics"
+        )
+        self.phones = Category.objects.create(
+            name="Phones", slug="phones", parent=self.electronics
+        )
+        self.books = Category.objects.create(name="Books", slug="books")
+        self.phone_type = ProductType.objects.create(name="Phone", slug="phone")
+        self.sale = Tag.objects.create(name="Sale", slug="sale")
+
+        self.pixel = self.create_product("Pixel", [self.phones], price="500.00")
+        self.galaxy = self.create_product("Galaxy", [self.phones], price="900.00")
+        self.novel = self.create_product("Novel", [self.books], price="15.00")
+        self.tv = self.create_product("Television", [self.electronics], stock=0)
+        self.pixel.product_type = self.phone_type
+        self.pixel.save()
+        self.pixel.tags.add(self.sale)
+
+        Product.objects.create(name="Hidden", slug="hidden", is_active=False)
+
+    def create_product(self, name, categories, price="10.00", stock=5):
+        product = Product.objects.create(name=name, slug=name.lower())
+        product.categories.set(categories)
+        variant = ProductVariant(
+            product=product, sku=f"{name}-1", price=Decimal(price), stock=stock
+        )
+        variant.save(skip_validation=True)
+        return product
+
+    def names(self, response):
+        return [product["name"] for product in response.data["results"]]
+
+    def test_lists_active_products_by_name(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.names(response), ["Galaxy", "Novel", "Pixel", "Television"]
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_cursor_pagination(self):
+        response = self.client.get(self.url, {"page_size": 3})
+        self.assertEqual(self.names(response), ["Galaxy", "Novel", "Pixel"])
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.names(response), ["Television"])
+        self.assertIsNone(response.data["next"])
+
+    def test_descending_ordering(self):
+        response = self.client.get(self.url, {"ordering": "-name", "page_size": 2})
+        self.assertEqual(self.names(response), ["Television", "Pixel"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.names(response), ["Novel", "Galaxy"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_tampered_cursor(self):
+        for params, position in [
+            ({}, ["name", "Novel", "abc"]),
+            ({}, ["name", "Novel", None]),
+            ({"ordering": "created_at"}, ["created_at", "not-a-date", 1]),
+            ({"ordering": "created_at"}, ["created_at", [2025], 1]),
+        ]:
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            with self.subTest(position=position):
+                response = self.client.get(self.url, {**params, "cursor": cursor})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data["cursor"], "Invalid cursor.")
+
+    def test_category_filter_includes_subtree(self):
+        response = self.client.get(self.url, {"category": "electronics"})
+        self.assertEqual(self.names(response), ["Galaxy", "Pixel", "Television"])
+
+    def test_product_type_and_tag_filters(self):
+        response = self.client.get(self.url, {"product_type": "phone"})
+        self.assertEqual(self.names(response), ["Pixel"])
+
+        response = self.client.get(self.url, {"tag": "sale"})
+        self.assertEqual(self.names(response), ["Pixel"])
+
+    def test_price_and_stock_filters(self):
+        response = self.client.get(self.url, {"min_price": "100", "max_price": "600"})
+        self.assertEqual(self.names(response), ["Pixel"])
+
+        response = self.client.get(self.url, {"in_stock": "true"})
+        self.assertEqual(self.names(response), ["Galaxy", "Novel", "Pixel"])
+
+    def test_invalid_price_range(self):
+        response = self.client.get(self.url, {"min_price": "10", "max_price": "5"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_min_price_is_annotated(self):
+        response = self.client.get(self.url, {"product_type": "phone"})
+        self.assertEqual(response.data["results"][0]["min_price"], "500.00")
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        with self.assertNumQueries(3):
+            self.client.get(self.url, {"page_size": 1})
+        with self.assertNumQueries(3):
+            self.client.get(self.url, {"page_size": 10})
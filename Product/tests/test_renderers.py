@@ -0,0 +1,87 @@
+import datetime
+import uuid
+from decimal import Decimal
+from unittest import skipIf
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from core.renderers import ORJSONRenderer, get_json_renderer, orjson
+
+
+@skipIf(orjson is None, "orjson is not installed")
+class ORJSONRendererTests(SimpleTestCase):
+    def assertSameAsJSONRenderer(self, data, media_type=None):
+        expected = JSONRenderer().render(data, media_type)
+        self.assertEqual(ORJSONRenderer().render(data, media_type), expected)
+
+    def test_matches_json_renderer(self):
+        self.assertSameAsJSONRenderer(
+            {
+                "price": Decimal("19.90"),
+                "created_at": datetime.datetime(
+                    2025, 1, 2, 3, 4, 5, 600000, tzinfo=datetime.timezone.utc
+                ),
+                "day": datetime.date(2025, 1, 2),
+                "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                "label": gettext_lazy("Name"),
+                "results": ReturnList(
+                    [ReturnDict({"a": 1}, serializer=None)], serializer=None
+                ),
+                "counts": {1: 2},
+                "name": "Ünïcode ✓",
+                "nothing": None,
+            }
+        )
+
+    def test_indent_falls_back(self):
+        self.assertSameAsJSONRenderer({"a": [1, 2]}, "application/json; indent=4")
+
+    def test_line_separators_are_escaped(self):
+        content = ORJSONRenderer().render({"name": "a\u2028b\u2029c"})
+        self.assertEqual(content, b'{"name":"a\\u2028b\\u2029c"}')
+
+    def test_wide_ints_fall_back(self):
+        self.assertSameAsJSONRenderer({"big": 2**70, "small": -(2**64)})
+
+    def test_non_finite_floats_are_rejected(self):
+        for value in [float("nan"), float("inf"), -float("inf")]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    ORJSONRenderer().render({"results": [{"price": value}]})
+
+    def test_keys_json_rejects_are_rejected(self):
+        for key in [gettext_lazy("Name"), datetime.date(2025, 1, 2)]:
+            with self.subTest(key=key):
+                with self.assertRaises(TypeError):
+                    ORJSONRenderer().render({key: 1})
+
+    def test_none_renders_nothing(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class GetJSONRendererTests(SimpleTestCase):
+    def tearDown(self):
+        api_settings.reload()
+
+    def test_configured_renderer(self):
+        with override_settings(
+            REST_FRAMEWORK={
+                "DEFAULT_RENDERER_CLASSES": [
+                    "rest_framework.renderers.BrowsableAPIRenderer",
+                    "core.renderers.ORJSONRenderer",
+                ]
+            }
+        ):
+            self.assertIsInstance(get_json_renderer(), ORJSONRenderer)
+
+    def test_default(self):
+        with override_settings(
+            REST_FRAMEWORK={
+                "DEFAULT_RENDERER_CLASSES": [
+                    "rest_framework.renderers.BrowsableAPIRenderer",
+                ]
+            }
+        ):
+            self.assertIs(type(get_json_renderer()), JSONRenderer)
@@ -0,0 +1,118 @@
+from django.http import JsonResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from Users.models import CustomUser
+from Product.cache import get_catalog_cache
+from Product.models import Category, Product, Tag
+from Product.response_cache import cache_response, purge_all, purge_instance
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.summer = Tag.objects.create(name="Summer", slug="summer")
+        self.men = Category.objects.create(name="Men", slug="men")
+        self.shirt = Product.objects.create(name="Shirt", slug="shirt")
+        self.shorts = Product.objects.create(name="Shorts", slug="shorts")
+        self.shirt.tags.add(self.summer)
+        self.shirt.categories.add(self.men)
+        self.shirt_url = reverse("product-detail", kwargs={"slug": "shirt"})
+
+    def test_repeated_get_is_served_without_queries(self):
+        response = self.client.get(self.shirt_url)
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.shirt_url)
+
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_cached_response_answers_conditional_requests(self):
+        response = self.client.get(self.shirt_url)
+        with self.assertNumQueries(0):
+            revalidated = self.client.get(
+                self.shirt_url, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_edit_purges_the_pages_showing_the_object(self):
+        self.client.get(self.shirt_url)
+        self.summer.name = "Holiday"
+        self.summer.save()
+
+        response = self.client.get(self.shirt_url)
+        self.assertEqual(response.json()["tags"][0]["name"], "Holiday")
+
+    def test_edit_keeps_unrelated_pages(self):
+        self.client.get(self.shirt_url)
+        self.shorts.name = "Long Shorts"
+        self.shorts.save()
+
+        with self.assertNumQueries(0):
+            self.client.get(self.shirt_url)
+
+    def test_new_rows_purge_the_lists(self):
+        url = reverse("tag-list")
+        self.client.get(url)
+        Tag.objects.create(name="Winter", slug="winter")
+
+        self.assertEqual(len(self.client.get(url).json()), 2)
+
+    def test_links_purge_the_product(self):
+        self.client.get(self.shirt_url)
+        self.shirt.tags.remove(self.summer)
+
+        self.assertEqual(self.client.get(self.shirt_url).json()["tags"], [])
+
+    def test_tag_edits_purge_the_facet_pages(self):
+        url = reverse("product-facets")
+        self.client.get(url, {"tag": "summer"})
+        self.summer.slug = "summer-sale"
+        self.summer.save()
+
+        response = self.client.get(url, {"tag": "summer"})
+        self.assertEqual(response.json()["results"], [])
+
+    def test_edits_made_while_rendering_are_not_cached(self):
+        renders = []
+
+        @cache_response()
+        def view(request):
+            renders.append(request)
+            if len(renders) == 1:
+                # an edit saved after the view read the shirt
+                purge_instance(self.shirt)
+            return JsonResponse({"name": "Shirt"})
+
+        request = RequestFactory().get("/stale/")
+        view(request)
+        view(request)
+        view(request)
+        self.assertEqual(len(renders), 2)
+
+    def test_purge_all(self):
+        self.client.get(self.shirt_url)
+        # bypasses the signals, like a bulk load
+        Product.objects.filter(pk=self.shirt.pk).update(name="Tee")
+        purge_all()
+
+        self.assertEqual(self.client.get(self.shirt_url).json()["name"], "Tee")
+
+    def test_authenticated_requests_bypass_the_cache(self):
+        user = CustomUser.objects.create_user(
+            "buyer@example.com",
+            "StrongPass1@",
+            username="buyer",
+            first_name="Buy",
+            last_name="Er",
+        )
+        self.client.get(self.shirt_url)
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        with self.assertNumQueries(5):
+            # user, ETag state, product + product_type, categories, tags
+            self.client.get(self.shirt_url)
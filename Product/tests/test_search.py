@@ -0,0 +1,80 @@
+from unittest import skipUnless
+from unittest.mock import patch
+from django.db import connection
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.models import Category, Product, Tag
+from Product.search import parse_query
+
+
+class ParseQueryTests(SimpleTestCase):
+    def test_terms_become_prefix_matches(self):
+        self.assertEqual(parse_query("Blue  shi!"), "blue:* & shi:*")
+
+    def test_empty_input(self):
+        self.assertIsNone(parse_query(" &|! "))
+
+
+class ProductSearchViewTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("product-search")
+        self.shirts = Category.objects.create(name="Shirts", slug="shirts")
+        self.summer = Tag.objects.create(name="Summer", slug="summer")
+
+        self.blue_shirt = Product.objects.create(
+            name="Blue Shirt", slug="blue-shirt", description="Cotton shirt"
+        )
+        self.blue_shirt.categories.add(self.shirts)
+        self.linen = Product.objects.create(
+            name="Linen Trousers", slug="linen-trousers", description="Light blue"
+        )
+        self.linen.tags.add(self.summer)
+        Product.objects.create(name="Red Hat", slug="red-hat")
+
+    def names(self, response):
+        return [product["name"] for product in response.data["results"]]
+
+    def test_q_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_prefix_match_on_name(self):
+        response = self.client.get(self.url, {"q": "blu shi"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.names(response), ["Blue Shirt"])
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_name_matches_rank_above_description_matches(self):
+        response = self.client.get(self.url, {"q": "blue"})
+        self.assertEqual(self.names(response), ["Blue Shirt", "Linen Trousers"])
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_tag_and_category_names_are_indexed(self):
+        response = self.client.get(self.url, {"q": "summer"})
+        self.assertEqual(self.names(response), ["Linen Trousers"])
+
+        response = self.client.get(self.url, {"q": "shirts"})
+        self.assertEqual(self.names(response), ["Blue Shirt"])
+
+    @skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+    def test_renaming_a_tag_updates_the_index(self):
+        self.summer.name = "Holiday"
+        self.summer.save()
+
+        response = self.client.get(self.url, {"q": "holiday"})
+        self.assertEqual(self.names(response), ["Linen Trousers"])
+
+    @patch("Product.signals.update_search_vectors")
+    def test_only_renames_reindex_linked_products(self, update_search_vectors):
+        self.shirts.refresh_from_db()
+        self.shirts.slug = "all-shirts"
+        self.shirts.save()
+        self.summer.slug = "summer-sale"
+        self.summer.save()
+        update_search_vectors.assert_not_called()
+
+        self.summer.name = "Holiday"
+        self.summer.save()
+        update_search_vectors.assert_called_once()
@@ -0,0 +1,93 @@
+from django.db import IntegrityError, connection
+from django.db.models.signals import pre_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from Product.models import Tag
+from core.utils import generate_unique_slug
+
+
+class GenerateUniqueSlugTests(TestCase):
+    def allocate(self, name):
+        tag = Tag(name=name)
+        generate_unique_slug(tag, Tag)
+        return tag.slug
+
+    def test_free_base_slug_is_used(self):
+        self.assertEqual(self.allocate("Blue Shirt"), "blue-shirt")
+
+    def test_first_free_suffix_is_used(self):
+        for slug in ["blue-shirt", "blue-shirt-1", "blue-shirt-3"]:
+            Tag.objects.create(name=slug.replace("-", " "), slug=slug)
+        self.assertEqual(self.allocate("Blue Shirt"), "blue-shirt-2")
+
+    def test_other_slugs_sharing_the_prefix_are_ignored(self):
+        Tag.objects.create(name="Blue Shirts", slug="blue-shirts")
+        Tag.objects.create(name="Blue Shirt XL", slug="blue-shirt-xl")
+        Tag.objects.create(name="Blue Shirt 1 2", slug="blue-shirt-1-2")
+        self.assertEqual(self.allocate("Blue Shirt"), "blue-shirt")
+
+    def test_allocation_uses_single_query(self):
+        for i in range(10):
+            slug = "blue-shirt" if i == 0 else f"blue-shirt-{i}"
+            Tag.objects.create(name=f"Tag {i}", slug=slug)
+
+        with self.assertNumQueries(1):
+            slug = self.allocate("Blue Shirt")
+        self.assertEqual(slug, "blue-shirt-10")
+
+    def test_instance_keeps_its_own_slug(self):
+        tag = Tag.objects.create(name="Blue Shirt", slug="blue-shirt")
+        generate_unique_slug(tag, Tag)
+        self.assertEqual(tag.slug, "blue-shirt")
+
+
+class SlugSignalTests(TestCase):
+    def test_slug_is_generated_on_create(self):
+        tag = Tag.objects.create(name="Blue Shirt")
+        self.assertEqual(tag.slug, "blue-shirt")
+
+    def test_rename_regenerates_slug(self):
+        tag = Tag.objects.create(name="Blue Shirt")
+        tag = Tag.objects.get(pk=tag.pk)
+        tag.name = "Red Shirt"
+        tag.save()
+        self.assertEqual(tag.slug, "red-shirt")
+
+    def test_save_without_rename_does_not_read_the_row(self):
+        tag = Tag.objects.create(name="Blue Shirt")
+        tag = Tag.objects.get(pk=tag.pk)
+        tag.is_active = False
+
+        with CaptureQueriesContext(connection) as context:
+            tag.save()
+
+        statements = [
+            query["sql"]
+            for query in context.captured_queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE"))
+        ]
+        # Two case-insensitive/unique name checks, the slug check and the UPDATE.
+        self.assertEqual(len(statements), 4)
+        self.assertEqual(tag.slug, "blue-shirt")
+
+    def test_slug_taken_by_a_concurrent_writer_is_reallocated(self):
+        competitors = []
+
+        def insert_competitor(sender, instance, **kwargs):
+            # Runs after the slug was allocated, like a writer that commits
+            # the same slug first. Only the first attempt is raced.
+            if not competitors:
+                competitors.append(instance.slug)
+                Tag.objects.bulk_create([Tag(name="Sale Items", slug=instance.slug)])
+
+        pre_save.connect(insert_competitor, sender=Tag)
+        self.addCleanup(pre_save.disconnect, insert_competitor, sender=Tag)
+
+        tag = Tag.objects.create(name="Sale")
+        self.assertEqual(competitors, ["sale"])
+        self.assertTrue(Tag.objects.filter(pk=tag.pk, slug=tag.slug).exists())
+
+    def test_explicit_slug_conflict_is_not_reallocated(self):
+        Tag.objects.bulk_create([Tag(name="Other", slug="sale")])
+        with self.assertRaises(IntegrityError):
+            Tag(name="Sale", slug="sale").save(skip_validation=True)
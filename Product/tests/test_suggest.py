@@ -0,0 +1,93 @@
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.cache import SUGGEST_VERSION, get_catalog_cache, get_catalog_version
+from Product.models import Category, Product, Tag
+from Product.suggest import SuggestIndex
+
+
+class SuggestIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SuggestIndex(
+            [
+                ("Blue Shirt", "product", "blue-shirt"),
+                ("Shirts", "category", "shirts"),
+                ("Blue", "tag", "blue"),
+                ("Red Hat", "product", "red-hat"),
+            ]
+        )
+
+    def slugs(self, prefix, limit=10):
+        return [entry["slug"] for entry in self.index.lookup(prefix, limit)]
+
+    def test_prefix_of_any_word(self):
+        self.assertEqual(self.slugs("shi"), ["blue-shirt", "shirts"])
+        self.assertEqual(self.slugs("BLU"), ["blue", "blue-shirt"])
+
+    def test_prefix_across_words(self):
+        self.assertEqual(self.slugs("blue  sh"), ["blue-shirt"])
+
+    def test_no_match_and_empty_prefix(self):
+        self.assertEqual(self.slugs("green"), [])
+        self.assertEqual(self.slugs("   "), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.slugs("b", 1)), 1)
+
+    def test_one_key_per_word(self):
+        index = SuggestIndex([("Long Sleeve Cotton Shirt", "product", "long")])
+        self.assertEqual(index.words, ["cotton", "long", "shirt", "sleeve"])
+        self.assertEqual(len(index.lookup("sleeve cot")), 1)
+        self.assertEqual(index.lookup("sleeve shirt"), [])
+
+
+class ProductSuggestViewTests(APITestCase):
+    def setUp(self):
+        get_catalog_cache().clear()
+        self.url = reverse("product-suggest")
+
+        Category.objects.create(name="Shirts", slug="shirts")
+        Tag.objects.create(name="Summer", slug="summer")
+        self.product = Product.objects.create(name="Blue Shirt", slug="blue-shirt")
+        Product.objects.create(name="Hidden Shirt", slug="hidden", is_active=False)
+
+    def results(self, q):
+        response = self.client.get(self.url, {"q": q})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(entry["type"], entry["slug"]) for entry in response.data["results"]]
+
+    def test_q_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_names_of_all_kinds_are_suggested(self):
+        self.assertEqual(
+            self.results("s"),
+            [("product", "blue-shirt"), ("category", "shirts"), ("tag", "summer")],
+        )
+
+    def test_warm_index_does_not_query(self):
+        self.results("s")
+
+        with self.assertNumQueries(0):
+            self.results("sh")
+
+    def test_rename_rebuilds_index(self):
+        self.results("s")
+
+        self.product.name = "Silk Scarf"
+        self.product.save()
+
+        self.assertEqual(self.results("silk"), [("product", "silk-scarf")])
+        self.assertEqual(self.results("blue"), [])
+
+    def test_other_edits_keep_the_index(self):
+        version = get_catalog_version(SUGGEST_VERSION)
+        self.product.description = "Cotton"
+        self.product.save()
+        self.assertEqual(get_catalog_version(SUGGEST_VERSION), version)
+
+        self.product.is_active = False
+        self.product.save()
+        self.assertEqual(self.results("blue"), [])
@@ -0,0 +1,71 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from Product.models import Category, Product, ProductType, Tag
+
+
+class ProductsByTagViewTests(APITestCase):
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Sale", slug="sale")
+        self.other_tag = Tag.objects.create(name="New", slug="new")
+        self.category = Category.objects.create(name="Phones", slug="phones")
+        self.product_type = ProductType.objects.create(name="Phone", slug="phone")
+        self.url = reverse("products-by-tag", kwargs={"slug": self.tag.slug})
+
+    def add_products(self, count):
+        start = Product.objects.count()
+        for i in range(start, start + count):
+            product = Product.objects.create(
+                name=f"Product {i}",
+                slug=f"product-{i}",
+                product_type=self.product_type,
+            )
+            product.categories.add(self.category)
+            product.tags.add(self.tag, self.other_tag)
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_lists_tagged_products(self):
+        self.add_products(2)
+        _, response = self.count_queries()
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]["product_type"]["slug"], "phone")
+        self.assertEqual(response.data[0]["categories"][0]["slug"], "phones")
+        self.assertEqual(len(response.data[0]["tags"]), 2)
+
+    def test_query_count_is_independent_of_product_count(self):
+        self.add_products(1)
+        queries_for_one, _ = self.count_queries()
+
+        self.add_products(10)
+        queries_for_many, response = self.count_queries()
+
+        self.assertEqual(len(response.data), 11)
+        self.assertEqual(queries_for_one, queries_for_many)
+        # ETag state, tag lookup, products + product_type, categories, tags
+        self.assertEqual(queries_for_many, 5)
+
+
+class ProductDetailViewTests(APITestCase):
+    def setUp(self):
+        self.product = Product.objects.create(name="Pixel", slug="pixel")
+        for i in range(3):
+            category = Category.objects.create(name=f"Category {i}", slug=f"cat-{i}")
+            tag = Tag.objects.create(name=f"Tag {i}", slug=f"tag-{i}")
+            self.product.categories.add(category)
+            self.product.tags.add(tag)
+        self.url = reverse("product-detail", kwargs={"slug": self.product.slug})
+
+    def test_detail_uses_fixed_number_of_queries(self):
+        # ETag state, product + product_type, categories, tags
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["categories"]), 3)
+        self.assertEqual(len(response.data["tags"]), 3)
@@ -1,8 +1,10 @@
 from django.urls import path
-from Product.views.category_views import CategoryTreeView, CategoryDropdownView, CategoryDetailView
+from Product.views.category_views import CategoryTreeView, CategoryDropdownView, CategoryDetailView, CategoryBreadcrumbsView, CategoryProductsView
 
 urlpatterns = [
     path('tree/', CategoryTreeView.as_view(), name='category-tree'),
     path('dropdown/', CategoryDropdownView.as_view(), name='category-dropdown'),
     path('<slug:slug>/', CategoryDetailView.as_view(), name='category-detail'),
+    path('<slug:slug>/breadcrumbs/', CategoryBreadcrumbsView.as_view(), name='category-breadcrumbs'),
+    path('<slug:slug>/products/', CategoryProductsView.as_view(), name='category-products'),
 ]
\ No newline at end of file
@@ -1,10 +1,16 @@
 from django.urls import path
 from Product.views.Product_views import (
     ProductListView,
+    ProductFacetView,
+    ProductSearchView,
+    ProductSuggestView,
     ProductDetailView,
 )
 
 urlpatterns = [
     path('', ProductListView.as_view(), name='product-list'),
+    path('facets/', ProductFacetView.as_view(), name='product-facets'),
+    path('search/', ProductSearchView.as_view(), name='product-search'),
+    path('suggest/', ProductSuggestView.as_view(), name='product-suggest'),
     path('<slug:slug>/', ProductDetailView.as_view(), name='product-detail'),
 ]
\ No newline at end of file
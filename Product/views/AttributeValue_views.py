@@ -1,29 +1,46 @@
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from Product.serializers import AttributeValueSerializer
 from Product.models import AttributeValue
+from Product.response_cache import cache_response
+from core.conditional import conditional_on_queryset
 
 # at first, what we need here
 # listwiew
 # attributeview
 
+
+@method_decorator(cache_response(AttributeValue), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(lambda request: AttributeValue.objects.all()),
+    name="get",
+)
 class AttributeValueListView(APIView):
     """
     List all attribute values or create a new attribute value.
     """
+
     def get(self, request):
         attribute_values = AttributeValue.objects.all()
         serializer = AttributeValueSerializer(attribute_values, many=True)
         return Response(serializer.data)
 
 
-
+@method_decorator(cache_response(), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(
+        lambda request, slug: AttributeValue.objects.filter(slug=slug)
+    ),
+    name="get",
+)
 class AttributeValueDetailView(APIView):
     """
     Retrieve a specific attribute value by its slug.
     """
+
     def get_object(self, slug):
         return get_object_or_404(AttributeValue, slug=slug)
 
@@ -31,6 +48,3 @@ class AttributeValueDetailView(APIView):
         attribute_value = self.get_object(slug)
         serializer = AttributeValueSerializer(attribute_value)
         return Response(serializer.data)
-
-
-
@@ -1,9 +1,12 @@
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from Product.serializers import AttributeSerializer, AttributeValueSerializer
-from Product.models import Attribute
+from Product.models import Attribute, AttributeValue
+from Product.response_cache import cache_response
+from core.conditional import conditional_on_queryset
 
 # where we need Attributes
 # 1. Attribute list for filtering products
@@ -12,18 +15,27 @@ from Product.models import Attribute
 # 4. Attribute values for product detail view
 
 
+@method_decorator(cache_response(Attribute), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(lambda request: Attribute.objects.all()),
+    name="get",
+)
 class AttributeListView(APIView):
     """
     View to retrieve the list of attributes.
     """
 
     def get(self, request, *args, **kwargs):
-        attributes = Attribute.objects.filter(is_active=True)
+        attributes = Attribute.objects.all()
         serializer = AttributeSerializer(attributes, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
 
 
+@method_decorator(cache_response(), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(lambda request, slug: Attribute.objects.filter(slug=slug)),
+    name="get",
+)
 class AttributeDetailView(APIView):
     """
     View to retrieve the details of a specific attribute.
@@ -33,9 +45,16 @@ class AttributeDetailView(APIView):
         attribute = get_object_or_404(Attribute, slug=slug)
         serializer = AttributeSerializer(attribute)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
 
 
+@method_decorator(cache_response(AttributeValue), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(
+        lambda request, slug: Attribute.objects.filter(slug=slug),
+        related=["values"],
+    ),
+    name="get",
+)
 class AttributeWithValuesView(APIView):
     """
     View to retrieve the details of a specific attribute with its values.
@@ -46,8 +65,7 @@ class AttributeWithValuesView(APIView):
         serializer = AttributeSerializer(attribute)
         values = attribute.values.all()
         value_serializer = AttributeValueSerializer(values, many=True)
-        return Response({
-            'attribute': serializer.data,
-            'values': value_serializer.data
-        }, status=status.HTTP_200_OK)
-        
\ No newline at end of file
+        return Response(
+            {"attribute": serializer.data, "values": value_serializer.data},
+            status=status.HTTP_200_OK,
+        )
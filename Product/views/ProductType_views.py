@@ -1,15 +1,24 @@
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from Product.serializers import ProductTypeSerializer
 from Product.models import ProductType
+from Product.response_cache import cache_response
+from core.conditional import conditional_on_queryset
 
 # where we need Product Types
 # Main ProductType list
-# ProductType detail 
+# ProductType detail
 # ProductType dropdown filter
 
+
+@method_decorator(cache_response(ProductType), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(lambda request: ProductType.objects.filter(is_active=True)),
+    name="get",
+)
 class ProductTypeListView(APIView):
     """
     View to retrieve the list of product types.
@@ -19,8 +28,15 @@ class ProductTypeListView(APIView):
         product_types = ProductType.objects.filter(is_active=True)
         serializer = ProductTypeSerializer(product_types, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
 
+
+@method_decorator(cache_response(), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(
+        lambda request, slug: ProductType.objects.filter(slug=slug)
+    ),
+    name="get",
+)
 class ProductTypeDetailView(APIView):
     """
     View to retrieve the details of a specific product type.
@@ -30,7 +46,3 @@ class ProductTypeDetailView(APIView):
         product_type = get_object_or_404(ProductType, slug=slug)
         serializer = ProductTypeSerializer(product_type)
         return Response(serializer.data, status=status.HTTP_200_OK)
-
-
-
-
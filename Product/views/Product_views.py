@@ -1,35 +1,169 @@
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from Product.serializers import BasicProductSerializer, ProductReadSerializer
-from Product.models import Product
+from Product.serializers import (
+    PRODUCT_READ_RELATED,
+    ProductListSerializer,
+    ProductReadSerializer,
+)
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    Category,
+    Product,
+    ProductType,
+    ProductVariant,
+    ProductVariantAttributeValue,
+    Tag,
+)
+from Product.filters import ProductFilterSerializer, filter_products, with_min_price
+from Product.facets import (
+    FacetFilterSerializer,
+    can_use_precomputed,
+    filter_by_selection,
+    get_facet_counts,
+    get_precomputed_facet_counts,
+    get_selection,
+)
+from Product.search import ProductSearchSerializer, search_products
+from Product.suggest import SuggestQuerySerializer, suggest
+from Product.response_cache import cache_response
+from core.conditional import conditional_on_queryset
+from core.pagination import KeysetPagination
 
 # where we need Products
 # 1. Product list for filtering, sorting, and searching
 # 2. Product detail view
-# 3. 
+# 3.
 
 
+@method_decorator(
+    cache_response(Product, ProductVariant, Category, Tag, ProductType), name="dispatch"
+)
 class ProductListView(APIView):
     """
     View to retrieve the list of products with filtering, sorting, and searching.
     """
 
     def get(self, request, *args, **kwargs):
-        products = Product.objects.filter(is_active=True)
-        serializer = BasicProductSerializer(products, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    
+        params = ProductFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        products = filter_products(
+            Product.objects.filter(is_active=True), params.validated_data
+        )
+        products = with_min_price(ProductListSerializer.setup_eager_loading(products))
+
+        paginator = KeysetPagination(ordering=params.validated_data["ordering"])
+        page = paginator.paginate_queryset(products, request, view=self)
+        serializer = ProductListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+@method_decorator(
+    cache_response(
+        Product,
+        ProductVariant,
+        ProductVariantAttributeValue,
+        Attribute,
+        AttributeValue,
+        Category,
+        Tag,
+        ProductType,
+    ),
+    name="dispatch",
+)
+class ProductFacetView(APIView):
+    """
+    View to retrieve products filtered by attribute values,
+    together with per-value counts for every filterable attribute.
+    """
+
+    def get(self, request, *args, **kwargs):
+        params = FacetFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        products = filter_products(
+            Product.objects.filter(is_active=True), params.validated_data
+        )
+        selection = get_selection(params.validated_data.get("value"))
+        if can_use_precomputed(params.validated_data, selection):
+            facets = get_precomputed_facet_counts(
+                params.validated_data.get("category"),
+                params.validated_data.get("product_type"),
+            )
+        else:
+            facets = get_facet_counts(products, selection)
+
+        products = with_min_price(
+            ProductListSerializer.setup_eager_loading(
+                filter_by_selection(products, selection)
+            )
+        )
+        paginator = KeysetPagination(ordering=params.validated_data["ordering"])
+        page = paginator.paginate_queryset(products, request, view=self)
+        serializer = ProductListSerializer(page, many=True)
+
+        response = paginator.get_paginated_response(serializer.data)
+        response.data["facets"] = facets
+        return response
+
+
+@method_decorator(
+    cache_response(Product, ProductVariant, Category, Tag, ProductType), name="dispatch"
+)
+class ProductSearchView(APIView):
+    """
+    View to search products by name, description, tags and categories.
+    """
+
+    def get(self, request, *args, **kwargs):
+        params = ProductSearchSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        products = filter_products(
+            Product.objects.filter(is_active=True), params.validated_data
+        )
+        products = search_products(products, params.validated_data["q"])
+        products = with_min_price(ProductListSerializer.setup_eager_loading(products))
+
+        serializer = ProductListSerializer(
+            products[: params.validated_data["page_size"]], many=True
+        )
+        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+
 
+class ProductSuggestView(APIView):
+    """
+    View to complete product, category and tag names while the user types.
+    Served from an in-process index, so it does not touch the database.
+    """
+
+    def get(self, request, *args, **kwargs):
+        params = SuggestQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
 
+        results = suggest(params.validated_data["q"], params.validated_data["limit"])
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+@method_decorator(cache_response(), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(
+        lambda request, slug: Product.objects.filter(slug=slug, is_active=True),
+        related=PRODUCT_READ_RELATED,
+    ),
+    name="get",
+)
 class ProductDetailView(APIView):
     """
     View to retrieve the details of a specific product.
     """
 
     def get(self, request, slug):
-        product = get_object_or_404(Product, slug=slug, is_active=True)
+        products = ProductReadSerializer.setup_eager_loading(Product.objects.all())
+        product = get_object_or_404(products, slug=slug, is_active=True)
         serializer = ProductReadSerializer(product)
         return Response(serializer.data, status=status.HTTP_200_OK)
-
@@ -1,9 +1,16 @@
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from Product.serializers import TagSerializer, ProductReadSerializer
-from Product.models import Tag
+from Product.serializers import (
+    PRODUCT_READ_RELATED,
+    ProductReadSerializer,
+    TagSerializer,
+)
+from Product.models import Category, Product, ProductType, Tag
+from Product.response_cache import cache_response
+from core.conditional import conditional_on_queryset
 
 # where we need Tags
 # 1. Tag list for filtering products
@@ -11,6 +18,11 @@ from Product.models import Tag
 # 3. Tag dropdown filter for products
 
 
+@method_decorator(cache_response(Tag), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(lambda request: Tag.objects.filter(is_active=True)),
+    name="get",
+)
 class TagListView(APIView):
     """
     View to retrieve the list of tags.
@@ -20,9 +32,13 @@ class TagListView(APIView):
         tags = Tag.objects.filter(is_active=True)
         serializer = TagSerializer(tags, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
 
 
+@method_decorator(cache_response(), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(lambda request, slug: Tag.objects.filter(slug=slug)),
+    name="get",
+)
 class TagDetailView(APIView):
     """
     View to retrieve the details of a specific tag.
@@ -32,8 +48,18 @@ class TagDetailView(APIView):
         tag = get_object_or_404(Tag, slug=slug)
         serializer = TagSerializer(tag)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
 
+
+@method_decorator(cache_response(Product, Category, Tag, ProductType), name="dispatch")
+@method_decorator(
+    conditional_on_queryset(
+        lambda request, slug: Product.objects.filter(
+            tags__slug=slug, tags__is_active=True, is_active=True
+        ),
+        related=PRODUCT_READ_RELATED,
+    ),
+    name="get",
+)
 class ProductsByTagView(APIView):
     """
     View to retrieve products associated with a specific tag.
@@ -41,9 +67,8 @@ class ProductsByTagView(APIView):
 
     def get(self, request, slug):
         tag = get_object_or_404(Tag, slug=slug, is_active=True)
-        products = tag.products.filter(is_active=True)
+        products = ProductReadSerializer.setup_eager_loading(
+            tag.products.filter(is_active=True)
+        )
         serializer = ProductReadSerializer(products, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
-
-        
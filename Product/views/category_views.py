@@ -1,10 +1,32 @@
 from django.shortcuts import render
+from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from Product.serializers import CategorySerializer, CategoryBasicSerializer
-from Product.models import Category
+from Product.breadcrumbs import get_breadcrumbs
+from Product.serializers import (
+    CategorySerializer,
+    CategoryBasicSerializer,
+    ProductListSerializer,
+    build_category_tree,
+)
+from Product.models import Category, Product, ProductType, ProductVariant, Tag
+from Product.filters import (
+    ProductFilterSerializer,
+    filter_products,
+    in_category_subtree,
+    with_min_price,
+)
+from Product.response_cache import cache_response
+from Product.cache import (
+    CATEGORY_COUNT_VERSION,
+    CATEGORY_VERSION,
+    cached_json_response,
+    catalog_version_condition,
+)
+from core.pagination import KeysetPagination
 
 
 # where we need Categories?
@@ -13,32 +35,61 @@ from Product.models import Category
 # 3. Breadcrumbs - Home > Electronics > Phones > Android
 
 
+@method_decorator(
+    catalog_version_condition(CATEGORY_VERSION, CATEGORY_COUNT_VERSION), name="get"
+)
 class CategoryTreeView(APIView):
     """
     View to retrieve the category tree with nested subcategories.
     """
 
     def get(self, request, *args, **kwargs):
-        categories = Category.objects.filter(parent=None, is_active=True)
-        serializer = CategorySerializer(categories, many=True)
+        return cached_json_response(
+            CATEGORY_VERSION,
+            "tree",
+            self.build_tree,
+            depends_on=[CATEGORY_COUNT_VERSION],
+        )
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    @staticmethod
+    def build_tree():
+        categories = Category.objects.filter(is_active=True).order_by("tree_id", "lft")
+        return build_category_tree(categories)
 
 
+@method_decorator(catalog_version_condition(CATEGORY_VERSION), name="get")
 class CategoryDropdownView(APIView):
     """
     View to retrieve categories with their subcategories for dropdown filters.
     """
 
     def get(self, request):
+        return cached_json_response(CATEGORY_VERSION, "dropdown", self.build_dropdown)
+
+    @staticmethod
+    def build_dropdown():
         categories = Category.objects.filter(parent=None, is_active=True)
-        serializer = CategoryBasicSerializer(categories, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return CategoryBasicSerializer(categories, many=True).data
 
 
-# Breadcrumbs - for this view we need serializer (only id, name, slug)
+@method_decorator(catalog_version_condition(CATEGORY_VERSION), name="get")
+class CategoryBreadcrumbsView(APIView):
+    """
+    Returns the path from the root down to the category (id, name, slug),
+    e.g. Home > Electronics > Phones > Android.
+    """
+
+    def get(self, request, slug):
+        breadcrumbs = get_breadcrumbs(slug)
+        if breadcrumbs is None:
+            raise Http404
+        return Response(breadcrumbs, status=status.HTTP_200_OK)
 
 
+@method_decorator(cache_response(Category), name="dispatch")
+@method_decorator(
+    catalog_version_condition(CATEGORY_VERSION, CATEGORY_COUNT_VERSION), name="get"
+)
 class CategoryDetailView(APIView):
     """
     Returns full detail of a category including children.
@@ -48,3 +99,32 @@ class CategoryDetailView(APIView):
         category = get_object_or_404(Category, slug=slug)
         serializer = CategorySerializer(category)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@method_decorator(
+    cache_response(Product, ProductVariant, Category, Tag, ProductType), name="dispatch"
+)
+class CategoryProductsView(APIView):
+    """
+    Lists the products of a category and of all its subcategories,
+    paginated, with the filters and orderings of the product list.
+    """
+
+    def get(self, request, slug):
+        category = get_object_or_404(Category, slug=slug, is_active=True)
+        params = ProductFilterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = {**params.validated_data, "category": None}
+
+        products = filter_products(
+            Product.objects.filter(is_active=True).filter(
+                in_category_subtree(category)
+            ),
+            filters,
+        )
+        products = with_min_price(ProductListSerializer.setup_eager_loading(products))
+
+        paginator = KeysetPagination(ordering=filters["ordering"])
+        page = paginator.paginate_queryset(products, request, view=self)
+        serializer = ProductListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
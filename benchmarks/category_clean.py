@@ -0,0 +1,169 @@
+"""
+Regression benchmark for the cycle check of category edits:
+
+    python -m benchmarks.category_clean --nodes 10000
+
+Builds one top-level category with a subtree of ``--nodes`` categories in
+a throwaway test database, then times ``Category.clean`` and
+``BaseCategorySerializer.validate`` when the top-level category is given a
+new parent. Neither may load the subtree: the exit status is 1 if either
+runs more queries than in ``QUERY_BUDGETS``.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Category.clean: the case-insensitive name check; validate: none
+QUERY_BUDGETS = {"clean": 1, "serializer_validate": 0}
+
+
+def plan_subtree(nodes, fanout=100):
+    """
+    Returns ``[(slug, parent slug, level, lft, rght), ...]`` in pre-order for
+    a root with ``nodes`` descendants: branches of up to ``fanout`` leaves.
+    """
+    plan = [("root", None, 0)]
+    branch = 0
+    while len(plan) <= nodes:
+        plan.append((f"branch-{branch}", "root", 1))
+        for leaf in range(min(fanout, nodes + 1 - len(plan))):
+            plan.append((f"leaf-{branch}-{leaf}", f"branch-{branch}", 2))
+        branch += 1
+
+    bounds = [[0, 0] for _ in plan]
+    counter = 1
+    open_nodes = []
+    for index, (_, _, level) in enumerate(plan):
+        while open_nodes and plan[open_nodes[-1]][2] >= level:
+            bounds[open_nodes.pop()][1] = counter
+            counter += 1
+        bounds[index][0] = counter
+        counter += 1
+        open_nodes.append(index)
+    for index in reversed(open_nodes):
+        bounds[index][1] = counter
+        counter += 1
+    return [row + tuple(bound) for row, bound in zip(plan, bounds)]
+
+
+def build_subtree(nodes):
+    """
+    Bulk-creates the subtree of ``plan_subtree`` as tree 2, one INSERT
+    batch per level instead of a save per node, and an unrelated root.
+    """
+    from Product.models import Category
+
+    Category.objects.create(name="Other", slug="other")
+    plan = plan_subtree(nodes)
+    created = {}
+    for depth in range(3):
+        rows = [
+            Category(
+                name=slug.replace("-", " ").title(),
+                slug=slug,
+                parent=created.get(parent),
+                tree_id=2,
+                lft=lft,
+                rght=rght,
+                mptt_level=level,
+            )
+            for slug, parent, level, lft, rght in plan
+            if level == depth
+        ]
+        for category in Category.objects.bulk_create(rows, batch_size=1000):
+            created[category.slug] = category
+    return created["root"]
+
+
+def measure(check, iterations):
+    from django.db import connection
+
+    queries = []
+    with connection.execute_wrapper(
+        lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)
+    ):
+        check()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        check()
+        timings.append(time.perf_counter() - start)
+    return {
+        "queries": len(queries),
+        "p50_ms": round(statistics.median(timings) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark category cycle checks.")
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark-only")
+    import django
+
+    django.setup()
+
+    from django.core.exceptions import ValidationError
+    from django.db import connection
+    from Product.models import Category
+    from Product.serializers import CategoryBasicSerializer
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        root = build_subtree(args.nodes)
+        other = Category.objects.get(slug="other")
+        deepest = Category.objects.filter(tree_id=root.tree_id).order_by("-lft")[0]
+
+        root.parent = deepest
+        try:
+            root.clean()
+        except ValidationError:
+            pass
+        else:
+            raise AssertionError("a descendant was accepted as the parent")
+
+        def clean():
+            root.parent = other
+            root.clean()
+
+        def validate():
+            CategoryBasicSerializer(root).validate({"parent": other})
+
+        results = {
+            "nodes": args.nodes,
+            "database": connection.vendor,
+            "clean": measure(clean, args.iterations),
+            "serializer_validate": measure(validate, args.iterations),
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    failed = False
+    for label, budget in QUERY_BUDGETS.items():
+        result = results[label]
+        print(
+            f"{label:<20} p50 {result['p50_ms']:>8.3f} ms  {result['queries']} queries"
+        )
+        if result["queries"] > budget:
+            failed = True
+            print(f"  over the budget of {budget} queries", file=sys.stderr)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Compares two benchmark result files:
+
+    python -m benchmarks.compare results/abc1234.json results/def5678.json
+
+Lists every route measured in both, and exits with status 1 when a
+route got slower than --threshold or runs more queries than before.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(base, head, metric="p50_ms", threshold=0.2):
+    """
+    Yields ``(size, label, base_route, head_route, regressed)`` for the
+    routes present in both reports.
+    """
+    for size, head_size in head["sizes"].items():
+        base_routes = base["sizes"].get(size, {}).get("routes", {})
+        for label, head_route in head_size["routes"].items():
+            base_route = base_routes.get(label)
+            if base_route is None:
+                continue
+            slower = head_route[metric] > base_route[metric] * (1 + threshold)
+            more_queries = head_route["queries"] > base_route["queries"]
+            yield size, label, base_route, head_route, slower or more_queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs.")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument(
+        "--metric",
+        default="p50_ms",
+        choices=["mean_ms", "p50_ms", "p90_ms", "p95_ms", "p99_ms"],
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown as a fraction, 0.2 = 20%%.",
+    )
+    args = parser.parse_args(argv)
+
+    base, head = load(args.base), load(args.head)
+    print(f"{base['commit']} -> {head['commit']} ({args.metric})")
+
+    regressions = 0
+    for size, label, before, after, regressed in compare(
+        base, head, args.metric, args.threshold
+    ):
+        change = (
+            (after[args.metric] / before[args.metric] - 1) if before[args.metric] else 0
+        )
+        regressions += regressed
+        print(
+            f"{'!' if regressed else ' '} {size:>8} {label:<32}"
+            f" {before[args.metric]:>9.2f} -> {after[args.metric]:>9.2f} ms"
+            f" ({change:+.0%})"
+            f"  queries {before['queries']} -> {after['queries']}"
+        )
+
+    if regressions:
+        print(f"{regressions} regression(s).")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Compares the JSON renderers on product list pages:
+
+    python -m benchmarks.renderers --size 10000 --page-size 100
+
+Seeds a catalog into a throwaway test database, serializes one product list
+page the way ProductListView does, then times rendering it with DRF's
+JSONRenderer and with core.renderers.ORJSONRenderer.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def time_render(renderer, data, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        renderer.render(data)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the JSON renderers.")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark-only")
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from rest_framework.renderers import JSONRenderer
+
+    from benchmarks.seed import seed_catalog
+    from core.renderers import ORJSONRenderer, orjson
+    from Product.filters import with_min_price
+    from Product.models import Product
+    from Product.serializers import ProductListSerializer
+
+    if orjson is None:
+        parser.error("orjson is not installed")
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        seed_catalog(args.size, seed=args.seed)
+        products = with_min_price(
+            ProductListSerializer.setup_eager_loading(
+                Product.objects.filter(is_active=True)
+            )
+        ).order_by("-created_at", "-id")[: args.page_size]
+        # the shape of a KeysetPagination response
+        data = {
+            "next": "http://testserver/api/products/?cursor=cD0yMDI1",
+            "previous": None,
+            "results": ProductListSerializer(products, many=True).data,
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    default, fast = JSONRenderer(), ORJSONRenderer()
+    content = default.render(data)
+    if fast.render(data) != content:
+        print("warning: the renderers disagree on this page", file=sys.stderr)
+
+    results = {
+        "products": args.size,
+        "page_size": len(data["results"]),
+        "response_bytes": len(content),
+        "iterations": args.iterations,
+    }
+    for label, renderer in [("JSONRenderer", default), ("ORJSONRenderer", fast)]:
+        results[label] = round(time_render(renderer, data, args.iterations) * 1000, 4)
+        print(f"{label:<16} p50 {results[label]:>8.3f} ms")
+    results["speedup"] = round(results["JSONRenderer"] / results["ORJSONRenderer"], 2)
+    print(f"speedup          {results['speedup']}x ({len(content)} bytes)")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+The requests the benchmark sends: at least one per named route under
+Product/urls/ and Users/urls.py, with the query strings that exercise
+the interesting paths (filters, facets, the second keyset page).
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.db.models import Count
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from Product.models import (
+    Attribute,
+    AttributeValue,
+    Category,
+    Product,
+    ProductType,
+    Tag,
+)
+from benchmarks.seed import BENCHMARK_USER
+
+# Routes that cannot be reached: "login" shares its path with
+# "token_obtain_pair", which Django resolves first.
+UNREACHABLE = {"login": "shadowed by token_obtain_pair"}
+
+
+class Route:
+    """
+    One benchmarked request. ``build(context, i)`` returns the path plus
+    the ``data`` and ``headers`` of the i-th request, so write routes can
+    send a fresh payload every time.
+    """
+
+    def __init__(self, name, method="GET", label=None, build=None, kwargs=None):
+        self.name = name
+        self.method = method
+        self.label = label or name
+        self.kwargs = kwargs
+        self._build = build
+
+    def path(self, context):
+        kwargs = self.kwargs(context) if self.kwargs else None
+        return reverse(self.name, kwargs=kwargs)
+
+    def build(self, context, i):
+        request = {"path": self.path(context)}
+        if self._build:
+            request.update(self._build(context, i))
+        return request
+
+
+def get_context():
+    """
+    Picks the sample objects the routes request from the seeded catalog:
+    the busiest ones, so lists and facets have something to do.
+    """
+    products = Product.objects.filter(is_active=True)
+    category = (
+        Category.objects.filter(is_active=True, parent__isnull=True)
+        .order_by("-rght", "pk")
+        .first()
+    )
+    tag = Tag.objects.annotate(products_count=Count("products")).order_by(
+        "-products_count", "pk"
+    )
+    product = products.order_by("pk").first()
+    attribute = Attribute.objects.filter(is_filterable=True).order_by("pk").first()
+    value = AttributeValue.objects.filter(attribute=attribute).order_by("pk").first()
+    user = get_user_model().objects.get(email=BENCHMARK_USER["email"])
+
+    return {
+        "category": category.slug,
+        "tag": tag.first().slug,
+        "product": product.slug,
+        "product_type": ProductType.objects.order_by("pk").first().slug,
+        "attribute": attribute.slug,
+        "value": value.slug,
+        "search": product.name.split()[0].lower(),
+        "user": user,
+    }
+
+
+def login(context, i):
+    return {
+        "data": {
+            "email": BENCHMARK_USER["email"],
+            "password": BENCHMARK_USER["password"],
+        }
+    }
+
+
+def refresh(context, i):
+    return {"data": {"refresh": str(RefreshToken.for_user(context["user"]))}}
+
+
+def register(context, i):
+    return {
+        "data": {
+            "email": f"bench-{i}@example.com",
+            "username": f"bench-{i}",
+            "first_name": "Bench",
+            "last_name": "Mark",
+            "password": "StrongPass1@",
+            "confirm_password": "StrongPass1@",
+        }
+    }
+
+
+def logout(context, i):
+    # every logout blacklists its refresh token, so each needs a new one
+    token = RefreshToken.for_user(context["user"])
+    return {
+        "data": {"refresh_token": str(token)},
+        "headers": {"Authorization": f"Bearer {token.access_token}"},
+    }
+
+
+def password_reset(context, i):
+    return {"data": {"email": BENCHMARK_USER["email"]}}
+
+
+def password_reset_confirm(context, i):
+    # the token depends on the password hash, which every request changes
+    user = get_user_model().objects.get(pk=context["user"].pk)
+    return {
+        "data": {
+            "uid": str(user.pk),
+            "token": PasswordResetTokenGenerator().make_token(user),
+            "new_password": BENCHMARK_USER["password"],
+        }
+    }
+
+
+def slug(key):
+    return lambda context: {"slug": context[key]}
+
+
+ROUTES = [
+    # Product
+    Route("attribute-list"),
+    Route("attribute-detail", kwargs=slug("attribute")),
+    Route("attribute-with-values", kwargs=slug("attribute")),
+    Route("attribute-value-list"),
+    Route("attribute-value-detail", kwargs=slug("value")),
+    Route("category-tree"),
+    Route("category-dropdown"),
+    Route("category-detail", kwargs=slug("category")),
+    Route("category-breadcrumbs", kwargs=slug("category")),
+    Route("category-products", kwargs=slug("category")),
+    Route("product-type-list"),
+    Route("product-type-detail", kwargs=slug("product_type")),
+    Route("product-list"),
+    Route(
+        "product-list",
+        label="product-list?category",
+        build=lambda context, i: {
+            "data": {"category": context["category"], "ordering": "-created_at"}
+        },
+    ),
+    Route(
+        "product-list",
+        label="product-list?cursor",
+        build=lambda context, i: {"data": {"cursor": context["cursor"]}},
+    ),
+    Route("product-facets"),
+    Route(
+        "product-facets",
+        label="product-facets?category&value",
+        build=lambda context, i: {
+            "data": {"category": context["category"], "value": context["value"]}
+        },
+    ),
+    Route(
+        "product-search",
+        build=lambda context, i: {"data": {"q": context["search"]}},
+    ),
+    Route(
+        "product-suggest",
+        build=lambda context, i: {"data": {"q": context["search"][:3]}},
+    ),
+    Route("product-detail", kwargs=slug("product")),
+    Route("tag-list"),
+    Route("tag-detail", kwargs=slug("tag")),
+    Route("products-by-tag", kwargs=slug("tag")),
+    # Users
+    Route("token_obtain_pair", "POST", build=login),
+    Route("token_refresh", "POST", build=refresh),
+    Route("register", "POST", build=register),
+    Route("logout", "POST", build=logout),
+    Route("password_reset", "POST", build=password_reset),
+    Route("password_reset_confirm", "POST", build=password_reset_confirm),
+]
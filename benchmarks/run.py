@@ -0,0 +1,212 @@
+"""
+Seeds a catalog at each requested size and benchmarks every route:
+
+    python -m benchmarks.run --sizes 1000 10000 --iterations 50
+    BENCHMARK_DB=postgres python -m benchmarks.run --sizes 100000
+
+Results are written as JSON to benchmarks/results/ (or --output); compare
+two runs with ``python -m benchmarks.compare``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(timings, percent):
+    """
+    Nearest-rank percentile of sorted ``timings``.
+    """
+    rank = max(1, round(percent / 100 * len(timings)))
+    return timings[min(rank, len(timings)) - 1]
+
+
+def summarize(timings):
+    timings = sorted(timings)
+    total = sum(timings)
+    ms = lambda seconds: round(seconds * 1000, 3)  # noqa: E731
+    return {
+        "iterations": len(timings),
+        "mean_ms": ms(statistics.fmean(timings)),
+        "min_ms": ms(timings[0]),
+        "p50_ms": ms(percentile(timings, 50)),
+        "p90_ms": ms(percentile(timings, 90)),
+        "p95_ms": ms(percentile(timings, 95)),
+        "p99_ms": ms(percentile(timings, 99)),
+        "max_ms": ms(timings[-1]),
+        "throughput_rps": round(len(timings) / total, 2) if total else None,
+    }
+
+
+class Benchmark:
+    def __init__(self, client, context, iterations, warmup):
+        self.client = client
+        self.context = context
+        self.iterations = iterations
+        self.warmup = warmup
+        self.sent = 0
+
+    def send(self, route):
+        # every request gets a new index, so write payloads never repeat
+        request = route.build(self.context, self.sent)
+        self.sent += 1
+        path = request.pop("path")
+        if route.method == "GET":
+            return self.client.get(path, **request)
+        return self.client.generic(
+            route.method,
+            path,
+            json.dumps(request.pop("data", {})),
+            content_type="application/json",
+            **request,
+        )
+
+    def measure(self, route):
+        from django.db import connection
+
+        for _ in range(self.warmup):
+            self.send(route)
+
+        # counted separately, so counting does not skew the timings
+        queries = []
+        with connection.execute_wrapper(
+            lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)
+        ):
+            response = self.send(route)
+
+        timings = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            self.send(route)
+            timings.append(time.perf_counter() - start)
+
+        return {
+            "route": route.name,
+            "method": route.method,
+            "status": response.status_code,
+            "queries": len(queries),
+            "response_bytes": len(response.content),
+            **summarize(timings),
+        }
+
+
+def run_size(size, routes, iterations, warmup, seed):
+    from django.db import connection
+    from django.test import Client
+    from django.urls import reverse
+
+    from benchmarks.routes import get_context
+    from benchmarks.seed import seed_catalog
+
+    started = time.perf_counter()
+    rows = seed_catalog(size, seed=seed)
+    seeded = time.perf_counter() - started
+
+    client = Client(raise_request_exception=False)
+    context = get_context()
+    next_link = client.get(reverse("product-list")).json()["next"] or ""
+    context["cursor"] = parse_qs(urlparse(next_link).query).get("cursor", [""])[0]
+
+    benchmark = Benchmark(client, context, iterations, warmup)
+    results = {}
+    for route in routes:
+        results[route.label] = benchmark.measure(route)
+        print(
+            f"  {route.label:<32} p50 {results[route.label]['p50_ms']:>9.2f} ms"
+            f"  p95 {results[route.label]['p95_ms']:>9.2f} ms"
+            f"  {results[route.label]['queries']:>4} queries"
+            f"  [{results[route.label]['status']}]"
+        )
+
+    return {
+        "products": size,
+        "rows": rows,
+        "seed_seconds": round(seeded, 2),
+        "vendor": connection.vendor,
+        "routes": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the API routes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--routes", nargs="+", help="Only these route labels, e.g. product-list."
+    )
+    parser.add_argument("--output", help="Result file (default: results/<commit>.json)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark-only")
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from benchmarks.routes import ROUTES, UNREACHABLE
+
+    routes = [
+        route for route in ROUTES if not args.routes or route.label in args.routes
+    ]
+    # locmem email, so password resets do not try to reach an SMTP server
+    setup_test_environment()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "skipped_routes": UNREACHABLE,
+        "sizes": {},
+    }
+
+    for size in args.sizes:
+        print(f"{size} products ({connection.vendor})")
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            report["sizes"][str(size)] = run_size(
+                size, routes, args.iterations, args.warmup, args.seed
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    output = Path(args.output or RESULTS_DIR / f"{commit or 'results'}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.core import serializers
+from django.db import transaction
+
+from Product.cache import (
+    CATEGORY_VERSION,
+    SUGGEST_VERSION,
+    bump_catalog_version,
+    get_catalog_cache,
+)
+from Product.category_counts import rebuild_category_counts
+from Product.facet_counts import rebuild_facet_counts
+from Product.models import Product
+from Product.response_cache import purge_all
+from Product.search import update_search_vectors
+from core.copy_loader import (
+    copy_load,
+    find_fixtures,
+    is_supported,
+    iter_fixture_objects,
+)
+
+GENERATORS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "seeders",
+    "Generators",
+)
+
+# Catalog_fixtures imports its neighbours as top-level modules.
+if GENERATORS not in sys.path:
+    sys.path.insert(0, GENERATORS)
+
+from Catalog_fixtures import generate_catalog  # noqa: E402
+
+BENCHMARK_USER = {
+    "email": "benchmark@example.com",
+    "password": "BenchPass1@",
+    "username": "benchmark",
+    "first_name": "Bench",
+    "last_name": "Mark",
+}
+
+# Fixture files in foreign key order, for backends without COPY.
+LOAD_ORDER = [
+    "ProductType.json",
+    "Tag.json",
+    "Category.json",
+    "Attribute.json",
+    "AttributeValue.json",
+    "Product.json",
+    "ProductVariant.json",
+    "ProductVariantAttributeValue.json",
+]
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def bulk_load(directory, batch_size=2000):
+    """
+    Loads the generated fixtures with ``bulk_create``: the portable, if
+    slower, alternative to COPY. Signals do not run, as with COPY.
+    """
+    loaded = {}
+    for filename in LOAD_ORDER:
+        path = os.path.join(directory, filename)
+        objects = serializers.deserialize("python", iter_fixture_objects(path))
+        for batch in batched(objects, batch_size):
+            model = type(batch[0].object)
+            model._base_manager.bulk_create([item.object for item in batch])
+            loaded[model._meta.db_table] = loaded.get(model._meta.db_table, 0) + len(
+                batch
+            )
+
+            for field in model._meta.local_many_to_many:
+                through = field.remote_field.through
+                rows = [
+                    through(
+                        **{
+                            field.m2m_field_name() + "_id": item.object.pk,
+                            field.m2m_reverse_field_name() + "_id": related_pk,
+                        }
+                    )
+                    for item in batch
+                    for related_pk in item.m2m_data.get(field.name, [])
+                ]
+                through.objects.bulk_create(rows)
+                table = through._meta.db_table
+                loaded[table] = loaded.get(table, 0) + len(rows)
+    return loaded
+
+
+@transaction.atomic
+def seed_catalog(products, seed=0):
+    """
+    Generates a catalog of ``products`` products and loads it into the
+    (empty) current database. Returns ``{table: rows}``.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        generate_catalog(products, directory, seed=seed)
+        if is_supported():
+            loaded = copy_load(find_fixtures([directory]))
+        else:
+            loaded = bulk_load(directory)
+
+    # Neither loader runs the signals that keep these up to date.
+    update_search_vectors(Product.objects.all())
+    rebuild_facet_counts()
+    rebuild_category_counts()
+    get_catalog_cache().clear()
+    bump_catalog_version(CATEGORY_VERSION)
+    bump_catalog_version(SUGGEST_VERSION)
+    purge_all()
+
+    user = BENCHMARK_USER.copy()
+    get_user_model().objects.create_user(
+        user.pop("email"), user.pop("password"), **user
+    )
+
+    return loaded
@@ -0,0 +1,37 @@
+"""
+Settings for the benchmark suite (see benchmarks/run.py).
+
+BENCHMARK_DB=sqlite (default) uses a SQLite file, BENCHMARK_DB=postgres
+the PostgreSQL server configured by the usual DB_* variables. Either way
+the runner creates a separate test database and drops it afterwards.
+"""
+
+import os
+
+from E_Commerce.settings import *  # noqa: F401,F403
+from E_Commerce.settings import BASE_DIR, DATABASES
+
+BENCHMARK_DB = os.environ.get("BENCHMARK_DB", "sqlite")
+
+if BENCHMARK_DB == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "benchmarks" / "benchmark.sqlite3",
+            "TEST": {"NAME": BASE_DIR / "benchmarks" / "benchmark.sqlite3"},
+        }
+    }
+    # FacetCount's NULLS NOT DISTINCT constraint only exists on PostgreSQL
+    SILENCED_SYSTEM_CHECKS = ["models.W047"]
+elif BENCHMARK_DB != "postgres":
+    raise ValueError(
+        f"BENCHMARK_DB must be 'sqlite' or 'postgres', not {BENCHMARK_DB!r}."
+    )
+
+DEBUG = False
+ALLOWED_HOSTS = ["testserver", "localhost"]
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+# Measure the views, not response cache hits: with the cache on, every
+# repeated GET is answered without queries or serializers.
+RESPONSE_CACHE_TIMEOUT = 0
@@ -0,0 +1,26 @@
+import time
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from core.metrics import JWT_AUTH_DURATION, JWT_AUTH_FAILURES
+
+
+class InstrumentedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` that reports its time and rejected tokens to
+    the Prometheus metrics. Requests without a bearer token are not timed.
+    """
+
+    def authenticate(self, request):
+        if self.get_header(request) is None:
+            return None
+
+        start = time.perf_counter()
+        try:
+            return super().authenticate(request)
+        except AuthenticationFailed:
+            JWT_AUTH_FAILURES.inc()
+            raise
+        finally:
+            JWT_AUTH_DURATION.observe(time.perf_counter() - start)
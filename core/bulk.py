@@ -0,0 +1,212 @@
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import transaction
+
+
+class BatchValidationError(ValidationError):
+    """
+    Raised by ``validate_batch``. ``errors`` maps the index of every invalid
+    instance to its ``ValidationError``.
+    """
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} of the objects are invalid.")
+        self.errors = errors
+
+
+def merge_errors(error, other):
+    """
+    Combines two ``ValidationError`` of the same object; either may be None.
+    """
+    if error is None:
+        return other
+    if other is None:
+        return error
+    return ValidationError(other.update_error_dict(error.update_error_dict({})))
+
+
+def get_unique_checks(model):
+    """
+    Field-name tuples whose values must be unique: unique fields,
+    ``unique_together`` and unconditional ``UniqueConstraint``.
+    """
+    checks = [
+        (field.name,)
+        for field in model._meta.concrete_fields
+        if field.unique and not field.primary_key
+    ]
+    checks += [tuple(fields) for fields in model._meta.unique_together]
+    checks += [
+        tuple(constraint.fields) for constraint in model._meta.total_unique_constraints
+    ]
+    return checks
+
+
+def check_unique(model, instances, fields):
+    """
+    Checks one unique field set for the whole batch with a single query.
+    Returns ``{index: ValidationError}``.
+    """
+    attnames = [model._meta.get_field(field).attname for field in fields]
+
+    indexes = {}
+    for index, instance in enumerate(instances):
+        key = tuple(getattr(instance, attname) for attname in attnames)
+        if None not in key:
+            indexes.setdefault(key, []).append(index)
+    if not indexes:
+        return {}
+
+    batch_pks = [instance.pk for instance in instances if instance.pk]
+    taken = set(
+        model._default_manager.exclude(pk__in=batch_pks)
+        .filter(**{f"{attnames[0]}__in": {key[0] for key in indexes}})
+        .values_list(*attnames)
+    )
+
+    errors = {}
+    error_key = fields[0] if len(fields) == 1 else NON_FIELD_ERRORS
+    for key, key_indexes in indexes.items():
+        clashing = key_indexes if key in taken else key_indexes[1:]
+        for index in clashing:
+            message = instances[index].unique_error_message(model, fields)
+            errors[index] = ValidationError({error_key: message})
+    return errors
+
+
+def get_foreign_keys(model):
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if field.many_to_one or field.one_to_one
+    ]
+
+
+def check_foreign_keys(model, instances, fields):
+    """
+    Checks that the referenced rows exist, one query per foreign key for
+    the whole batch (``full_clean`` would run one per instance).
+    Returns ``{index: ValidationError}``.
+    """
+    errors = {}
+    for field in fields:
+        target = field.remote_field.field_name
+        values = {}
+        for index, instance in enumerate(instances):
+            value = getattr(instance, field.attname)
+            if value is None:
+                if not field.null:
+                    error = ValidationError({field.name: field.error_messages["null"]})
+                    errors[index] = merge_errors(errors.get(index), error)
+                continue
+            values.setdefault(value, []).append(index)
+        if not values:
+            continue
+
+        queryset = field.remote_field.model._base_manager.complex_filter(
+            field.get_limit_choices_to()
+        )
+        found = set(
+            queryset.filter(**{f"{target}__in": list(values)}).values_list(
+                target, flat=True
+            )
+        )
+        for value, value_indexes in values.items():
+            if value in found:
+                continue
+            message = field.error_messages["invalid"] % {
+                "model": field.remote_field.model._meta.verbose_name,
+                "pk": value,
+                "field": target,
+                "value": value,
+            }
+            for index in value_indexes:
+                error = ValidationError({field.name: message})
+                errors[index] = merge_errors(errors.get(index), error)
+    return errors
+
+
+def validate_batch(model, instances):
+    """
+    Validates ``instances`` of ``model`` together.
+
+    Field and ``clean()`` validation still runs per instance, but the checks
+    that need a query (foreign keys, uniqueness, the ``clean_batch`` hooks
+    of the model mixins) run once for the batch instead of once per instance.
+    Raises ``BatchValidationError``.
+    """
+    foreign_keys = get_foreign_keys(model)
+    exclude = [field.name for field in foreign_keys]
+
+    errors = {}
+    for index, instance in enumerate(instances):
+        instance._in_batch_validation = True
+        try:
+            instance.full_clean(
+                exclude=exclude, validate_unique=False, validate_constraints=False
+            )
+        except ValidationError as error:
+            errors[index] = error
+        finally:
+            del instance._in_batch_validation
+
+    batch_errors = [check_foreign_keys(model, instances, foreign_keys)]
+    batch_errors += [
+        check_unique(model, instances, fields) for fields in get_unique_checks(model)
+    ]
+    clean_batch = getattr(model, "clean_batch", None)
+    if callable(clean_batch):
+        batch_errors.append(clean_batch(instances))
+
+    for found in batch_errors:
+        for index, error in found.items():
+            errors[index] = merge_errors(errors.get(index), error)
+
+    if errors:
+        raise BatchValidationError(dict(sorted(errors.items())))
+
+
+def get_bulk_update_fields(model):
+    return [
+        field.name
+        for field in model._meta.concrete_fields
+        if not field.primary_key and not getattr(field, "auto_now_add", False)
+    ]
+
+
+def bulk_save(model, instances, batch_size=1000, update_fields=None):
+    """
+    Validates ``instances`` with ``validate_batch`` and writes them with
+    ``bulk_create`` (new) and ``bulk_update`` (existing) in one transaction.
+
+    Like any bulk write this skips ``save()`` and the model signals: slugs
+    must already be set and derived data (facet counts, search vectors)
+    is refreshed by the caller. Not meant for tree models.
+    Returns ``(created, updated)``.
+    """
+    instances = list(instances)
+    validate_batch(model, instances)
+
+    created = [instance for instance in instances if instance._state.adding]
+    updated = [instance for instance in instances if not instance._state.adding]
+
+    fields = update_fields or get_bulk_update_fields(model)
+    auto_now_fields = [
+        field
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) and field.name in fields
+    ]
+    for instance in updated:
+        for field in auto_now_fields:
+            field.pre_save(instance, add=False)
+
+    with transaction.atomic():
+        model._default_manager.bulk_create(created, batch_size=batch_size)
+        if updated:
+            model._default_manager.bulk_update(updated, fields, batch_size=batch_size)
+
+    for instance in instances:
+        remember = getattr(instance, "_remember_original_values", None)
+        if callable(remember):
+            remember()
+
+    return created, updated
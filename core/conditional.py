@@ -0,0 +1,73 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+
+
+def get_queryset_state(queryset, related=()):
+    """
+    Returns ``(counts, last_modified)`` of ``queryset`` with one aggregate
+    query and without loading rows: how many rows there are and how many
+    ``related`` rows they show (e.g. ``"tags"``), and the latest
+    ``updated_at`` among all of them.
+    """
+    if related:
+        # A fresh queryset, so the filters do not narrow the related joins.
+        queryset = queryset.model._default_manager.filter(pk__in=queryset.values("pk"))
+    aggregates = {"count": Count("pk", distinct=True), "updated": Max("updated_at")}
+    for i, name in enumerate(related):
+        aggregates[f"count_{i}"] = Count(name, distinct=True)
+        aggregates[f"updated_{i}"] = Max(f"{name}__updated_at")
+    state = queryset.aggregate(**aggregates)
+
+    counts = [value for key, value in state.items() if key.startswith("count")]
+    timestamps = [
+        value
+        for key, value in state.items()
+        if key.startswith("updated") and value is not None
+    ]
+    return counts, max(timestamps, default=None)
+
+
+def make_etag(request, *parts):
+    """
+    A strong ETag over ``parts`` and what else the body depends on: the
+    path with its query string and the requested media type.
+    """
+    raw = "|".join(
+        str(part)
+        for part in [request.get_full_path(), request.META.get("HTTP_ACCEPT", "")]
+        + list(parts)
+    )
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+def conditional_on_queryset(get_queryset, related=()):
+    """
+    View decorator for conditional GETs of a view that shows the rows of
+    ``get_queryset(request, *args, **kwargs)`` and their ``related`` rows.
+    The ETag follows the row counts and the latest ``updated_at`` (see
+    ``get_queryset_state``), so it also changes when rows are deleted;
+    Last-Modified is the latter.
+    A matching request gets a 304 before the view loads anything.
+    """
+
+    def get_state(request, *args, **kwargs):
+        # the ETag and Last-Modified functions share one query
+        if not hasattr(request, "_queryset_state"):
+            request._queryset_state = get_queryset_state(
+                get_queryset(request, *args, **kwargs), related
+            )
+        return request._queryset_state
+
+    def etag(request, *args, **kwargs):
+        counts, last_modified = get_state(request, *args, **kwargs)
+        if not counts[0]:
+            # nothing to show: leave the 404 or empty list unconditional
+            return None
+        return make_etag(request, *counts, last_modified.isoformat())
+
+    def last_modified(request, *args, **kwargs):
+        return get_state(request, *args, **kwargs)[1]
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
@@ -0,0 +1,271 @@
+import datetime
+import json
+import tempfile
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.utils import timezone
+
+FIXTURE_SUFFIXES = [".json", ".jsonl"]
+
+# Characters with a meaning in the COPY text format.
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+COPY_NULL = "\\N"
+
+
+class FixtureLoadError(Exception):
+    """
+    Raised for fixture content the loader cannot turn into rows.
+    """
+
+
+###################################
+# reading
+###################################
+
+
+def iter_json_array(file, chunk_size=1 << 16):
+    """
+    Yields the elements of a JSON array one by one, reading ``file`` in
+    chunks, so large fixtures are never held in memory as a whole.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    exhausted = False
+
+    while True:
+        buffer = buffer.lstrip()
+        if started:
+            buffer = buffer.lstrip(",").lstrip()
+        if buffer:
+            if not started:
+                if buffer[0] != "[":
+                    raise FixtureLoadError("A fixture must be a JSON array.")
+                buffer = buffer[1:]
+                started = True
+                continue
+            if buffer[0] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise FixtureLoadError(
+                        "The fixture ends in the middle of an object."
+                    )
+            else:
+                yield element
+                buffer = buffer[end:]
+                continue
+
+        if exhausted:
+            if started:
+                raise FixtureLoadError("The fixture array is not closed.")
+            return
+        chunk = file.read(chunk_size)
+        exhausted = not chunk
+        buffer += chunk
+
+
+def iter_fixture_objects(path):
+    """
+    Yields the serialized objects of a ``.json`` fixture (an array, as
+    written by ``dumpdata``) or a ``.jsonl`` file with one object per line.
+    """
+    with open(path, encoding="utf-8") as file:
+        if Path(path).suffix == ".jsonl":
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(file)
+
+
+def find_fixtures(paths):
+    fixtures = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            fixtures += sorted(
+                child for child in path.iterdir() if child.suffix in FIXTURE_SUFFIXES
+            )
+        else:
+            fixtures.append(path)
+    return fixtures
+
+
+###################################
+# COPY rows
+###################################
+
+
+def copy_text(value):
+    """
+    Formats one value for the COPY text format.
+    """
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value).translate(COPY_ESCAPES)
+
+
+class TableSpool:
+    """
+    Rows of one table in COPY text format, spooled to a temporary file.
+    """
+
+    def __init__(self, model, columns):
+        self.model = model
+        self.table = model._meta.db_table
+        self.columns = columns
+        self.rows = 0
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def write(self, values):
+        self.file.write("\t".join(copy_text(value) for value in values) + "\n")
+        self.rows += 1
+
+    def copy_sql(self):
+        quote = connection.ops.quote_name
+        columns = ", ".join(quote(column) for column in self.columns)
+        return f"COPY {quote(self.table)} ({columns}) FROM STDIN"
+
+    def close(self):
+        self.file.close()
+
+
+class FixtureSpooler:
+    """
+    Converts serialized objects into per-table spools: one for every
+    model and one for every many-to-many table filled by the fixtures.
+    """
+
+    def __init__(self):
+        self.spools = {}
+        self.now = timezone.now()
+
+    def get_spool(self, model, columns):
+        if model not in self.spools:
+            self.spools[model] = TableSpool(model, columns)
+        return self.spools[model]
+
+    def field_value(self, field, fields):
+        if field.attname in fields:
+            raw = fields[field.attname]
+        elif field.name in fields:
+            raw = fields[field.name]
+        elif getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            raw = self.now
+        else:
+            raw = field.get_default()
+
+        if field.is_relation:
+            if isinstance(raw, (list, dict)):
+                raise FixtureLoadError(
+                    f"{field.model.__name__}.{field.name}: natural keys are not supported."
+                )
+            return field.get_db_prep_save(raw, connection)
+        return field.get_db_prep_save(field.to_python(raw), connection)
+
+    def add(self, obj):
+        try:
+            model = apps.get_model(obj["model"])
+            pk = obj["pk"]
+        except (KeyError, LookupError) as error:
+            raise FixtureLoadError(f"Invalid fixture object: {error}") from error
+        fields = obj.get("fields", {})
+
+        concrete_fields = model._meta.concrete_fields
+        spool = self.get_spool(model, [field.column for field in concrete_fields])
+        spool.write(
+            [
+                pk if field.primary_key else self.field_value(field, fields)
+                for field in concrete_fields
+            ]
+        )
+
+        for field in model._meta.local_many_to_many:
+            if not fields.get(field.name):
+                continue
+            through = field.remote_field.through
+            through_spool = self.get_spool(
+                through, [field.m2m_column_name(), field.m2m_reverse_name()]
+            )
+            for related_pk in fields[field.name]:
+                through_spool.write([pk, related_pk])
+
+    def ordered_spools(self):
+        """
+        Spools in foreign key dependency order: a table comes after the
+        tables it references (references to itself are left to the
+        deferred constraint check).
+        """
+        dependencies = {
+            model: {
+                field.related_model
+                for field in model._meta.concrete_fields
+                if field.is_relation
+                and field.related_model in self.spools
+                and field.related_model is not model
+            }
+            for model in self.spools
+        }
+
+        ordered = []
+        while dependencies:
+            ready = [model for model, needs in dependencies.items() if not needs]
+            # A cycle: take the rest in file order, the constraints are deferred.
+            ready = ready or list(dependencies)
+            for model in ready:
+                ordered.append(self.spools[model])
+                del dependencies[model]
+            for needs in dependencies.values():
+                needs.difference_update(ready)
+        return ordered
+
+    def close(self):
+        for spool in self.spools.values():
+            spool.close()
+
+
+def is_supported():
+    """
+    COPY is PostgreSQL only.
+    """
+    return connection.vendor == "postgresql"
+
+
+def copy_load(paths, truncate=False):
+    """
+    Loads fixture files with one ``COPY FROM STDIN`` per table, in foreign
+    key order and in one transaction, then resets the id sequences.
+    ``save()`` and signals do not run. Returns ``{table: rows}``.
+    """
+    spooler = FixtureSpooler()
+    try:
+        for path in find_fixtures(paths):
+            for obj in iter_fixture_objects(path):
+                spooler.add(obj)
+
+        spools = spooler.ordered_spools()
+        quote = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            if truncate and spools:
+                tables = ", ".join(quote(spool.table) for spool in spools)
+                cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+            for spool in spools:
+                spool.file.seek(0)
+                cursor.copy_expert(spool.copy_sql(), spool.file)
+
+            models = [spool.model for spool in spools]
+            for sql in connection.ops.sequence_reset_sql(no_style(), models):
+                cursor.execute(sql)
+
+        return {spool.table: spool.rows for spool in spools}
+    finally:
+        spooler.close()
@@ -0,0 +1,162 @@
+import json
+import logging
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+from core.metrics import observe_request
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    What one request spent: SQL queries and their time, serializer time
+    (excluding the queries serializers trigger) and the whole request.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.started = time.perf_counter()
+        self.total_time = None
+
+    def execute(self, execute, sql, params, many, context):
+        """
+        ``connection.execute_wrapper`` hook counting and timing queries.
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self.started
+
+
+def get_current_metrics():
+    """
+    Returns the ``RequestMetrics`` of the request being handled, or None
+    outside of ``RequestMetricsMiddleware``.
+    """
+    return _current.get()
+
+
+class TimedSerializerMixin:
+    """
+    Mixin for serializers to add their ``to_representation`` time to the
+    request metrics. Only the outermost call counts, so nested and listed
+    serializers are not added twice.
+    """
+
+    def to_representation(self, instance):
+        metrics = get_current_metrics()
+        if metrics is None or metrics.serializer_depth:
+            return super().to_representation(instance)
+
+        metrics.serializer_depth += 1
+        start = time.perf_counter()
+        db_time = metrics.db_time
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_depth -= 1
+            elapsed = time.perf_counter() - start
+            metrics.serializer_time += elapsed - (metrics.db_time - db_time)
+
+
+def get_url_name(request):
+    match = getattr(request, "resolver_match", None)
+    return match.url_name if match and match.url_name else None
+
+
+def get_query_budget(url_name):
+    """
+    The most queries a request to ``url_name`` may run, from the
+    ``QUERY_BUDGETS`` setting (None: unlimited).
+    """
+    budgets = getattr(settings, "QUERY_BUDGETS", {})
+    return budgets.get(url_name, budgets.get("default"))
+
+
+def server_timing(metrics):
+    ms = lambda seconds: f"{seconds * 1000:.2f}"  # noqa: E731
+    return ", ".join(
+        [
+            f'db;dur={ms(metrics.db_time)};desc="{metrics.queries} queries"',
+            f"serializer;dur={ms(metrics.serializer_time)}",
+            f"total;dur={ms(metrics.total_time)}",
+        ]
+    )
+
+
+def can_see_server_timing(request):
+    """
+    Staff users and the clients allowed to scrape /metrics, which exposes
+    the same numbers.
+    """
+    if request.META.get("REMOTE_ADDR") in getattr(settings, "METRICS_ALLOWED_IPS", []):
+        return True
+    user = getattr(request, "user", None)
+    return bool(user and user.is_staff)
+
+
+class RequestMetricsMiddleware:
+    """
+    Records the SQL queries, DB time, serializer time and response size of
+    every request. Adds them as a ``Server-Timing`` header (when
+    ``SERVER_TIMING`` is on, for ``can_see_server_timing`` clients) and
+    logs one JSON line per request, as a warning when the URL name's query
+    budget is exceeded.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.execute))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        metrics.finish()
+
+        url_name = get_url_name(request)
+        observe_request(request, response, metrics, url_name)
+
+        if getattr(settings, "SERVER_TIMING", False) and can_see_server_timing(request):
+            response["Server-Timing"] = server_timing(metrics)
+
+        budget = get_query_budget(url_name)
+        over_budget = budget is not None and metrics.queries > budget
+        level = logging.WARNING if over_budget else logging.INFO
+        # the record is only built when it is going to be logged
+        if logger.isEnabledFor(level):
+            record = {
+                "method": request.method,
+                "path": request.path,
+                "url_name": url_name,
+                "status": response.status_code,
+                "queries": metrics.queries,
+                "db_ms": round(metrics.db_time * 1000, 2),
+                "serializer_ms": round(metrics.serializer_time * 1000, 2),
+                "total_ms": round(metrics.total_time * 1000, 2),
+                "response_bytes": None if response.streaming else len(response.content),
+            }
+            if over_budget:
+                record["query_budget"] = budget
+            logger.log(level, json.dumps(record), extra={"request_metrics": record})
+        return response
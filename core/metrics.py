@@ -0,0 +1,124 @@
+"""
+Prometheus metrics, served by ``metrics_view`` at /metrics.
+
+With several worker processes (gunicorn), set PROMETHEUS_MULTIPROC_DIR to
+an empty directory shared by the workers before they start: every process
+then writes its samples to memory-mapped files there, and /metrics adds
+them up whichever worker answers. Call ``mark_process_dead(pid)`` from the
+server's worker exit hook so the gauges of exited workers are dropped.
+
+The endpoint answers only scrapers allowed by METRICS_ALLOWED_IPS (client
+addresses) or METRICS_TOKEN (``Authorization: Bearer <token>``); with
+neither set it does not exist.
+"""
+
+import os
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Requests Django could not route are grouped under one label value.
+UNMATCHED = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by URL name.",
+    ["method", "url_name"],
+)
+REQUESTS = Counter(
+    "http_requests",
+    "Requests by URL name and status code.",
+    ["method", "url_name", "status"],
+)
+REQUEST_ERRORS = Counter(
+    "http_request_errors",
+    "Responses with a 5xx status code by URL name.",
+    ["url_name"],
+)
+DB_QUERIES = Histogram(
+    "db_queries_per_request",
+    "SQL queries run by one request.",
+    ["url_name"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, float("inf")),
+)
+DB_DURATION = Histogram(
+    "db_duration_seconds",
+    "Time one request spent in SQL queries.",
+    ["url_name"],
+)
+CACHE_REQUESTS = Counter(
+    "catalog_cache_requests",
+    "Catalog cache lookups by namespace and result (hit or miss).",
+    ["namespace", "result"],
+)
+JWT_AUTH_DURATION = Histogram(
+    "jwt_authentication_duration_seconds",
+    "Time spent authenticating JWT bearer tokens.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, float("inf")),
+)
+JWT_AUTH_FAILURES = Counter(
+    "jwt_authentication_failures",
+    "Rejected JWT bearer tokens.",
+)
+
+
+def observe_request(request, response, metrics, url_name):
+    """
+    Records one finished request (see ``RequestMetricsMiddleware``).
+    """
+    url_name = url_name or UNMATCHED
+    REQUEST_LATENCY.labels(request.method, url_name).observe(metrics.total_time)
+    REQUESTS.labels(request.method, url_name, response.status_code).inc()
+    if response.status_code >= 500:
+        REQUEST_ERRORS.labels(url_name).inc()
+    DB_QUERIES.labels(url_name).observe(metrics.queries)
+    DB_DURATION.labels(url_name).observe(metrics.db_time)
+
+
+def observe_cache(namespace, hit):
+    CACHE_REQUESTS.labels(namespace, "hit" if hit else "miss").inc()
+
+
+def get_registry():
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def mark_process_dead(pid):
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)
+
+
+def metrics_view(request):
+    """
+    The metrics in the Prometheus text format.
+    """
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", [])
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not allowed_ips and not token:
+        raise Http404
+
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    has_token = (
+        bool(token)
+        and scheme.lower() == "bearer"
+        and constant_time_compare(credentials, token)
+    )
+    if request.META.get("REMOTE_ADDR") not in allowed_ips and not has_token:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
@@ -1,4 +1,7 @@
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from core.bulk import bulk_save, merge_errors
 
 
 class CleanvalidateMixin:
@@ -11,6 +14,90 @@ class CleanvalidateMixin:
             self.full_clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_save(cls, instances, **kwargs):
+        """
+        Batch counterpart of ``save()``: validates the instances together
+        and writes them with bulk queries (see ``core.bulk.bulk_save``).
+        """
+        return bulk_save(cls, instances, **kwargs)
+
+
+class UniqueSlugRetryMixin:
+    """
+    Retries a save whose generated slug was taken by a concurrent writer
+    between allocation and insert. Slugs set by the caller are never replaced.
+    """
+
+    slug_retry_attempts = 3
+
+    def _has_generated_slug(self):
+        slug = getattr(self, "slug", None)
+        return bool(slug) and getattr(self, "_generated_slug", None) == slug
+
+    def save(self, *args, **kwargs):
+        for attempt in range(self.slug_retry_attempts):
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                last_attempt = attempt + 1 == self.slug_retry_attempts
+                if last_attempt or not self._has_generated_slug():
+                    raise
+                # An empty slug makes the pre_save signal allocate a new one.
+                self.slug = ""
+
+
+class TrackOriginalFieldsMixin:
+    """
+    Remembers the loaded values of ``tracked_fields`` so a save can tell
+    what changed without reading the row again.
+    """
+
+    tracked_fields = []
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_original_values()
+        return instance
+
+    def _remember_original_values(self):
+        self._original_values = {}
+        for field_name in self.tracked_fields:
+            attname = self._meta.get_field(field_name).attname
+            if attname in self.__dict__:
+                self._original_values[field_name] = self.__dict__[attname]
+
+    def get_original_value(self, field_name):
+        """
+        Returns the value ``field_name`` had in the database, or ``None``
+        for an instance that was never saved.
+        """
+        if self._state.adding:
+            return None
+        original_values = getattr(self, "_original_values", {})
+        if field_name not in original_values:
+            # Deferred when loaded (or not tracked): read it once.
+            attname = self._meta.get_field(field_name).attname
+            original_values[field_name] = (
+                self.__class__._base_manager.filter(pk=self.pk)
+                .values_list(attname, flat=True)
+                .first()
+            )
+            self._original_values = original_values
+        return original_values[field_name]
+
+    def has_field_changed(self, field_name):
+        if self._state.adding:
+            return False
+        attname = self._meta.get_field(field_name).attname
+        return self.get_original_value(field_name) != getattr(self, attname)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._remember_original_values()
+
 
 class PreventDeactivationIfUsedMixin:
     """
@@ -30,6 +117,10 @@ class PreventDeactivationIfUsedMixin:
         if callable(super_clean):
             super_clean()
 
+        # core.bulk.validate_batch runs the check below once for the batch.
+        if getattr(self, "_in_batch_validation", False):
+            return
+
         if self.pk and getattr(self, "is_active", True) is False:
             for model_class, related_field in self.get_related_check():
                 filter_kwargs = {related_field: self}
@@ -38,6 +129,35 @@ class PreventDeactivationIfUsedMixin:
                         f"Can't deactivate this object. {model_class.__name__} objects are using it."
                     )
 
+    @classmethod
+    def clean_batch(cls, instances):
+        """
+        Batch form of the deactivation check: one query per related model
+        for all deactivated ``instances``. Returns ``{index: ValidationError}``.
+        """
+        super_clean_batch = getattr(super(), "clean_batch", None)
+        errors = super_clean_batch(instances) if callable(super_clean_batch) else {}
+
+        deactivated = {
+            instance.pk: index
+            for index, instance in enumerate(instances)
+            if instance.pk and getattr(instance, "is_active", True) is False
+        }
+        if not deactivated:
+            return errors
+
+        for model_class, related_field in cls.get_related_check():
+            used = model_class.objects.filter(
+                **{f"{related_field}__in": list(deactivated)}
+            ).values_list(related_field, flat=True)
+            for pk in set(used):
+                index = deactivated[pk]
+                error = ValidationError(
+                    f"Can't deactivate this object. {model_class.__name__} objects are using it."
+                )
+                errors[index] = merge_errors(errors.get(index), error)
+        return errors
+
 
 class CaseInsensitiveUniqueMixin:
     """
@@ -61,6 +181,10 @@ class CaseInsensitiveUniqueMixin:
 
                 setattr(self, field, normalized)
 
+                # core.bulk.validate_batch runs the lookup once for the batch.
+                if getattr(self, "_in_batch_validation", False):
+                    continue
+
                 qs = self.__class__.objects.exclude(pk=self.pk)
                 if qs.filter(**{f"{field}__iexact": normalized}).exists():
                     errors[field] = ValidationError(
@@ -70,3 +194,67 @@ class CaseInsensitiveUniqueMixin:
 
         if errors:
             raise ValidationError(errors)
+
+    @classmethod
+    def clean_batch(cls, instances):
+        """
+        Batch form of the case-insensitive check: one query per field for
+        all ``instances``, which also must not clash with each other.
+        Returns ``{index: ValidationError}``.
+        """
+        super_clean_batch = getattr(super(), "clean_batch", None)
+        errors = super_clean_batch(instances) if callable(super_clean_batch) else {}
+
+        batch_pks = [instance.pk for instance in instances if instance.pk]
+
+        for field in cls.case_insensitive_unique_fileds:
+            indexes = {}
+            for index, instance in enumerate(instances):
+                value = getattr(instance, field, None)
+                if isinstance(value, str):
+                    indexes.setdefault(value.strip().lower(), []).append(index)
+            if not indexes:
+                continue
+
+            taken = set(
+                cls.objects.exclude(pk__in=batch_pks)
+                .annotate(normalized=Lower(field))
+                .filter(normalized__in=list(indexes))
+                .values_list("normalized", flat=True)
+            )
+
+            for value, value_indexes in indexes.items():
+                clashing = value_indexes if value in taken else value_indexes[1:]
+                for index in clashing:
+                    error = ValidationError(
+                        {
+                            field: ValidationError(
+                                f"{cls.__name__} with this {field} already exists (case-insensitive check).",
+                                code="unique_case_insensitive",
+                            )
+                        }
+                    )
+                    errors[index] = merge_errors(errors.get(index), error)
+        return errors
+
+
+class EagerLoadingMixin:
+    """
+    Mixin for serializers to declare the relations they read,
+    so views can load them up front instead of once per object.
+    """
+
+    select_related_fields = []
+    prefetch_related_fields = []
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Returns ``queryset`` with the serializer's relations
+        selected/prefetched.
+        """
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
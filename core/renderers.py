@@ -0,0 +1,95 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:  # optional: ORJSONRenderer falls back to the stdlib
+    orjson = None
+
+
+# Skipped without further checks by has_non_finite_float.
+SCALAR_TYPES = frozenset([str, int, bool, type(None)])
+
+
+def has_non_finite_float(data):
+    """
+    Whether the dicts, lists and tuples of ``data`` hold NaN or an infinity.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if value.__class__ in SCALAR_TYPES:
+            continue
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float) and not math.isfinite(value):
+            return True
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` backed by orjson, which encodes straight to bytes.
+    Types orjson does not handle the way DRF does (Decimal, datetimes,
+    lazy strings, querysets, ...) go through DRF's encoder, so with the
+    default compact, unicode settings the output is the same as
+    ``JSONRenderer``'s.
+
+    Data orjson encodes differently or not at all is handed to
+    ``JSONRenderer``, which renders or rejects it as usual: dict keys that
+    are not strings, integers wider than 64 bits, and NaN or infinities
+    (written as ``null`` by orjson). So is indented output
+    (``application/json; indent=4``, the browsable API), and everything
+    when orjson is not installed.
+    """
+
+    def __init__(self):
+        self.encoder = self.encoder_class()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if (
+            orjson is None
+            or indent is not None
+            or self.ensure_ascii
+            or not self.compact
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            content = orjson.dumps(
+                data,
+                default=self.encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # NaN and infinities come out as null; only then is the data walked
+        if b"null" in content and has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same as JSONRenderer: keep the output a strict JavaScript subset.
+        if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+            content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return content
+
+
+def get_json_renderer():
+    """
+    Returns an instance of the first JSON renderer in the REST_FRAMEWORK
+    ``DEFAULT_RENDERER_CLASSES`` (``JSONRenderer`` if there is none), for
+    code that renders JSON outside of a view.
+    """
+    for renderer_class in api_settings.DEFAULT_RENDERER_CLASSES:
+        if renderer_class.format == "json":
+            return renderer_class()
+    return JSONRenderer()
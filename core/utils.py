@@ -1,3 +1,4 @@
+from django.db.models import Q
 from django.utils.text import slugify
 
 
@@ -6,19 +7,35 @@ def generate_unique_slug(
 ):
     """
     Generate a unique slug for a given model instance.
+
+    The taken ``base`` / ``base-<n>`` slugs are read with one query and the
+    first free one is used. A writer saving the same slug concurrently can
+    still win the race; ``UniqueSlugRetryMixin`` allocates again in that case.
     """
     base_value = getattr(instance, field_name, None)
     if not base_value:
         raise ValueError(f"Cannot generate slug: '{field_name}' is empty.")
 
     base_slug = slugify_func(base_value)
-    slug = base_slug
-    counter = 1
 
     qs = model.objects.exclude(pk=instance.pk) if instance.pk else model.objects.all()
+    # a prefix match can use the slug index, unlike a regex; the rest of
+    # the slug is checked here
+    prefix = f"{base_slug}-"
+    candidates = qs.filter(
+        Q(**{slug_field: base_slug}) | Q(**{f"{slug_field}__startswith": prefix})
+    ).values_list(slug_field, flat=True)
+    taken = set()
+    for slug in candidates:
+        suffix = slug[len(prefix) :]
+        if slug == base_slug or (suffix.isascii() and suffix.isdigit()):
+            taken.add(slug)
 
-    while qs.filter(**{slug_field: slug}).exists():
+    slug = base_slug
+    counter = 1
+    while slug in taken:
         slug = f"{base_slug}-{counter}"
         counter += 1
 
     setattr(instance, slug_field, slug)
+    instance._generated_slug = slug
@@ -0,0 +1,288 @@
+import argparse
+import json
+import os
+import random
+from datetime import datetime
+from faker import Faker
+from django.utils.text import slugify
+from Category_fixtures import assign_mptt_fields
+
+
+fake = Faker()
+now = datetime.utcnow().isoformat() + "Z"
+
+################################
+# Consistent catalog of any size
+################################
+#
+#   python seeders/Generators/Catalog_fixtures.py --products 100000
+#
+# Writes one fixture per model to --output. Categories, product types,
+# attributes and tags are small and built in memory; products, variants
+# and their attribute values are written as they are generated. Every
+# variant gets one value of each attribute of its product's type, so the
+# rows pass ProductVariantAttributeValue.clean. Load the result with
+# `manage.py copy_loaddata <output>` (or loaddata for small sizes).
+
+VARIANTS_PER_PRODUCT = (1, 5)
+CATEGORY_DEPTH = 4
+
+
+class FixtureWriter:
+    """
+    Streams fixture objects into a JSON array, one object per line.
+    """
+
+    def __init__(self, path, model):
+        self.file = open(path, "w", encoding="utf-8")
+        self.model = model
+        self.count = 0
+        self.file.write("[")
+
+    def write(self, fields):
+        self.count += 1
+        obj = {"model": self.model, "pk": self.count, "fields": fields}
+        self.file.write(("\n" if self.count == 1 else ",\n") + json.dumps(obj))
+        return self.count
+
+    def close(self):
+        self.file.write("\n]\n")
+        self.file.close()
+
+
+class Names:
+    """
+    Unique display names from a fixed word list: cheap enough for millions
+    of rows, where Faker's unique proxy runs out or slows down.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        self.used = set()
+
+    def make(self, count=2, suffix=None):
+        while True:
+            name = " ".join(random.choice(self.words) for _ in range(count)).title()
+            if suffix is not None:
+                # already unique, and not worth remembering for millions of rows
+                return f"{name} {suffix}"
+            if name.lower() not in self.used:
+                self.used.add(name.lower())
+                return name
+
+    def sentence(self, count):
+        return " ".join(random.choices(self.words, k=count)).capitalize() + "."
+
+
+def timestamps():
+    return {"created_at": now, "updated_at": now}
+
+
+def generate_categories(output, count, names):
+    nodes = []
+    for pk in range(1, count + 1):
+        # the first nodes are roots, later ones hang below earlier ones
+        # up to CATEGORY_DEPTH levels, so the trees get deep and wide
+        parent = None
+        if pk > max(3, count // 20):
+            parent = random.choice(
+                [node for node in nodes[-50:] if node["depth"] < CATEGORY_DEPTH]
+                or [nodes[0]]
+            )
+        nodes.append(
+            {
+                "pk": pk,
+                "parent": parent["pk"] if parent else None,
+                "depth": parent["depth"] + 1 if parent else 0,
+                "name": names.make(),
+            }
+        )
+    assign_mptt_fields(nodes)
+
+    writer = FixtureWriter(os.path.join(output, "Category.json"), "Product.category")
+    for node in nodes:
+        writer.write(
+            {
+                "name": node["name"],
+                "slug": slugify(node["name"]),
+                "is_active": True,
+                "parent": node["parent"],
+                **timestamps(),
+                "lft": node["lft"],
+                "rght": node["rght"],
+                "tree_id": node["tree_id"],
+                "mptt_level": node["mptt_level"],
+            }
+        )
+    writer.close()
+
+    parents = {node["parent"] for node in nodes}
+    return [node["pk"] for node in nodes if node["pk"] not in parents]
+
+
+def generate_simple(output, filename, model, count, names):
+    writer = FixtureWriter(os.path.join(output, filename), model)
+    for _ in range(count):
+        name = names.make()
+        writer.write(
+            {"name": name, "slug": slugify(name), "is_active": True, **timestamps()}
+        )
+    writer.close()
+    return list(range(1, count + 1))
+
+
+def generate_attributes(output, count, product_types, names):
+    """
+    Returns ``{product_type_pk: [(attribute_pk, [value_pks])]}``.
+    """
+    attributes = FixtureWriter(
+        os.path.join(output, "Attribute.json"), "Product.attribute"
+    )
+    values = FixtureWriter(
+        os.path.join(output, "AttributeValue.json"), "Product.AttributeValue"
+    )
+
+    type_attributes = {product_type: [] for product_type in product_types}
+    for _ in range(count):
+        name = names.make()
+        used_by = random.sample(
+            product_types, k=random.randint(1, max(1, len(product_types) // 3))
+        )
+        attribute_pk = attributes.write(
+            {
+                "name": name,
+                "slug": slugify(name),
+                "description": names.sentence(8),
+                "is_filterable": random.random() < 0.7,
+                "product_types": used_by,
+                **timestamps(),
+            }
+        )
+
+        value_pks = []
+        value_names = Names(names.words)
+        for _ in range(random.randint(3, 12)):
+            value = value_names.make(count=1)
+            value_pks.append(
+                values.write(
+                    {
+                        "value": value,
+                        "slug": slugify(f"{name}-{value}"),
+                        "attribute": attribute_pk,
+                        "is_active": True,
+                        **timestamps(),
+                    }
+                )
+            )
+        for product_type in used_by:
+            type_attributes[product_type].append((attribute_pk, value_pks))
+
+    attributes.close()
+    values.close()
+    return type_attributes
+
+
+def generate_products(output, count, leaf_categories, tags, type_attributes, names):
+    products = FixtureWriter(os.path.join(output, "Product.json"), "Product.Product")
+    variants = FixtureWriter(
+        os.path.join(output, "ProductVariant.json"), "Product.ProductVariant"
+    )
+    assigned = FixtureWriter(
+        os.path.join(output, "ProductVariantAttributeValue.json"),
+        "Product.ProductVariantAttributeValue",
+    )
+    product_types = list(type_attributes)
+
+    for pk in range(1, count + 1):
+        # the pk suffix keeps names unique without remembering them
+        name = names.make(count=2, suffix=pk)
+        product_type = random.choice(product_types)
+        products.write(
+            {
+                "name": name,
+                "slug": slugify(name),
+                "description": names.sentence(12),
+                "categories": random.sample(
+                    leaf_categories, k=min(len(leaf_categories), random.randint(1, 3))
+                ),
+                "product_type": product_type,
+                "tags": random.sample(tags, k=min(len(tags), random.randint(0, 3))),
+                "image": None,
+                "is_active": random.random() < 0.9,
+                **timestamps(),
+            }
+        )
+
+        for number in range(random.randint(*VARIANTS_PER_PRODUCT)):
+            variant = variants.write(
+                {
+                    "product": pk,
+                    "sku": f"SKU-{pk}-{number}",
+                    "price": f"{random.uniform(1, 500):.2f}",
+                    "stock": random.randint(1, 200),
+                    "image": None,
+                    "is_active": random.random() < 0.95,
+                    **timestamps(),
+                }
+            )
+            for attribute, value_pks in type_attributes[product_type]:
+                assigned.write(
+                    {
+                        "variant": variant,
+                        "attribute": attribute,
+                        "attribute_value": random.choice(value_pks),
+                        **timestamps(),
+                    }
+                )
+
+    for writer in (products, variants, assigned):
+        writer.close()
+    return products.count, variants.count, assigned.count
+
+
+def generate_catalog(products, output, seed=None):
+    random.seed(seed)
+    Faker.seed(seed)
+    os.makedirs(output, exist_ok=True)
+
+    names = Names(sorted(set(fake.words(nb=3000))))
+    category_count = max(20, products // 50)
+    type_count = max(5, products // 2000)
+
+    leaf_categories = generate_categories(output, category_count, Names(names.words))
+    product_types = generate_simple(
+        output,
+        "ProductType.json",
+        "Product.ProductType",
+        type_count,
+        Names(names.words),
+    )
+    tags = generate_simple(
+        output, "Tag.json", "Product.Tag", max(20, products // 100), Names(names.words)
+    )
+    type_attributes = generate_attributes(
+        output, max(10, type_count * 2), product_types, Names(names.words)
+    )
+    counts = generate_products(
+        output, products, leaf_categories, tags, type_attributes, names
+    )
+
+    print(
+        f"Generated {category_count} categories, {counts[0]} products, "
+        f"{counts[1]} variants and {counts[2]} variant attribute values in {output}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a consistent catalog.")
+    parser.add_argument(
+        "--products",
+        type=int,
+        default=10_000,
+        help="Number of products, e.g. 10000, 100000 or 1000000.",
+    )
+    parser.add_argument("--output", default="seeders/Fake_data/catalog")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    generate_catalog(args.products, args.output, seed=args.seed)
@@ -13,31 +13,40 @@ now = datetime.utcnow().isoformat() + "Z"
 
 
 def assign_mptt_fields(nodes):
-    tree_id = 1
+    """
+    Sets lft, rght, tree_id and mptt_level on ``nodes`` (dicts with "pk"
+    and "parent"). Every root starts its own tree, and siblings are
+    numbered in name order when the nodes carry a "name", matching
+    Category's ``order_insertion_by``. Iterative, so deep trees are fine.
+    """
 
     # აქ ვქმნით lookup-ს: parent_pk -> list of children
     children_map = {}
     for node in nodes:
         parent = node['parent']
         children_map.setdefault(parent, []).append(node)
-
-    counter = 1
-
-    def recurse(node, mptt_level):
-        nonlocal counter
-        node['tree_id'] = tree_id
-        node['mptt_level'] = mptt_level
-        node['lft'] = counter
-        counter += 1
-        # შვილები
-        for child in children_map.get(node['pk'], []):
-            recurse(child, mptt_level + 1)
-        node['rght'] = counter
-        counter += 1
+    for children in children_map.values():
+        children.sort(key=lambda node: (node.get('name', ''), node['pk']))
 
     # დავიწყოთ root-ებიდან (parent = None)
-    for root in children_map.get(None, []):
-        recurse(root, 0)
+    for tree_id, root in enumerate(children_map.get(None, []), start=1):
+        counter = 1
+        stack = [(root, 0, False)]
+        while stack:
+            node, mptt_level, closing = stack.pop()
+            if closing:
+                node['rght'] = counter
+                counter += 1
+                continue
+            node['tree_id'] = tree_id
+            node['mptt_level'] = mptt_level
+            node['lft'] = counter
+            counter += 1
+            stack.append((node, mptt_level, True))
+            # შვილები
+            for child in reversed(children_map.get(node['pk'], [])):
+                stack.append((child, mptt_level + 1, False))
+
 
 def generate_categories_with_mptt():
     data = []
@@ -87,7 +96,10 @@ def generate_categories_with_mptt():
 
     # MPTT ველების გამოთვლა
     # ვთარგმნით simplified nodes სიუჟეტად (pk, parent)
-    simple_nodes = [{"pk": n["pk"], "parent": n["parent"]} for n in nodes]
+    simple_nodes = [
+        {"pk": n["pk"], "parent": n["parent"], "name": n["node"]["fields"]["name"]}
+        for n in nodes
+    ]
     assign_mptt_fields(simple_nodes)
 
     # ახლა each node-ს fields-ში დავამატოთ MPTT ველები